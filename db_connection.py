@@ -1,6 +1,7 @@
 # db_connection.py
 import pyodbc
 import os
+from contextlib import contextmanager
 from dotenv import load_dotenv
 from pathlib import Path
 
@@ -15,6 +16,12 @@ SQL_SERVER = os.getenv("SQL_SERVER", "CALVMSQL02")
 SQL_DATABASE = os.getenv("SQL_DATABASE", "Re_Main_Production")
 SQL_DRIVER = os.getenv("SQL_DRIVER", "{ODBC Driver 17 for SQL Server}")
 
+# Closed connections go back to the ODBC driver manager's pool (pyodbc's
+# default, set here so it's explicit), so repeat connects skip the login
+# handshake without a round-trip to check the connection first
+pyodbc.pooling = True
+
+
 def get_sql_conn():
     """Create connection to SQL Server with error handling"""
     conn_str = (
@@ -38,4 +45,26 @@ def get_sql_conn():
             f"  3. Windows authentication is working\n"
             f"  4. ODBC Driver 17 is installed"
         )
-        raise ConnectionError(error_msg) from e
\ No newline at end of file
+        raise ConnectionError(error_msg) from e
+
+
+def release_sql_conn(conn):
+    """Roll back anything left uncommitted and close the connection"""
+    try:
+        conn.rollback()
+    except pyodbc.Error:
+        pass
+    try:
+        conn.close()
+    except pyodbc.Error:
+        pass
+
+
+@contextmanager
+def sql_conn():
+    """Connection for the duration of a with-block, released on exit"""
+    conn = get_sql_conn()
+    try:
+        yield conn
+    finally:
+        release_sql_conn(conn)
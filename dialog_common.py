@@ -0,0 +1,227 @@
+# dialog_common.py
+#
+# Stylesheets and helpers shared by the PA, Sales Ratios and Prodview dialogs.
+# Keeping the QSS as module constants means every dialog hands Qt the same
+# string objects instead of rebuilding identical literals on each open.
+
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+
+from PyQt5.QtCore import QStringListModel
+from PyQt5.QtWidgets import QComboBox, QFrame, QLabel, QVBoxLayout
+
+_MONTH_NAMES = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Oldest lines are dropped from the results log past this many blocks so long
+# runs don't keep growing the document (and slowing every append)
+RESULTS_MAX_BLOCKS = 5000
+
+# Separators used to frame the results log
+LOG_SEP = "=" * 60
+LOG_BOX_RULE = "+" + "-" * 70 + "+"
+LOG_BOX_HEAVY = "+" + "=" * 70 + "+"
+
+# Workers forward progress to the GUI at most ~30 times a second
+PROGRESS_MIN_INTERVAL = 0.033
+
+# Worker log lines are sent to the dialog in chunks of up to this many lines,
+# and no line waits longer than this many seconds for its chunk to go out
+LOG_BATCH_LINES = 32
+LOG_BATCH_SECONDS = 0.1
+
+QSS_TRANSPARENT_SCROLL = "QScrollArea { background-color: transparent; }"
+
+QSS_TRANSPARENT = "background-color: transparent;"
+
+QSS_DIALOG_TITLE = """
+    QLabel {
+        color: #1a4d3e;
+        font-size: 18px;
+        font-weight: bold;
+        padding: 5px;
+    }
+"""
+
+QSS_GROUP = """
+    QFrame {
+        background-color: #f8f9fa;
+        border: 1px solid #d1d5db;
+        border-radius: 5px;
+        padding: 10px;
+        margin-top: 5px;
+    }
+"""
+
+QSS_GROUP_TITLE = """
+    QLabel {
+        color: #1a4d3e;
+        font-weight: bold;
+        font-size: 14px;
+        padding: 0px;
+    }
+"""
+
+QSS_RESULTS_TEXT = """
+    QPlainTextEdit {
+        background-color: #e6f0fa;
+        border: 1px solid #d1d5db;
+        border-radius: 5px;
+        font-family: Consolas, monospace;
+        font-size: 10pt;
+        padding: 8px;
+    }
+"""
+
+QSS_RUN_BUTTON = """
+    QPushButton {
+        background-color: #1a4d3e;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 12px 24px;
+        font-size: 14px;
+        font-weight: bold;
+        min-width: 150px;
+    }
+    QPushButton:hover {
+        background-color: #2a6b57;
+    }
+    QPushButton:pressed {
+        background-color: #0d3d2e;
+    }
+    QPushButton:disabled {
+        background-color: #a0a0a0;
+    }
+"""
+
+QSS_CLOSE_BUTTON = """
+    QPushButton {
+        background-color: #6c757d;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 12px 24px;
+        font-size: 14px;
+        font-weight: bold;
+        min-width: 150px;
+    }
+    QPushButton:hover {
+        background-color: #8a929c;
+    }
+    QPushButton:pressed {
+        background-color: #545b62;
+    }
+"""
+
+
+def throttle_progress(emit, min_interval=PROGRESS_MIN_INTERVAL):
+    """Wrap a progress emitter so it only fires on a changed value, at most
+    once per `min_interval` seconds (100 always goes through)"""
+    last_value = -1
+    last_time = 0.0
+
+    def progress(value):
+        nonlocal last_value, last_time
+        now = time.monotonic()
+        if value != last_value and (value >= 100 or now - last_time >= min_interval):
+            emit(value)
+            last_value = value
+            last_time = now
+
+    return progress
+
+
+
+class LogBatcher:
+    """Log callback for worker threads that hands lines to `emit` joined into
+    chunks. A chunk goes out once it holds `max_lines` lines, or from a timer
+    `max_delay` seconds after its first line, so a quiet stretch of the run
+    never leaves lines sitting unseen; call flush() when the run ends."""
+
+    def __init__(self, emit, max_lines=LOG_BATCH_LINES, max_delay=LOG_BATCH_SECONDS):
+        self._emit = emit
+        self._max_lines = max_lines
+        self._max_delay = max_delay
+        self._lines = []
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def __call__(self, message):
+        with self._lock:
+            self._lines.append(message)
+            if len(self._lines) < self._max_lines:
+                if self._timer is None:
+                    self._timer = threading.Timer(self._max_delay, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.flush()
+
+    def flush(self):
+        # Emit under the lock so a timer flush and a worker flush can't
+        # deliver their chunks out of order
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._lines:
+                self._emit("\n".join(self._lines))
+                self._lines = []
+
+
+@lru_cache(maxsize=8)
+def _month_list(year, month, count):
+    """Last `count` calendar months up to (year, month), oldest first"""
+    count = max(count, 1)
+    # Walk backwards from the current month, filling from the end
+    months = [None] * count
+    for i in range(count - 1, -1, -1):
+        months[i] = f"{_MONTH_NAMES[month - 1]} {year}"
+        month -= 1
+        if month == 0:
+            month = 12
+            year -= 1
+
+    return tuple(months)
+
+
+class DialogCommon:
+    """Mixin with the group-frame and month-picker helpers used by the dialogs"""
+
+    def create_group(self, title):
+        """Create a styled group frame with title"""
+        group = QFrame()
+        group.setFrameShape(QFrame.StyledPanel)
+        group.setStyleSheet(QSS_GROUP)
+
+        # Create layout for the group
+        group_layout = QVBoxLayout(group)
+        group_layout.setSpacing(8)
+
+        # Add title
+        title_label = QLabel(title)
+        title_label.setStyleSheet(QSS_GROUP_TITLE)
+        group_layout.addWidget(title_label)
+
+        return group
+
+    def populate_months(self, combo_box, count, model=None):
+        """Populate combo box with the last `count` calendar months, oldest first
+
+        Returns the list model so combos showing the same months can share it.
+        """
+        if model is None:
+            # Cached per calendar month, so reopening a dialog reuses the list
+            current = datetime.now()
+            months = _month_list(current.year, current.month, count)
+            # One model reset instead of a rowsInserted per addItem
+            model = QStringListModel(list(months), combo_box)
+
+        combo_box.setModel(model)
+        # Make sure full text (e.g. "Dec 2025") is visible
+        combo_box.setSizeAdjustPolicy(QComboBox.AdjustToContents)
+        combo_box.setMinimumContentsLength(10)
+        return model
@@ -1,41 +1,172 @@
 # monthly_loader_dialog.py
 
 import os
-from datetime import datetime, timedelta
+import sys
+import time
+from datetime import datetime
 
 from PyQt5.QtWidgets import (
-    QApplication,
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
+    QFormLayout,
     QLabel,
     QFrame,
     QProgressBar,
-    QTextEdit,
+    QPlainTextEdit,
     QPushButton,
     QScrollArea,
     QWidget,
     QComboBox,
     QMessageBox,
+    QSizePolicy,
+)
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThread, QThreadPool, QTimer, pyqtSignal
+
+from dialog_common import (
+    DialogCommon,
+    LogBatcher,
+    LOG_BOX_HEAVY,
+    LOG_BOX_RULE,
+    LOG_SEP,
+    QSS_CLOSE_BUTTON,
+    QSS_DIALOG_TITLE,
+    QSS_RESULTS_TEXT,
+    QSS_RUN_BUTTON,
+    QSS_TRANSPARENT,
+    QSS_TRANSPARENT_SCROLL,
+    RESULTS_MAX_BLOCKS,
+    throttle_progress,
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QTextCursor
-
 
-class MonthlyLoaderDialog(QDialog):
+# Loader and DB helpers pull in pandas/pyodbc; import them once when the
+# dialog module loads rather than on every Run/validation click.
+try:
+    from monthly_loader_gui import run_monthly_loader
+except ImportError:
+    run_monthly_loader = None
+
+try:
+    from db_connection import get_sql_conn
+except ImportError:
+    get_sql_conn = None
+
+
+_QSS_PATH_LABEL = """
+    QLabel {
+        background-color: #f0f0f0;
+        border: 1px solid #d1d5db;
+        border-radius: 3px;
+        padding: 8px;
+        font-family: Consolas, monospace;
+    }
+"""
+
+_QSS_PROGRESS_BAR = """
+    QProgressBar {
+        border: 1px solid #d1d5db;
+        border-radius: 4px;
+        text-align: center;
+        height: 20px;
+        margin-top: 5px;
+    }
+    QProgressBar::chunk {
+        background-color: #0066b3;
+        border-radius: 4px;
+    }
+"""
+
+# The PA dialog is wider, so its buttons are too
+_QSS_RUN_BUTTON = QSS_RUN_BUTTON.replace("min-width: 150px", "min-width: 180px")
+_QSS_CLOSE_BUTTON = QSS_CLOSE_BUTTON.replace("min-width: 150px", "min-width: 180px")
+
+# Template existence keyed by (path, parent-dir mtime); negative results are
+# cached too so a missing file on a network share is not re-stat'ed each time.
+_exists_cache = {}
+
+# Skip re-connecting to SQL Server if the last successful check is this recent
+_DB_CHECK_TTL = 30.0
+_db_checked_at = None
+
+
+def _path_exists(path):
+    """Existence-only check; access(F_OK) skips building a stat_result.
+
+    Under SELinux/ACL-heavy Linux setups access() can be slower than stat(),
+    so keep os.path.exists there.
+    """
+    if sys.platform == "linux":
+        return os.path.exists(path)
+    return os.access(path, os.F_OK)
+
+
+def _check_db():
+    """Return (ok, error) for a SQL Server connection, reusing a recent success"""
+    global _db_checked_at
+    try:
+        if _db_checked_at is None or time.monotonic() - _db_checked_at > _DB_CHECK_TTL:
+            if get_sql_conn is None:
+                raise ConnectionError("db_connection not available")
+            conn = get_sql_conn()
+            conn.close()
+            _db_checked_at = time.monotonic()
+        return True, ""
+    except Exception as e:
+        _db_checked_at = None
+        return False, str(e)
+
+
+def _cached_exists(path):
+    """os.path.exists() cached until the parent directory changes"""
+    if not path:
+        return False
+    try:
+        key = (path, os.stat(os.path.dirname(path) or ".").st_mtime_ns)
+    except OSError:
+        return False
+    exists = _exists_cache.get(key)
+    if exists is None:
+        exists = _path_exists(path)
+        _exists_cache[key] = exists
+    return exists
+
+
+class MonthlyLoaderDialog(QDialog, DialogCommon):
     def __init__(self, settings_section, parent=None):
         super().__init__(parent)
         self.settings_section = settings_section
-        self.worker = None
+        self._status_last = {}
+        self._validate_seq = 0
+        self._validate_worker = None
+
+        # Log lines are buffered and flushed to the results area at most
+        # every 50 ms instead of repainting once per line
+        self._log_buffer = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+
         self.setWindowTitle("📊 Production Accounting Allocations (PA)")
         self.setModal(True)
         self.setMinimumWidth(750)
         self.setMinimumHeight(700)
         self.initUI()
+
+        # One worker per dialog, reused for every run; signals are wired once
+        self.worker = MonthlyLoaderWorker("", "", "")
+        self.worker.log_signal.connect(self.log_result, Qt.QueuedConnection)
+        self.worker.progress_signal.connect(self.progress_bar.setValue, Qt.QueuedConnection)
+        self.worker.finished_signal.connect(self.loader_finished, Qt.QueuedConnection)
+        self.worker.error_signal.connect(self.loader_error, Qt.QueuedConnection)
+
         self.validate_inputs()
 
     def initUI(self):
         """Initialize the monthly loader dialog UI"""
+        # Suppress intermediate repaints while the widget tree is built
+        self.setUpdatesEnabled(False)
+
         # Main layout
         main_layout = QVBoxLayout(self)
 
@@ -43,82 +174,51 @@ class MonthlyLoaderDialog(QDialog):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setStyleSheet("QScrollArea { background-color: transparent; }")
+        scroll.setStyleSheet(QSS_TRANSPARENT_SCROLL)
 
         # Create scroll content widget
         scroll_content = QWidget()
-        scroll_content.setStyleSheet("background-color: transparent;")
+        scroll_content.setAttribute(Qt.WA_DontCreateNativeAncestors)
+        scroll_content.setStyleSheet(QSS_TRANSPARENT)
         layout = QVBoxLayout(scroll_content)
         layout.setSpacing(15)
         layout.setContentsMargins(10, 10, 10, 10)
 
         # Title
         title = QLabel("📊 Production Accounting Allocations (PA)")
-        title.setStyleSheet("""
-            QLabel {
-                color: #1a4d3e;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 5px;
-            }
-        """)
+        title.setStyleSheet(QSS_DIALOG_TITLE)
         layout.addWidget(title)
 
         # Month Selection Group
-        month_group = self.create_group("📅 Select Month")
-        month_layout = QHBoxLayout()
-        month_layout.addWidget(QLabel("Month:"))
+        month_group, month_form = self.create_form_group("📅 Select Month")
 
         self.month_combo = QComboBox()
-        self.populate_months()
+        self.populate_months(self.month_combo, 24)
         self.month_combo.currentIndexChanged.connect(self.validate_inputs)
-        month_layout.addWidget(self.month_combo)
-        month_layout.addStretch()
-        month_group.layout().addLayout(month_layout)
+        self.month_combo.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        month_form.addRow("Month:", self.month_combo)
         layout.addWidget(month_group)
 
         # ValNav File Group
-        valnav_group = self.create_group("📁 ValNav File")
-        valnav_layout = QHBoxLayout()
-        valnav_layout.addWidget(QLabel("Path:"))
+        valnav_group, valnav_form = self.create_form_group("📁 ValNav File")
 
         self.valnav_label = QLabel()
         valnav_path = self.settings_section.get('valnav_template', 'Not configured in Settings')
         self.valnav_label.setText(valnav_path)
-        self.valnav_label.setStyleSheet("""
-            QLabel {
-                background-color: #f0f0f0;
-                border: 1px solid #d1d5db;
-                border-radius: 3px;
-                padding: 8px;
-                font-family: Consolas, monospace;
-            }
-        """)
+        self.valnav_label.setStyleSheet(_QSS_PATH_LABEL)
         self.valnav_label.setWordWrap(True)
-        valnav_layout.addWidget(self.valnav_label, 1)
-        valnav_group.layout().addLayout(valnav_layout)
+        valnav_form.addRow("Path:", self.valnav_label)
         layout.addWidget(valnav_group)
 
         # Accumap File Group
-        accumap_group = self.create_group("📁 Public Data Accumap File")
-        accumap_layout = QHBoxLayout()
-        accumap_layout.addWidget(QLabel("Path:"))
+        accumap_group, accumap_form = self.create_form_group("📁 Public Data Accumap File")
 
         self.accumap_label = QLabel()
         accumap_path = self.settings_section.get('accumap_template', 'Not configured in Settings')
         self.accumap_label.setText(accumap_path)
-        self.accumap_label.setStyleSheet("""
-            QLabel {
-                background-color: #f0f0f0;
-                border: 1px solid #d1d5db;
-                border-radius: 3px;
-                padding: 8px;
-                font-family: Consolas, monospace;
-            }
-        """)
+        self.accumap_label.setStyleSheet(_QSS_PATH_LABEL)
         self.accumap_label.setWordWrap(True)
-        accumap_layout.addWidget(self.accumap_label, 1)
-        accumap_group.layout().addLayout(accumap_layout)
+        accumap_form.addRow("Path:", self.accumap_label)
         layout.addWidget(accumap_group)
 
         # Status Group
@@ -138,36 +238,17 @@ class MonthlyLoaderDialog(QDialog):
         # Progress Bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #d1d5db;
-                border-radius: 4px;
-                text-align: center;
-                height: 20px;
-                margin-top: 5px;
-            }
-            QProgressBar::chunk {
-                background-color: #0066b3;
-                border-radius: 4px;
-            }
-        """)
+        self.progress_bar.setStyleSheet(_QSS_PROGRESS_BAR)
         layout.addWidget(self.progress_bar)
 
         # Results Area
         results_group = self.create_group("📋 Results")
-        self.results_text = QTextEdit()
+        self.results_text = QPlainTextEdit()
         self.results_text.setReadOnly(True)
+        self.results_text.setUndoRedoEnabled(False)
+        self.results_text.setMaximumBlockCount(RESULTS_MAX_BLOCKS)
         self.results_text.setMinimumHeight(200)
-        self.results_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #e6f0fa;
-                border: 1px solid #d1d5db;
-                border-radius: 5px;
-                font-family: Consolas, monospace;
-                font-size: 10pt;
-                padding: 8px;
-            }
-        """)
+        self.results_text.setStyleSheet(QSS_RESULTS_TEXT)
         results_group.layout().addWidget(self.results_text)
         layout.addWidget(results_group)
 
@@ -176,49 +257,12 @@ class MonthlyLoaderDialog(QDialog):
         button_layout.setSpacing(10)
 
         self.run_btn = QPushButton("▶️ Run Monthly Loader")
-        self.run_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1a4d3e;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 180px;
-            }
-            QPushButton:hover {
-                background-color: #2a6b57;
-            }
-            QPushButton:pressed {
-                background-color: #0d3d2e;
-            }
-            QPushButton:disabled {
-                background-color: #a0a0a0;
-            }
-        """)
+        self.run_btn.setStyleSheet(_QSS_RUN_BUTTON)
         self.run_btn.clicked.connect(self.run_loader)
         button_layout.addWidget(self.run_btn)
 
         self.close_btn = QPushButton("Close")
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 180px;
-            }
-            QPushButton:hover {
-                background-color: #8a929c;
-            }
-            QPushButton:pressed {
-                background-color: #545b62;
-            }
-        """)
+        self.close_btn.setStyleSheet(_QSS_CLOSE_BUTTON)
         self.close_btn.clicked.connect(self.handle_close)
         button_layout.addWidget(self.close_btn)
 
@@ -232,12 +276,14 @@ class MonthlyLoaderDialog(QDialog):
         scroll.setWidget(scroll_content)
         main_layout.addWidget(scroll)
 
+        self.setUpdatesEnabled(True)
+
     def handle_close(self):
         """
         Handle dialog close.
         If a loader is running, optionally cancel it before closing.
         """
-        if self.worker is not None and self.worker.isRunning():
+        if self.worker.isRunning():
             reply = QMessageBox.question(
                 self,
                 "Cancel Loader?",
@@ -269,7 +315,7 @@ class MonthlyLoaderDialog(QDialog):
     
     def closeEvent(self, event):
         """Handle window close event"""
-        if self.worker is not None and self.worker.isRunning():
+        if self.worker.isRunning():
             reply = QMessageBox.question(
                 self,
                 "Cancel Loader?",
@@ -294,103 +340,74 @@ class MonthlyLoaderDialog(QDialog):
         
         event.accept()
 
-    def create_group(self, title):
-        """Create a styled group frame with title"""
-        group = QFrame()
-        group.setFrameShape(QFrame.StyledPanel)
-        group.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border: 1px solid #d1d5db;
-                border-radius: 5px;
-                padding: 10px;
-                margin-top: 5px;
-            }
-        """)
-
-        # Create layout for the group
-        group_layout = QVBoxLayout(group)
-        group_layout.setSpacing(8)
-
-        # Add title
-        title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #1a4d3e;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 0px;
-            }
-        """)
-        group_layout.addWidget(title_label)
-
-        return group
-
-    def populate_months(self):
-        """Populate month combo box with last 24 months in short format"""
-        current = datetime.now()
-        month_names = {
-            1: "Jan", 2: "Feb", 3: "Mar", 4: "Apr", 5: "May", 6: "Jun",
-            7: "Jul", 8: "Aug", 9: "Sep", 10: "Oct", 11: "Nov", 12: "Dec"
-        }
-
-        # Generate the last 24 distinct calendar months, oldest first
-        months = []
-        year = current.year
-        month = current.month
-        for _ in range(24):
-            months.append(f"{month_names[month]} {year}")
-            month -= 1
-            if month == 0:
-                month = 12
-                year -= 1
-
-        months.reverse()
-
-        self.month_combo.clear()
-        self.month_combo.addItems(months)
-        # Make sure full text (e.g. "Dec 2025") is visible
-        self.month_combo.setSizeAdjustPolicy(QComboBox.AdjustToContents)
-        self.month_combo.setMinimumContentsLength(10)
+    def create_form_group(self, title):
+        """Create a styled group frame with a label/field form below the title"""
+        group = self.create_group(title)
+        form = QFormLayout()
+        form.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+        form.setLabelAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        group.layout().addLayout(form)
+        return group, form
 
     def validate_inputs(self):
-        """Validate file paths and database connection"""
-        # Check ValNav file
-        valnav_path = self.settings_section.get('valnav_template', '')
-        if os.path.exists(valnav_path):
-            self.valnav_status.setText("✅ ValNav file found")
-            self.valnav_status.setStyleSheet("color: #1a4d3e;")
+        """Validate file paths and database connection on a pool thread"""
+        # Instant feedback; the blocking stat/connect calls run off the GUI thread
+        self._set_status(self.valnav_status, "⏳ Checking ValNav file...", "")
+        self._set_status(self.accumap_status, "⏳ Checking Accumap file...", "")
+        self._set_status(self.db_status, "⏳ Checking database connection...", "")
+
+        # Results from an older check (e.g. before a quick month change) are ignored
+        self._validate_seq += 1
+        worker = _ValidateWorker(
+            self._validate_seq,
+            self.settings_section.get('valnav_template', ''),
+            self.settings_section.get('accumap_template', ''),
+        )
+        worker.signals.finished.connect(self.apply_validation)
+        self._validate_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _set_status(self, label, text, style):
+        """Update a status label, skipping the restyle when nothing changed"""
+        current = (text, style)
+        if self._status_last.get(id(label)) != current:
+            label.setText(text)
+            label.setStyleSheet(style)
+            self._status_last[id(label)] = current
+
+    def apply_validation(self, seq, valnav_ok, accumap_ok, db_ok, db_error):
+        """Show the results of a background validation"""
+        if seq != self._validate_seq:
+            return
+
+        if valnav_ok:
+            self._set_status(self.valnav_status, "✅ ValNav file found", "color: #1a4d3e;")
         else:
-            self.valnav_status.setText("❌ ValNav file not found")
-            self.valnav_status.setStyleSheet("color: #dc3545;")
+            self._set_status(self.valnav_status, "❌ ValNav file not found", "color: #dc3545;")
 
-        # Check Accumap file
-        accumap_path = self.settings_section.get('accumap_template', '')
-        if os.path.exists(accumap_path):
-            self.accumap_status.setText("✅ Accumap file found")
-            self.accumap_status.setStyleSheet("color: #1a4d3e;")
+        if accumap_ok:
+            self._set_status(self.accumap_status, "✅ Accumap file found", "color: #1a4d3e;")
         else:
-            self.accumap_status.setText("❌ Accumap file not found")
-            self.accumap_status.setStyleSheet("color: #dc3545;")
+            self._set_status(self.accumap_status, "❌ Accumap file not found", "color: #dc3545;")
 
-        # Check database connection using imported function
-        try:
-            from db_connection import get_sql_conn
-            conn = get_sql_conn()
-            conn.close()
-            self.db_status.setText("✅ Database connected")
-            self.db_status.setStyleSheet("color: #1a4d3e;")
-        except Exception as e:
-            self.db_status.setText(f"❌ Database connection failed: {str(e)[:50]}")
-            self.db_status.setStyleSheet("color: #dc3545;")
+        if db_ok:
+            self._set_status(self.db_status, "✅ Database connected", "color: #1a4d3e;")
+        else:
+            self._set_status(self.db_status, f"❌ Database connection failed: {db_error[:50]}", "color: #dc3545;")
 
     def log_result(self, message):
-        """Add message to results area"""
-        self.results_text.append(message)
-        cursor = self.results_text.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.results_text.setTextCursor(cursor)
-        QApplication.processEvents()
+        """Queue message for the results area"""
+        self._log_buffer.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append all queued messages to the results area in one go"""
+        if not self._log_buffer:
+            return
+        # QPlainTextEdit keeps the view pinned to the bottom on append
+        self.results_text.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
     
     def format_timestamp(self):
         """Get formatted timestamp for log entries"""
@@ -411,6 +428,9 @@ class MonthlyLoaderDialog(QDialog):
 
     def run_loader(self):
         """Run the monthly loader in a separate thread"""
+        if self.worker.isRunning():
+            return
+
         # Confirm before running
         month = self.month_combo.currentText()
         reply = QMessageBox.question(
@@ -436,33 +456,22 @@ class MonthlyLoaderDialog(QDialog):
         # Professional header with timestamp
         timestamp = self.format_timestamp()
         month = self.month_combo.currentText()
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         self.log_result("|" + " " * 20 + "PA MONTHLY LOADER" + " " * 33 + "|")
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         self.log_result(f"|  Started:     {timestamp:<54} |")
         self.log_result(f"|  Month:       {month:<54} |")
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         self.log_result("")
 
         valnav_path = self.settings_section.get('valnav_template', '')
         accumap_path = self.settings_section.get('accumap_template', '')
 
-        self.worker = MonthlyLoaderWorker(
-            self.month_combo.currentText(),
-            valnav_path,
-            accumap_path
-        )
-        self.worker.log_signal.connect(self.log_result)
-        self.worker.progress_signal.connect(self.update_progress)
-        self.worker.finished_signal.connect(self.loader_finished)
-        self.worker.error_signal.connect(self.loader_error)
+        self.worker.month = self.month_combo.currentText()
+        self.worker.valnav_path = valnav_path
+        self.worker.accumap_path = accumap_path
         self.worker.start()
 
-    def update_progress(self, value):
-        """Update progress bar"""
-        self.progress_bar.setRange(0, 100)
-        self.progress_bar.setValue(value)
-
     def loader_finished(self, summary):
         """Handle loader completion"""
         self.progress_bar.setRange(0, 100)
@@ -473,9 +482,9 @@ class MonthlyLoaderDialog(QDialog):
 
         timestamp = self.format_timestamp()
         self.log_result("")
-        self.log_result("+" + "=" * 70 + "+")
+        self.log_result(LOG_BOX_HEAVY)
         self.log_result("|" + " " * 22 + "OPERATION COMPLETE" + " " * 30 + "|")
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         self.log_result(f"|  Completed:   {timestamp:<54} |")
         
         if summary:
@@ -490,9 +499,9 @@ class MonthlyLoaderDialog(QDialog):
                         pass
             
             # Format summary nicely
-            self.log_result("+" + "-" * 70 + "+")
+            self.log_result(LOG_BOX_RULE)
             self.log_result("|  SUMMARY" + " " * 60 + "|")
-            self.log_result("+" + "-" * 70 + "+")
+            self.log_result(LOG_BOX_RULE)
             
             for line in summary:
                 if "=" in line and len(line.strip()) > 10:
@@ -519,10 +528,10 @@ class MonthlyLoaderDialog(QDialog):
             
             if duration:
                 formatted_duration = self.format_duration(duration)
-                self.log_result("+" + "-" * 70 + "+")
+                self.log_result(LOG_BOX_RULE)
                 self.log_result(f"|  Duration:     {formatted_duration:<54} |")
         
-        self.log_result("+" + "=" * 70 + "+")
+        self.log_result(LOG_BOX_HEAVY)
 
     def loader_error(self, error_msg):
         """Handle loader error"""
@@ -533,11 +542,11 @@ class MonthlyLoaderDialog(QDialog):
         self.close_btn.setEnabled(True)
         timestamp = self.format_timestamp()
         self.log_result("")
-        self.log_result("+" + "=" * 70 + "+")
+        self.log_result(LOG_BOX_HEAVY)
         self.log_result("|" + " " * 24 + "OPERATION FAILED" + " " * 30 + "|")
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         self.log_result(f"|  Time:         {timestamp:<54} |")
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         # Wrap error message properly
         error_lines = []
         remaining = error_msg
@@ -551,7 +560,7 @@ class MonthlyLoaderDialog(QDialog):
                 self.log_result(f"|  Error:        {chunk:<54} |")
             else:
                 self.log_result(f"|                {chunk:<54} |")
-        self.log_result("+" + "=" * 70 + "+")
+        self.log_result(LOG_BOX_HEAVY)
 
 
 class MonthlyLoaderWorker(QThread):
@@ -577,16 +586,23 @@ class MonthlyLoaderWorker(QThread):
             pass
 
     def run(self):
-        """Run the loader"""
+        """Run the loader
+
+        The loader's callees must release the GIL while they block, or the GUI
+        thread stalls with them. pyodbc already does so around
+        connect/execute/fetch; any new blocking C call added to the loader
+        must do the same.
+        """
+        self._cancelled = False
+        log_callback = LogBatcher(self.log_signal.emit)
+
         try:
-            from monthly_loader_gui import run_monthly_loader
+            if run_monthly_loader is None:
+                self.error_signal.emit("monthly_loader_gui not available")
+                return
 
             # Define callback functions
-            def progress_callback(value):
-                self.progress_signal.emit(value)
-
-            def log_callback(message):
-                self.log_signal.emit(message)
+            progress_callback = throttle_progress(self.progress_signal.emit)
 
             # Run the actual loader
             summary = run_monthly_loader(
@@ -596,6 +612,7 @@ class MonthlyLoaderWorker(QThread):
                 progress_callback,
                 log_callback
             )
+            log_callback.flush()
 
             # Check for errors
             if 'error' in summary:
@@ -604,9 +621,9 @@ class MonthlyLoaderWorker(QThread):
 
             # Format summary for display
             summary_lines = [
-                "\n" + "="*60,
+                "\n" + LOG_SEP,
                 "LOAD SUMMARY",
-                "="*60,
+                LOG_SEP,
                 f"Month processed: {self.month}",
                 f"ValNav records: {summary.get('valnav_records', 0)}",
                 f"Accumap records: {summary.get('accumap_records', 0)}",
@@ -623,4 +640,27 @@ class MonthlyLoaderWorker(QThread):
             self.finished_signal.emit(summary_lines)
 
         except Exception as e:
-            self.error_signal.emit(str(e))
\ No newline at end of file
+            log_callback.flush()
+            self.error_signal.emit(str(e))
+
+
+class _ValidateSignals(QObject):
+    """Signals for _ValidateWorker (QRunnable itself can't carry signals)"""
+    finished = pyqtSignal(int, bool, bool, bool, str)
+
+
+class _ValidateWorker(QRunnable):
+    """Checks the template files and database connection on a pool thread"""
+
+    def __init__(self, seq, valnav_path, accumap_path):
+        super().__init__()
+        self.seq = seq
+        self.valnav_path = valnav_path
+        self.accumap_path = accumap_path
+        self.signals = _ValidateSignals()
+
+    def run(self):
+        valnav_ok = _cached_exists(self.valnav_path)
+        accumap_ok = _cached_exists(self.accumap_path)
+        db_ok, db_error = _check_db()
+        self.signals.finished.emit(self.seq, valnav_ok, accumap_ok, db_ok, db_error)
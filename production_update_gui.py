@@ -1,6 +1,5 @@
 import sys
 import os
-import configparser
 import time
 from datetime import datetime, timedelta
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QStyledItemDelegate, QWidget, QVBoxLayout, 
@@ -11,9 +10,6 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QStyledItemDelegate, QWi
                              QHeaderView, QCheckBox, QRadioButton)
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QFont, QTextCursor, QIcon, QColor
-from db_connection import get_sql_conn
-from monthly_loader_dialog import MonthlyLoaderDialog
-from sales_ratios_dialog import SalesRatiosDialog
 from prodview_update_dialog import ProdviewUpdateDialog
 from well_master_gui import WellMasterDialog
 from survey_import_dialog import SurveyImportDialog
@@ -24,14 +20,252 @@ def get_settings_path():
     script_dir = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(script_dir, 'settings.ini')
 
+_settings_cache = {}
+
+def _parse_ini(text):
+    """Parse settings.ini text into {section: {key: value}}"""
+    out = {}
+    cur = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line[0] == "[" and line[-1] == "]":
+            cur = out.setdefault(line[1:-1].strip(), {})
+            continue
+        if "=" in line and cur is not None:
+            key, _, value = line.partition("=")
+            cur[key.strip().lower()] = value.strip()
+    return out
+
+def _format_ini(sections):
+    """Format {section: {key: value}} as settings.ini text"""
+    return "\n\n".join(
+        f"[{section}]\n" + "\n".join(f"{key} = {value}" for key, value in values.items())
+        for section, values in sections.items()
+    ) + "\n"
+
+def read_settings():
+    """Read settings.ini, re-parsing only when the file has changed on disk"""
+    settings_file = get_settings_path()
+    try:
+        mtime = os.stat(settings_file).st_mtime_ns
+    except OSError:
+        return {'SQL': {}, 'PATHS': {}}
+    cached = _settings_cache.get(settings_file)
+    if cached is None or cached[0] != mtime:
+        with open(settings_file, 'r') as f:
+            cached = (mtime, _parse_ini(f.read()))
+        _settings_cache[settings_file] = cached
+    settings = {'SQL': {}, 'PATHS': {}}
+    for section, values in cached[1].items():
+        settings[section] = dict(values)
+    return settings
+
+def write_settings(sections):
+    """Write settings.ini and drop the cached copy"""
+    settings_file = get_settings_path()
+    with open(settings_file, 'w') as f:
+        f.write(_format_ini(sections))
+    _settings_cache.pop(settings_file, None)
+
+# Set on the QApplication, so every rule is scoped by object name and other
+# modules' dialogs keep their own look. The plain-label rule uses bare #id
+# ancestors so it ties on specificity with the QLabel#name rules after it,
+# which then win.
+_APP_QSS = """
+    QMainWindow#mainWindow {
+        background-color: #f5f7fa;
+    }
+    #mainContent QLabel, #settingsDialog QLabel, #exportsDialog QLabel {
+        color: #1e293b;
+    }
+    QScrollArea#mainScroll {
+        background-color: #f5f7fa;
+    }
+    QWidget#mainContent {
+        background-color: #f5f7fa;
+    }
+    QLabel#brandHeader {
+        color: #1a4d3e;
+        font-size: 28px;
+        font-weight: bold;
+        padding: 15px;
+        background-color: #ffffff;
+        border: 2px solid #1a4d3e;
+        border-radius: 8px;
+        margin-bottom: 5px;
+    }
+    QPushButton#settingsBtn {
+        background-color: #6c757d;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        font-size: 12px;
+        font-weight: bold;
+        padding: 8px 16px;
+        min-width: 100px;
+        min-height: 35px;
+    }
+    QPushButton#settingsBtn:hover {
+        background-color: #8a929c;
+    }
+    QPushButton#settingsBtn:pressed {
+        background-color: #545b62;
+    }
+    QLabel#subHeader {
+        color: #0066b3;
+        font-size: 18px;
+        font-weight: normal;
+        padding: 5px;
+        margin-bottom: 10px;
+    }
+    QPushButton#mainBtn {
+        background-color: #0066b3;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 8px 15px;
+        text-align: center;
+    }
+    QPushButton#mainBtn:hover {
+        background-color: #2c7fc9;
+    }
+    QPushButton#mainBtn:pressed {
+        background-color: #004d8c;
+    }
+    QPushButton#mainBtn:checked {
+        background-color: #1a4d3e;
+        border: 2px solid #ffaa00;
+    }
+    QFrame#separator {
+        background-color: #d1d5db;
+        max-height: 1px;
+    }
+    QLabel#logLabel {
+        color: #1a4d3e;
+        font-weight: bold;
+        font-size: 14px;
+        margin-top: 10px;
+    }
+    QTextEdit#logText {
+        background-color: #e6f0fa;
+        border: 1px solid #d1d5db;
+        border-radius: 5px;
+        font-family: Consolas, monospace;
+        font-size: 10pt;
+        padding: 5px;
+    }
+    QLabel#statusLabel {
+        color: #64748b;
+        font-style: italic;
+    }
+    QLabel#dialogTitle {
+        color: #1a4d3e;
+        font-size: 18px;
+        font-weight: bold;
+        padding: 5px;
+    }
+    QFrame#settingsGroup, QFrame#settingsGroup QFrame {
+        background-color: #f0f0f0;
+        border: 1px solid #d1d5db;
+        border-radius: 5px;
+        padding: 10px;
+    }
+    QLabel#settingsSection {
+        color: #0066b3;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QPushButton#browseBtn {
+        background-color: #0066b3;
+        color: white;
+        border: none;
+        border-radius: 3px;
+        padding: 5px 10px;
+    }
+    QPushButton#browseBtn:hover {
+        background-color: #2c7fc9;
+    }
+    QPushButton#primaryBtn {
+        background-color: #1a4d3e;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 10px 20px;
+        font-weight: bold;
+        min-width: 120px;
+    }
+    QPushButton#primaryBtn:hover {
+        background-color: #2a6b57;
+    }
+    QPushButton#secondaryBtn {
+        background-color: #6c757d;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 10px 20px;
+        font-weight: bold;
+        min-width: 120px;
+    }
+    QPushButton#secondaryBtn:hover {
+        background-color: #5a6268;
+    }
+    QLabel#exportsTitle {
+        color: #1a4d3e;
+        font-size: 24px;
+        font-weight: bold;
+        padding: 10px;
+    }
+    QLabel#comingSoon {
+        color: #0066b3;
+        font-size: 32px;
+        font-weight: bold;
+        padding: 20px;
+        background-color: #e6f0fa;
+        border: 2px solid #0066b3;
+        border-radius: 10px;
+    }
+    QLabel#exportsDescription {
+        color: #64748b;
+        font-size: 14px;
+        padding: 10px;
+    }
+    QPushButton#closeBtn {
+        background-color: #6c757d;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 10px 30px;
+        font-size: 14px;
+        font-weight: bold;
+        min-width: 100px;
+    }
+    QPushButton#closeBtn:hover {
+        background-color: #8a929c;
+    }
+    QPushButton#closeBtn:pressed {
+        background-color: #545b62;
+    }
+"""
+
 class ProductionUpdateGUI(QMainWindow):
+    # Thread-safe log entry point; worker threads emit, the GUI thread appends
+    log_signal = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
         self.initUI()
         
     def initUI(self):
         """Initialize the user interface"""
+        # Suppress intermediate repaints while the widget tree is built
+        self.setUpdatesEnabled(False)
+        self.log_signal.connect(self._append_log, Qt.QueuedConnection)
         self.setWindowTitle("Pacific Canbriam Energy - Production Update System")
+        self.setObjectName("mainWindow")
         self.setGeometry(100, 100, 850, 750)
         
         # Set window icon (if you have one)
@@ -48,11 +282,12 @@ class ProductionUpdateGUI(QMainWindow):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setStyleSheet("QScrollArea { background-color: #f5f7fa; }")
+        scroll.setObjectName("mainScroll")
         
         # Create scroll content widget
         scroll_content = QWidget()
-        scroll_content.setStyleSheet("background-color: #f5f7fa;")
+        scroll_content.setAttribute(Qt.WA_DontCreateNativeAncestors)
+        scroll_content.setObjectName("mainContent")
         layout = QVBoxLayout(scroll_content)
         layout.setSpacing(20)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -63,40 +298,11 @@ class ProductionUpdateGUI(QMainWindow):
         # Company Header (centered)
         company_header = QLabel("Pacific Canbriam Energy LTD")
         company_header.setAlignment(Qt.AlignCenter)
-        company_header.setStyleSheet("""
-            QLabel {
-                color: #1a4d3e;
-                font-size: 28px;
-                font-weight: bold;
-                padding: 15px;
-                background-color: #ffffff;
-                border: 2px solid #1a4d3e;
-                border-radius: 8px;
-                margin-bottom: 5px;
-            }
-        """)
+        company_header.setObjectName("brandHeader")
         
         # Settings button (top-right)
         self.btn_settings = QPushButton("⚙️ Settings")
-        self.btn_settings.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 12px;
-                font-weight: bold;
-                padding: 8px 16px;
-                min-width: 100px;
-                min-height: 35px;
-            }
-            QPushButton:hover {
-                background-color: #8a929c;
-            }
-            QPushButton:pressed {
-                background-color: #545b62;
-            }
-        """)
+        self.btn_settings.setObjectName("settingsBtn")
         self.btn_settings.clicked.connect(lambda: self.select_operation("Settings"))
         
         # Add to header layout
@@ -107,15 +313,7 @@ class ProductionUpdateGUI(QMainWindow):
         # Sub-header
         sub_header = QLabel("Production Update System")
         sub_header.setAlignment(Qt.AlignCenter)
-        sub_header.setStyleSheet("""
-            QLabel {
-                color: #0066b3;
-                font-size: 18px;
-                font-weight: normal;
-                padding: 5px;
-                margin-bottom: 10px;
-            }
-        """)
+        sub_header.setObjectName("subHeader")
         layout.addWidget(sub_header)
         
         # Buttons grid
@@ -123,13 +321,13 @@ class ProductionUpdateGUI(QMainWindow):
         buttons_layout.setSpacing(10)
         
         # Create 7 main buttons (Settings moved to header)
-        self.btn_well_master = self.create_main_button("📋 Well Master List", "#0066b3")
-        self.btn_prodview = self.create_main_button("❄️ Prodview/Snowflake Daily Production Retrieve", "#0066b3")
-        self.btn_allocations = self.create_main_button("📊 Production Accounting Allocations (PA)", "#0066b3")
-        self.btn_ratios = self.create_main_button("📈 Public Sales Data and Ratios", "#0066b3")
-        self.btn_survey = self.create_main_button("📐 Survey Data Import", "#0066b3")
-        self.btn_type_curves = self.create_main_button("📊 Type Curves Import", "#0066b3")
-        self.btn_exports = self.create_main_button("📁 Exports / Reports", "#0066b3")
+        self.btn_well_master = self.create_main_button("📋 Well Master List")
+        self.btn_prodview = self.create_main_button("❄️ Prodview/Snowflake Daily Production Retrieve")
+        self.btn_allocations = self.create_main_button("📊 Production Accounting Allocations (PA)")
+        self.btn_ratios = self.create_main_button("📈 Public Sales Data and Ratios")
+        self.btn_survey = self.create_main_button("📐 Survey Data Import")
+        self.btn_type_curves = self.create_main_button("📊 Type Curves Import")
+        self.btn_exports = self.create_main_button("📁 Exports / Reports")
         
         # Add buttons to layout
         buttons_layout.addWidget(self.btn_well_master)
@@ -155,32 +353,23 @@ class ProductionUpdateGUI(QMainWindow):
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
         separator.setFrameShadow(QFrame.Sunken)
-        separator.setStyleSheet("background-color: #d1d5db; max-height: 1px;")
+        separator.setObjectName("separator")
         layout.addWidget(separator)
         
         # Log area
         log_label = QLabel("📋 Operation Log")
-        log_label.setStyleSheet("color: #1a4d3e; font-weight: bold; font-size: 14px; margin-top: 10px;")
+        log_label.setObjectName("logLabel")
         layout.addWidget(log_label)
         
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMinimumHeight(200)
-        self.log_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #e6f0fa;
-                border: 1px solid #d1d5db;
-                border-radius: 5px;
-                font-family: Consolas, monospace;
-                font-size: 10pt;
-                padding: 5px;
-            }
-        """)
+        self.log_text.setObjectName("logText")
         layout.addWidget(self.log_text)
         
         # Status bar
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("color: #64748b; font-style: italic;")
+        self.status_label.setObjectName("statusLabel")
         layout.addWidget(self.status_label)
         
         # Add stretch at the bottom
@@ -192,37 +381,17 @@ class ProductionUpdateGUI(QMainWindow):
         
         # Apply styles
         self.apply_styles()
+        self.setUpdatesEnabled(True)
         
         # Log startup
         self.log("Production Update System initialized")
         self.log("Select an operation to begin")
         
-    def create_main_button(self, text, color):
+    def create_main_button(self, text):
         """Create a styled main button"""
         btn = QPushButton(text)
         btn.setMinimumHeight(40)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 8px 15px;
-                text-align: center;
-            }}
-            QPushButton:hover {{
-                background-color: #2c7fc9;
-            }}
-            QPushButton:pressed {{
-                background-color: #004d8c;
-            }}
-            QPushButton:checked {{
-                background-color: #1a4d3e;
-                border: 2px solid #ffaa00;
-            }}
-        """)
+        btn.setObjectName("mainBtn")
         btn.setCheckable(True)
         btn.setAutoExclusive(True)  # Only one button can be checked at a time
         return btn
@@ -270,6 +439,9 @@ class ProductionUpdateGUI(QMainWindow):
         """Open the sales ratios update dialog"""
         self.log("Opening Sales Ratios Update dialog...")
         
+        # Imported here so the update's DB stack loads on first use, not at startup
+        from sales_ratios_dialog import SalesRatiosDialog
+        
         dialog = SalesRatiosDialog(self)
         dialog.exec_()
         
@@ -281,17 +453,14 @@ class ProductionUpdateGUI(QMainWindow):
         """Open the monthly loader dialog"""
         self.log("Opening PA Allocations dialog...")
         
+        # Imported here so the loader's DB stack loads on first use, not at startup
+        from monthly_loader_dialog import MonthlyLoaderDialog
+        
         # Load settings
-        config = configparser.ConfigParser()
-        settings_file = get_settings_path()
-        if os.path.exists(settings_file):
-            config.read(settings_file)
-        else:
-            config['PATHS'] = {}
-            config['SQL'] = {}
+        config = read_settings()
         
         # Pass only settings_section and parent
-        dialog = MonthlyLoaderDialog(config['PATHS'], self)  # Removed get_sql_conn
+        dialog = MonthlyLoaderDialog(config['PATHS'], self)
         dialog.exec_()
         
         # Clear selection
@@ -302,12 +471,7 @@ class ProductionUpdateGUI(QMainWindow):
         self.log("Opening Survey Data Import dialog...")
         
         # Load settings
-        config = configparser.ConfigParser()
-        settings_file = get_settings_path()
-        if os.path.exists(settings_file):
-            config.read(settings_file)
-        else:
-            config['PATHS'] = {}
+        config = read_settings()
         
         # Pass settings_section and parent
         dialog = SurveyImportDialog(config['PATHS'], self)
@@ -321,12 +485,7 @@ class ProductionUpdateGUI(QMainWindow):
         self.log("Opening Type Curves Import dialog...")
         
         # Load settings
-        config = configparser.ConfigParser()
-        settings_file = get_settings_path()
-        if os.path.exists(settings_file):
-            config.read(settings_file)
-        else:
-            config['PATHS'] = {}
+        config = read_settings()
         
         dialog = TypeCurvesImportDialog(config['PATHS'], self)
         dialog.exec_()
@@ -369,6 +528,10 @@ class ProductionUpdateGUI(QMainWindow):
         self.btn_exports.setEnabled(enabled)
     
     def log(self, message):
+        """Queue a message for the log window (safe to call from any thread)"""
+        self.log_signal.emit(message)
+    
+    def _append_log(self, message):
         """Add message to log window with timestamp"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.log_text.append(f"[{timestamp}] {message}")
@@ -378,20 +541,16 @@ class ProductionUpdateGUI(QMainWindow):
         self.log_text.setTextCursor(cursor)
     
     def apply_styles(self):
-        """Apply additional styles to the main window"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f7fa;
-            }
-            QLabel {
-                color: #1e293b;
-            }
-        """)
+        """Apply the application-wide stylesheet (parsed once for every window)"""
+        app = QApplication.instance()
+        if app.styleSheet() != _APP_QSS:
+            app.setStyleSheet(_APP_QSS)
 
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Settings - Production Update System")
+        self.setObjectName("settingsDialog")
         self.setModal(True)
         self.setMinimumWidth(500)
         self.initUI()
@@ -399,36 +558,24 @@ class SettingsDialog(QDialog):
         
     def initUI(self):
         """Initialize the settings dialog UI"""
+        # Suppress intermediate repaints while the widget tree is built
+        self.setUpdatesEnabled(False)
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
         
         # Title
         title = QLabel("⚙️ System Settings")
-        title.setStyleSheet("""
-            QLabel {
-                color: #1a4d3e;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 5px;
-            }
-        """)
+        title.setObjectName("dialogTitle")
         layout.addWidget(title)
         
         # SQL Server Settings Group
         sql_group = QFrame()
         sql_group.setFrameShape(QFrame.StyledPanel)
-        sql_group.setStyleSheet("""
-            QFrame {
-                background-color: #f0f0f0;
-                border: 1px solid #d1d5db;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
+        sql_group.setObjectName("settingsGroup")
         sql_layout = QVBoxLayout(sql_group)
         
         sql_label = QLabel("🔷 SQL Server Connection")
-        sql_label.setStyleSheet("color: #0066b3; font-weight: bold; font-size: 14px;")
+        sql_label.setObjectName("settingsSection")
         sql_layout.addWidget(sql_label)
         
         # Server
@@ -452,18 +599,11 @@ class SettingsDialog(QDialog):
         # File Paths Group
         paths_group = QFrame()
         paths_group.setFrameShape(QFrame.StyledPanel)
-        paths_group.setStyleSheet("""
-            QFrame {
-                background-color: #f0f0f0;
-                border: 1px solid #d1d5db;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
+        paths_group.setObjectName("settingsGroup")
         paths_layout = QVBoxLayout(paths_group)
         
         paths_label = QLabel("📁 Default File Paths")
-        paths_label.setStyleSheet("color: #0066b3; font-weight: bold; font-size: 14px;")
+        paths_label.setObjectName("settingsSection")
         paths_layout.addWidget(paths_label)
         
         # ValNav path
@@ -473,18 +613,7 @@ class SettingsDialog(QDialog):
         self.valnav_input.setPlaceholderText("Path to ValNav Excel file...")
         valnav_layout.addWidget(self.valnav_input)
         valnav_browse = QPushButton("Browse")
-        valnav_browse.setStyleSheet("""
-            QPushButton {
-                background-color: #0066b3;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 5px 10px;
-            }
-            QPushButton:hover {
-                background-color: #2c7fc9;
-            }
-        """)
+        valnav_browse.setObjectName("browseBtn")
         valnav_browse.clicked.connect(self.browse_valnav)
         valnav_layout.addWidget(valnav_browse)
         paths_layout.addLayout(valnav_layout)
@@ -496,18 +625,7 @@ class SettingsDialog(QDialog):
         self.accumap_input.setPlaceholderText("Path to Public Data Accumap file...")
         accumap_layout.addWidget(self.accumap_input)
         accumap_browse = QPushButton("Browse")
-        accumap_browse.setStyleSheet("""
-            QPushButton {
-                background-color: #0066b3;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 5px 10px;
-            }
-            QPushButton:hover {
-                background-color: #2c7fc9;
-            }
-        """)
+        accumap_browse.setObjectName("browseBtn")
         accumap_browse.clicked.connect(self.browse_accumap)
         accumap_layout.addWidget(accumap_browse)
         paths_layout.addLayout(accumap_layout)
@@ -519,18 +637,7 @@ class SettingsDialog(QDialog):
         self.survey_input.setPlaceholderText("Path to Survey Excel file...")
         survey_layout.addWidget(self.survey_input)
         survey_browse = QPushButton("Browse")
-        survey_browse.setStyleSheet("""
-            QPushButton {
-                background-color: #0066b3;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 5px 10px;
-            }
-            QPushButton:hover {
-                background-color: #2c7fc9;
-            }
-        """)
+        survey_browse.setObjectName("browseBtn")
         survey_browse.clicked.connect(self.browse_survey)
         survey_layout.addWidget(survey_browse)
         paths_layout.addLayout(survey_layout)
@@ -542,18 +649,7 @@ class SettingsDialog(QDialog):
         self.type_curves_input.setPlaceholderText("Path to Type Curves Excel file...")
         type_curves_layout.addWidget(self.type_curves_input)
         type_curves_browse = QPushButton("Browse")
-        type_curves_browse.setStyleSheet("""
-            QPushButton {
-                background-color: #0066b3;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 5px 10px;
-            }
-            QPushButton:hover {
-                background-color: #2c7fc9;
-            }
-        """)
+        type_curves_browse.setObjectName("browseBtn")
         type_curves_browse.clicked.connect(self.browse_type_curves)
         type_curves_layout.addWidget(type_curves_browse)
         paths_layout.addLayout(type_curves_layout)
@@ -565,43 +661,18 @@ class SettingsDialog(QDialog):
         
         # Save button (green)
         save_btn = QPushButton("Save Settings")
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1a4d3e;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 20px;
-                font-weight: bold;
-                min-width: 120px;
-            }
-            QPushButton:hover {
-                background-color: #2a6b57;
-            }
-        """)
+        save_btn.setObjectName("primaryBtn")
         save_btn.clicked.connect(self.save_settings)
         button_layout.addWidget(save_btn)
         
         # Cancel button
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 20px;
-                font-weight: bold;
-                min-width: 120px;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-        """)
+        cancel_btn.setObjectName("secondaryBtn")
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
         
         layout.addLayout(button_layout)
+        self.setUpdatesEnabled(True)
         
     def browse_valnav(self):
         """Browse for ValNav template file"""
@@ -649,21 +720,20 @@ class SettingsDialog(QDialog):
     
     def load_settings(self):
         """Load settings from file"""
-        config = configparser.ConfigParser()
         settings_file = get_settings_path()
         
         if os.path.exists(settings_file):
-            config.read(settings_file)
+            config = read_settings()
             
             # SQL Server settings
-            self.server_input.setText(config.get('SQL', 'server', fallback='CALVMSQL02'))
-            self.db_input.setText(config.get('SQL', 'database', fallback='Re_Main_Production'))
+            self.server_input.setText(config['SQL'].get('server', 'CALVMSQL02'))
+            self.db_input.setText(config['SQL'].get('database', 'Re_Main_Production'))
             
             # File paths
-            self.valnav_input.setText(config.get('PATHS', 'valnav_template', fallback=''))
-            self.accumap_input.setText(config.get('PATHS', 'accumap_template', fallback=''))
-            self.survey_input.setText(config.get('PATHS', 'survey_file', fallback=''))
-            self.type_curves_input.setText(config.get('PATHS', 'type_curves_file', fallback=''))
+            self.valnav_input.setText(config['PATHS'].get('valnav_template', ''))
+            self.accumap_input.setText(config['PATHS'].get('accumap_template', ''))
+            self.survey_input.setText(config['PATHS'].get('survey_file', ''))
+            self.type_curves_input.setText(config['PATHS'].get('type_curves_file', ''))
         else:
             # Set defaults
             self.server_input.setText('CALVMSQL02')
@@ -671,7 +741,7 @@ class SettingsDialog(QDialog):
     
     def save_settings(self):
         """Save settings to file"""
-        config = configparser.ConfigParser()
+        config = {}
         
         config['SQL'] = {
             'server': self.server_input.text(),
@@ -685,9 +755,7 @@ class SettingsDialog(QDialog):
             'type_curves_file': self.type_curves_input.text()
         }
         
-        settings_file = get_settings_path()
-        with open(settings_file, 'w') as f:
-            config.write(f)
+        write_settings(config)
         
         # Show success message
         QMessageBox.information(self, "Settings Saved", "Settings have been saved successfully.")
@@ -698,6 +766,7 @@ class ExportsDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("📁 Exports / Reports")
+        self.setObjectName("exportsDialog")
         self.setModal(True)
         self.setMinimumWidth(500)
         self.setMinimumHeight(300)
@@ -711,30 +780,13 @@ class ExportsDialog(QDialog):
         
         # Title
         title = QLabel("📁 Exports / Reports")
-        title.setStyleSheet("""
-            QLabel {
-                color: #1a4d3e;
-                font-size: 24px;
-                font-weight: bold;
-                padding: 10px;
-            }
-        """)
+        title.setObjectName("exportsTitle")
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
         # Coming Soon Message
         coming_soon = QLabel("🚧 Coming Soon 🚧")
-        coming_soon.setStyleSheet("""
-            QLabel {
-                color: #0066b3;
-                font-size: 32px;
-                font-weight: bold;
-                padding: 20px;
-                background-color: #e6f0fa;
-                border: 2px solid #0066b3;
-                border-radius: 10px;
-            }
-        """)
+        coming_soon.setObjectName("comingSoon")
         coming_soon.setAlignment(Qt.AlignCenter)
         layout.addWidget(coming_soon)
         
@@ -743,13 +795,7 @@ class ExportsDialog(QDialog):
             "The Exports / Reports feature is currently under development.\n"
             "This functionality will be available in a future update."
         )
-        description.setStyleSheet("""
-            QLabel {
-                color: #64748b;
-                font-size: 14px;
-                padding: 10px;
-            }
-        """)
+        description.setObjectName("exportsDescription")
         description.setAlignment(Qt.AlignCenter)
         description.setWordWrap(True)
         layout.addWidget(description)
@@ -759,24 +805,7 @@ class ExportsDialog(QDialog):
         
         # Close button
         close_btn = QPushButton("Close")
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 30px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #8a929c;
-            }
-            QPushButton:pressed {
-                background-color: #545b62;
-            }
-        """)
+        close_btn.setObjectName("closeBtn")
         close_btn.clicked.connect(self.close)
         
         btn_layout = QHBoxLayout()
@@ -787,10 +816,13 @@ class ExportsDialog(QDialog):
 
 
 def main():
+    # Coalesce bursts of mouse-move/resize events into one delivery; must be
+    # set before the QApplication exists
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
     app = QApplication(sys.argv)
     gui = ProductionUpdateGUI()
     gui.show()
-    sys.exit(app.exec_())
+    sys.exit(app.exec())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
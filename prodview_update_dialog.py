@@ -1,16 +1,15 @@
 # prodview_update_dialog.py
 
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from PyQt5.QtWidgets import (
-    QApplication,
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QFrame,
     QProgressBar,
-    QTextEdit,
+    QPlainTextEdit,
     QPushButton,
     QScrollArea,
     QWidget,
@@ -18,27 +17,93 @@ from PyQt5.QtWidgets import (
     QMessageBox,
     QRadioButton,
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QTextCursor
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+
+from dialog_common import (
+    DialogCommon,
+    LOG_BOX_HEAVY,
+    LOG_BOX_RULE,
+    QSS_CLOSE_BUTTON,
+    QSS_DIALOG_TITLE,
+    QSS_RESULTS_TEXT,
+    QSS_RUN_BUTTON,
+    QSS_TRANSPARENT,
+    QSS_TRANSPARENT_SCROLL,
+    RESULTS_MAX_BLOCKS,
+    throttle_progress,
+)
 
 
-class ProdviewUpdateDialog(QDialog):
+_QSS_MODE_RADIO = """
+    QRadioButton {
+        font-size: 12pt;
+        padding: 5px;
+    }
+"""
+
+_QSS_MODE_DESC = """
+    QLabel {
+        color: #666;
+        font-size: 10pt;
+        padding-left: 25px;
+        padding-bottom: 5px;
+    }
+"""
+
+_QSS_INFO_TEXT = """
+    QLabel {
+        background-color: #e6f0fa;
+        border: 1px solid #d1d5db;
+        border-radius: 5px;
+        padding: 10px;
+        font-family: Consolas, monospace;
+        font-size: 11pt;
+    }
+"""
+
+_QSS_PROGRESS_BAR = """
+    QProgressBar {
+        border: 1px solid #d1d5db;
+        border-radius: 4px;
+        text-align: center;
+        height: 25px;
+        font-size: 11pt;
+    }
+    QProgressBar::chunk {
+        background-color: #0066b3;
+        border-radius: 4px;
+    }
+"""
+
+
+class ProdviewUpdateDialog(QDialog, DialogCommon):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("❄️ Prodview/Snowflake Daily Production Retrieve")
         self.setModal(True)
-        self.setMinimumWidth(600)
-        self.setMinimumHeight(500)
-        self.worker = None
+        self.setMinimumWidth(650)
+        self.setMinimumHeight(600)
+
+        # Log lines are buffered and flushed to the results area at most
+        # every 50 ms instead of repainting once per line
+        self._log_buffer = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+
         self.initUI()
 
+        # One worker per dialog, reused for every run; signals are wired once
+        self.worker = ProdviewUpdateWorker("", "")
+        self.worker.log_signal.connect(self.log_result, Qt.QueuedConnection)
+        self.worker.progress_signal.connect(self.progress_bar.setValue, Qt.QueuedConnection)
+        self.worker.status_signal.connect(self.status_label.setText, Qt.QueuedConnection)
+        self.worker.finished_signal.connect(self.update_finished, Qt.QueuedConnection)
+        self.worker.error_signal.connect(self.update_error, Qt.QueuedConnection)
+
     def initUI(self):
         """Initialize the prodview update dialog UI"""
-        self.setWindowTitle("❄️ Prodview/Snowflake Daily Production Retrieve")
-        self.setModal(True)
-        self.setMinimumWidth(650)
-        self.setMinimumHeight(600)
-
         # Main layout
         main_layout = QVBoxLayout(self)
 
@@ -46,25 +111,18 @@ class ProdviewUpdateDialog(QDialog):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setStyleSheet("QScrollArea { background-color: transparent; }")
+        scroll.setStyleSheet(QSS_TRANSPARENT_SCROLL)
 
         # Create scroll content widget
         scroll_content = QWidget()
-        scroll_content.setStyleSheet("background-color: transparent;")
+        scroll_content.setStyleSheet(QSS_TRANSPARENT)
         layout = QVBoxLayout(scroll_content)
         layout.setSpacing(15)
         layout.setContentsMargins(10, 10, 10, 10)
 
         # Title
         title = QLabel("❄️ Prodview/Snowflake Daily Production Retrieve")
-        title.setStyleSheet("""
-            QLabel {
-                color: #1a4d3e;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 5px;
-            }
-        """)
+        title.setStyleSheet(QSS_DIALOG_TITLE)
         layout.addWidget(title)
 
         # Month Range Selection
@@ -74,7 +132,7 @@ class ProdviewUpdateDialog(QDialog):
         from_layout = QHBoxLayout()
         from_layout.addWidget(QLabel("From:"))
         self.from_combo = QComboBox()
-        self.populate_months(self.from_combo, months_back=36)
+        self.populate_months(self.from_combo, 36)
         from_layout.addWidget(self.from_combo)
         from_layout.addStretch()
         range_layout.addLayout(from_layout)
@@ -82,7 +140,7 @@ class ProdviewUpdateDialog(QDialog):
         to_layout = QHBoxLayout()
         to_layout.addWidget(QLabel("To:"))
         self.to_combo = QComboBox()
-        self.populate_months(self.to_combo, months_back=0)
+        self.populate_months(self.to_combo, 1)
         self.to_combo.setCurrentIndex(0)
         to_layout.addWidget(self.to_combo)
         to_layout.addStretch()
@@ -97,12 +155,7 @@ class ProdviewUpdateDialog(QDialog):
 
         self.mode_full_rebuild = QRadioButton("Full Rebuild Mode")
         self.mode_full_rebuild.setChecked(True)
-        self.mode_full_rebuild.setStyleSheet("""
-            QRadioButton {
-                font-size: 12pt;
-                padding: 5px;
-            }
-        """)
+        self.mode_full_rebuild.setStyleSheet(_QSS_MODE_RADIO)
         mode_layout.addWidget(self.mode_full_rebuild)
 
         full_rebuild_desc = QLabel(
@@ -110,23 +163,11 @@ class ProdviewUpdateDialog(QDialog):
             "  • Clears and rebuilds entire PCE_Production table\n"
             "  • Takes 30-40 minutes (full rebuild)"
         )
-        full_rebuild_desc.setStyleSheet("""
-            QLabel {
-                color: #666;
-                font-size: 10pt;
-                padding-left: 25px;
-                padding-bottom: 5px;
-            }
-        """)
+        full_rebuild_desc.setStyleSheet(_QSS_MODE_DESC)
         mode_layout.addWidget(full_rebuild_desc)
 
         self.mode_quick_update = QRadioButton("Quick Update Mode")
-        self.mode_quick_update.setStyleSheet("""
-            QRadioButton {
-                font-size: 12pt;
-                padding: 5px;
-            }
-        """)
+        self.mode_quick_update.setStyleSheet(_QSS_MODE_RADIO)
         mode_layout.addWidget(self.mode_quick_update)
 
         quick_update_desc = QLabel(
@@ -136,14 +177,7 @@ class ProdviewUpdateDialog(QDialog):
             "  • Recalculates sequences for affected wells only\n"
             "  • Updates cumulatives incrementally"
         )
-        quick_update_desc.setStyleSheet("""
-            QLabel {
-                color: #666;
-                font-size: 10pt;
-                padding-left: 25px;
-                padding-bottom: 5px;
-            }
-        """)
+        quick_update_desc.setStyleSheet(_QSS_MODE_DESC)
         mode_layout.addWidget(quick_update_desc)
 
         self.mode_full_rebuild.toggled.connect(self.update_info_text)
@@ -161,16 +195,7 @@ class ProdviewUpdateDialog(QDialog):
             "  • Update PCE_CDA\n"
             "  • Update PCE_Production"
         )
-        self.info_text.setStyleSheet("""
-            QLabel {
-                background-color: #e6f0fa;
-                border: 1px solid #d1d5db;
-                border-radius: 5px;
-                padding: 10px;
-                font-family: Consolas, monospace;
-                font-size: 11pt;
-            }
-        """)
+        self.info_text.setStyleSheet(_QSS_INFO_TEXT)
         info_layout.addWidget(self.info_text)
         info_group.layout().addLayout(info_layout)
         layout.addWidget(info_group)
@@ -181,19 +206,7 @@ class ProdviewUpdateDialog(QDialog):
 
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #d1d5db;
-                border-radius: 4px;
-                text-align: center;
-                height: 25px;
-                font-size: 11pt;
-            }
-            QProgressBar::chunk {
-                background-color: #0066b3;
-                border-radius: 4px;
-            }
-        """)
+        self.progress_bar.setStyleSheet(_QSS_PROGRESS_BAR)
         progress_layout.addWidget(self.progress_bar)
         progress_group.layout().addLayout(progress_layout)
         layout.addWidget(progress_group)
@@ -205,19 +218,12 @@ class ProdviewUpdateDialog(QDialog):
 
         # Results Area
         results_group = self.create_group("📋 Results")
-        self.results_text = QTextEdit()
+        self.results_text = QPlainTextEdit()
         self.results_text.setReadOnly(True)
+        self.results_text.setUndoRedoEnabled(False)
+        self.results_text.setMaximumBlockCount(RESULTS_MAX_BLOCKS)
         self.results_text.setMinimumHeight(180)
-        self.results_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #e6f0fa;
-                border: 1px solid #d1d5db;
-                border-radius: 5px;
-                font-family: Consolas, monospace;
-                font-size: 10pt;
-                padding: 8px;
-            }
-        """)
+        self.results_text.setStyleSheet(QSS_RESULTS_TEXT)
         results_group.layout().addWidget(self.results_text)
         layout.addWidget(results_group)
 
@@ -226,49 +232,12 @@ class ProdviewUpdateDialog(QDialog):
         button_layout.setSpacing(10)
 
         self.run_btn = QPushButton("▶️ Run Update")
-        self.run_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1a4d3e;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 150px;
-            }
-            QPushButton:hover {
-                background-color: #2a6b57;
-            }
-            QPushButton:pressed {
-                background-color: #0d3d2e;
-            }
-            QPushButton:disabled {
-                background-color: #a0a0a0;
-            }
-        """)
+        self.run_btn.setStyleSheet(QSS_RUN_BUTTON)
         self.run_btn.clicked.connect(self.run_update)
         button_layout.addWidget(self.run_btn)
 
         self.close_btn = QPushButton("Close")
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 150px;
-            }
-            QPushButton:hover {
-                background-color: #8a929c;
-            }
-            QPushButton:pressed {
-                background-color: #545b62;
-            }
-        """)
+        self.close_btn.setStyleSheet(QSS_CLOSE_BUTTON)
         self.close_btn.clicked.connect(self.handle_close)
         button_layout.addWidget(self.close_btn)
 
@@ -287,7 +256,7 @@ class ProdviewUpdateDialog(QDialog):
         Handle dialog close.
         If an update is running, optionally cancel it before closing.
         """
-        if self.worker is not None and self.worker.isRunning():
+        if self.worker.isRunning():
             reply = QMessageBox.question(
                 self,
                 "Cancel Update?",
@@ -318,7 +287,7 @@ class ProdviewUpdateDialog(QDialog):
     
     def closeEvent(self, event):
         """Handle window close event"""
-        if self.worker is not None and self.worker.isRunning():
+        if self.worker.isRunning():
             reply = QMessageBox.question(
                 self,
                 "Cancel Update?",
@@ -362,73 +331,19 @@ class ProdviewUpdateDialog(QDialog):
                 "  • Update cumulatives incrementally"
             )
 
-    def create_group(self, title):
-        """Create a styled group frame with title"""
-        group = QFrame()
-        group.setFrameShape(QFrame.StyledPanel)
-        group.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border: 1px solid #d1d5db;
-                border-radius: 5px;
-                padding: 10px;
-                margin-top: 5px;
-            }
-        """)
-
-        group_layout = QVBoxLayout(group)
-        group_layout.setSpacing(8)
-
-        title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #1a4d3e;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 0px;
-            }
-        """)
-        group_layout.addWidget(title_label)
-
-        return group
-
-    def populate_months(self, combo_box, months_back=24):
-        """Populate month combo box"""
-        current = datetime.now()
-        month_names = {
-            1: "Jan", 2: "Feb", 3: "Mar", 4: "Apr", 5: "May", 6: "Jun",
-            7: "Jul", 8: "Aug", 9: "Sep", 10: "Oct", 11: "Nov", 12: "Dec"
-        }
-
-        # months_back is the number of months to include (if > 0),
-        # otherwise just include the current month.
-        count = months_back if months_back and months_back > 0 else 1
-
-        months = []
-        year = current.year
-        month = current.month
-        for _ in range(count):
-            months.append(f"{month_names[month]} {year}")
-            month -= 1
-            if month == 0:
-                month = 12
-                year -= 1
-
-        months.reverse()
-
-        combo_box.clear()
-        combo_box.addItems(months)
-        # Make sure full text (e.g. "Dec 2025") is visible
-        combo_box.setSizeAdjustPolicy(QComboBox.AdjustToContents)
-        combo_box.setMinimumContentsLength(10)
-
     def log_result(self, message):
-        """Add message to results area"""
-        self.results_text.append(message)
-        cursor = self.results_text.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.results_text.setTextCursor(cursor)
-        QApplication.processEvents()
+        """Queue message for the results area"""
+        self._log_buffer.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append all queued messages to the results area in one go"""
+        if not self._log_buffer:
+            return
+        # QPlainTextEdit keeps the view pinned to the bottom on append
+        self.results_text.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
     
     def format_timestamp(self):
         """Get formatted timestamp for log entries"""
@@ -449,6 +364,9 @@ class ProdviewUpdateDialog(QDialog):
 
     def run_update(self):
         """Run the prodview update in a separate thread"""
+        if self.worker.isRunning():
+            return
+
         # Confirm before running
         from_month = self.from_combo.currentText()
         to_month = self.to_combo.currentText()
@@ -487,30 +405,21 @@ class ProdviewUpdateDialog(QDialog):
         timestamp = self.format_timestamp()
 
         # Professional header with timestamp
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         self.log_result("|" + " " * 10 + "PRODVIEW/SNOWFLAKE DAILY PRODUCTION RETRIEVE" + " " * 16 + "|")
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         self.log_result(f"|  Started:     {timestamp:<54} |")
         self.log_result(f"|  Mode:        {mode_name:<54} |")
         self.log_result(f"|  From:        {from_month:<54} |")
         self.log_result(f"|  To:          {to_month:<54} |")
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         self.log_result("")
 
-        self.worker = ProdviewUpdateWorker(from_month, to_month, update_mode)
-        self.worker.log_signal.connect(self.log_result)
-        self.worker.progress_signal.connect(self.update_progress)
-        self.worker.status_signal.connect(self.status_label.setText)
-        self.worker.finished_signal.connect(self.update_finished)
-        self.worker.error_signal.connect(self.update_error)
+        self.worker.from_month = from_month
+        self.worker.to_month = to_month
+        self.worker.update_mode = update_mode
         self.worker.start()
 
-    def update_progress(self, value):
-        """Update progress bar"""
-        # Only apply numeric progress updates when the bar is in determinate mode
-        if self.progress_bar.maximum() > 0:
-            self.progress_bar.setValue(value)
-
     def update_finished(self, summary):
         """Handle update completion"""
         # Ensure progress bar is back in determinate mode and completed
@@ -523,15 +432,15 @@ class ProdviewUpdateDialog(QDialog):
 
         timestamp = self.format_timestamp()
         self.log_result("")
-        self.log_result("+" + "=" * 70 + "+")
+        self.log_result(LOG_BOX_HEAVY)
         self.log_result("|" + " " * 22 + "OPERATION COMPLETE" + " " * 30 + "|")
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         self.log_result(f"|  Completed:   {timestamp:<54} |")
         
         if summary:
-            self.log_result("+" + "-" * 70 + "+")
+            self.log_result(LOG_BOX_RULE)
             self.log_result("|  SUMMARY" + " " * 60 + "|")
-            self.log_result("+" + "-" * 70 + "+")
+            self.log_result(LOG_BOX_RULE)
             
             months = summary.get('months_processed', 0)
             wells = summary.get('wells_updated', 0)
@@ -543,11 +452,11 @@ class ProdviewUpdateDialog(QDialog):
             self.log_result(f"|    Wells Updated:           {wells:>10,} wells" + " " * 30 + "|")
             self.log_result(f"|    PCE_CDA Records:         {cda_records:>10,} records" + " " * 26 + "|")
             self.log_result(f"|    PCE_Production Records:  {prod_records:>10,} records" + " " * 24 + "|")
-            self.log_result("+" + "-" * 70 + "+")
+            self.log_result(LOG_BOX_RULE)
             formatted_duration = self.format_duration(duration)
             self.log_result(f"|  Duration:     {formatted_duration:<54} |")
         
-        self.log_result("+" + "=" * 70 + "+")
+        self.log_result(LOG_BOX_HEAVY)
 
     def update_error(self, error_msg):
         """Handle update error"""
@@ -560,11 +469,11 @@ class ProdviewUpdateDialog(QDialog):
         self.status_label.setText("Error")
         timestamp = self.format_timestamp()
         self.log_result("")
-        self.log_result("+" + "=" * 70 + "+")
+        self.log_result(LOG_BOX_HEAVY)
         self.log_result("|" + " " * 24 + "OPERATION FAILED" + " " * 30 + "|")
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         self.log_result(f"|  Time:         {timestamp:<54} |")
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         # Wrap error message properly
         error_lines = []
         remaining = error_msg
@@ -578,7 +487,7 @@ class ProdviewUpdateDialog(QDialog):
                 self.log_result(f"|  Error:        {chunk:<54} |")
             else:
                 self.log_result(f"|                {chunk:<54} |")
-        self.log_result("+" + "=" * 70 + "+")
+        self.log_result(LOG_BOX_HEAVY)
 
 
 class ProdviewUpdateWorker(QThread):
@@ -606,6 +515,7 @@ class ProdviewUpdateWorker(QThread):
 
     def run(self):
         """Run the update"""
+        self._cancelled = False
         try:
             if self.update_mode == "full_rebuild":
                 self.status_signal.emit("Running full rebuild...")
@@ -639,7 +549,7 @@ class ProdviewUpdateWorker(QThread):
                         pass
 
                 old_stdout = sys.stdout
-                log_capture = LogCapture(self.log_signal.emit, self.progress_signal.emit)
+                log_capture = LogCapture(self.log_signal.emit, throttle_progress(self.progress_signal.emit))
                 sys.stdout = log_capture
 
                 try:
@@ -665,8 +575,7 @@ class ProdviewUpdateWorker(QThread):
             else:
                 from prodview_update_gui import run_quick_update
 
-                def progress_callback(value):
-                    self.progress_signal.emit(value)
+                progress_callback = throttle_progress(self.progress_signal.emit)
 
                 def log_callback(message):
                     self.log_signal.emit(message)
@@ -1,3 +1,4 @@
+import threading
 import time
 import pandas as pd
 import numpy as np
@@ -5,7 +6,372 @@ from datetime import datetime, timedelta
 from db_connection import get_sql_conn
 from snowflake_connector import SnowflakeConnector
 
-def run_prodview_update(start_month, end_month, progress_callback=None, log_callback=None):
+# Clears one month from PCE_CDA and PCE_Production in a single round trip and
+# returns the two deleted-row counts. NOCOUNT is switched back off so later
+# statements on the connection still report cursor.rowcount.
+_CLEAR_MONTH_SQL = """
+    SET NOCOUNT ON;
+    DELETE FROM PCE_CDA WHERE ProdDate BETWEEN ? AND ?;
+    DECLARE @deleted_cda INT = @@ROWCOUNT;
+    DELETE FROM PCE_Production WHERE [Date] BETWEEN ? AND ?;
+    DECLARE @deleted_prod INT = @@ROWCOUNT;
+    SET NOCOUNT OFF;
+    SELECT @deleted_cda, @deleted_prod;
+"""
+
+# Statements run inside the month and well loops, built once at import so
+# every call passes pyodbc the same string object
+_CDA_INSERT_SQL = """
+    INSERT INTO PCE_CDA (
+        [GasIDREC], [PressuresIDREC], [Well Name], [ProdDate],
+        [GasWH_Production], [Condensate_WH_Production],
+        [WGR_Ratio], [CGR_Ratio], [ECF_Ratio],
+        [OnProdHours], [TubingPressure], [CasingPressure], [ChokeSize],
+        [Gathered_Gas_Production], [Gathered_Condensate_Production],
+        [NGL_Production], [AllocatedWater_Rate],
+        [Formation Producer], [Layer Producer], [Fault Block], [Pad Name],
+        [Lateral Length], [Orient]
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_COPY_MONTH_TO_PROD_SQL = """
+    INSERT INTO PCE_Production (
+        [Date], [Well Name],
+        [Days Seq], [Day Seq UPRT],
+        [Gas WH Production (10³m³)], [Condensate WH (m³/d)],
+        [Gas S2 Production (10³m³)], [Gas Sales Production (10³m³)],
+        [Condensate Sales (m³/d)], [Gathered Gas (e³m³/d)],
+        [Gathered Condensate (m³/d)], [Sales CGR (m³/e³m³)],
+        [CGR (m³/e³m³)], [WGR (m³/e³m³)], [ECF],
+        [Hours On], [Tubing Pressure (kPa)], [Casing Pressure (kPa)],
+        [Choke Size], 
+        [Alloc. Water Rate (m³)], [NGL (m³)],
+        [Formation Producer], [Layer Producer], [Fault Block],
+        [Pad Name], [Lateral Length], [Orientation]
+    )
+    SELECT 
+        c.ProdDate,
+        c.[Well Name],
+        0, 0,  -- Temporary sequence values
+        c.GasWH_Production,
+        c.Condensate_WH_Production,
+        c.[Gas - S2 Production],
+        c.[Gas - Sales Production],
+        c.[Condensate - Sales Production],
+        c.Gathered_Gas_Production,
+        c.Gathered_Condensate_Production,
+        c.[Sales CGR Ratio],
+        c.CGR_Ratio,
+        c.WGR_Ratio,
+        c.ECF_Ratio,
+        c.OnProdHours,
+        c.TubingPressure,
+        c.CasingPressure,
+        c.ChokeSize,
+        c.AllocatedWater_Rate,
+        c.NGL_Production,
+        c.[Formation Producer],
+        c.[Layer Producer],
+        c.[Fault Block],
+        c.[Pad Name],
+        c.[Lateral Length],
+        c.Orient
+    FROM PCE_CDA c
+    WHERE c.ProdDate BETWEEN ? AND ?
+"""
+
+# Days Seq numbers each well's PCE_CDA days in date order. Day Seq UPRT
+# gives every producing day (GasWH >= 1) its own number and each run of
+# non-producing days one shared number: a new number starts on the first
+# day, on a producing day, and on the day after a producing day.
+_SET_SEQUENCES_SQL = """
+    WITH flagged AS (
+        SELECT
+            [Well Name] AS WellName,
+            ProdDate,
+            ROW_NUMBER() OVER (PARTITION BY [Well Name] ORDER BY ProdDate) AS DaysSeq,
+            CASE
+                WHEN ISNULL(GasWH_Production, 0) >= 1
+                  OR ISNULL(LAG(GasWH_Production, 1, 1)
+                            OVER (PARTITION BY [Well Name] ORDER BY ProdDate), 0) >= 1
+                THEN 1 ELSE 0
+            END AS StartsSeq
+        FROM PCE_CDA
+        WHERE [Well Name] IN (
+            SELECT [Well Name] FROM PCE_CDA WHERE ProdDate BETWEEN ? AND ?
+        )
+    ),
+    sequenced AS (
+        SELECT
+            WellName,
+            ProdDate,
+            DaysSeq,
+            SUM(StartsSeq) OVER (PARTITION BY WellName ORDER BY ProdDate
+                                 ROWS UNBOUNDED PRECEDING) AS DaySeqUprt
+        FROM flagged
+    )
+    UPDATE p
+    SET [Days Seq] = s.DaysSeq,
+        [Day Seq UPRT] = s.DaySeqUprt
+    FROM PCE_Production AS p
+    JOIN sequenced AS s
+      ON p.[Well Name] = s.WellName AND p.[Date] = s.ProdDate
+"""
+
+_WELL_HISTORY_SQL = """
+    SELECT 
+        [Well Name] as Source_Well_Name,
+        ProdDate as [Date],
+        [GasWH_Production] as [Gas WH Production (10³m³)],
+        [Condensate_WH_Production] as [Condensate WH (m³/d)],
+        [Gas - S2 Production] as [Gas S2 Production (10³m³)],
+        [Gas - Sales Production] as [Gas Sales Production (10³m³)],
+        [Condensate - Sales Production] as [Condensate Sales (m³/d)],
+        [Gathered_Gas_Production] as [Gathered Gas (e³m³/d)],
+        [Gathered_Condensate_Production] as [Gathered Condensate (m³/d)],
+        [Sales CGR Ratio] as [Sales CGR (m³/e³m³)],
+        [CGR_Ratio] as [CGR (m³/e³m³)],
+        [WGR_Ratio] as [WGR (m³/e³m³)],
+        [ECF_Ratio] as [ECF],
+        [OnProdHours] as [Hours On],
+        [TubingPressure] as [Tubing Pressure (kPa)],
+        [CasingPressure] as [Casing Pressure (kPa)],
+        [ChokeSize] as [Choke Size],
+        [AllocatedWater_Rate] as [Alloc. Water Rate (m³)],
+        [NGL_Production] as [NGL (m³)],
+        [Formation Producer],
+        [Layer Producer],
+        [Fault Block],
+        [Pad Name],
+        [Lateral Length],
+        [Orient] as [Orientation]
+    FROM PCE_CDA
+    WHERE [Well Name] = ?
+    ORDER BY ProdDate
+"""
+
+_DELETE_WELL_PROD_SQL = """
+    DELETE FROM PCE_Production
+    WHERE [Well Name] = ?
+"""
+
+_PROD_INSERT_SQL = """
+    INSERT INTO PCE_Production (
+        [Date], [Days Seq], [Day Seq UPRT], [Well Name],
+        [Gas WH Production (10³m³)], [Condensate WH (m³/d)],
+        [Gas S2 Production (10³m³)], [Gas Sales Production (10³m³)],
+        [Condensate Sales (m³/d)], [Gathered Gas (e³m³/d)],
+        [Gathered Condensate (m³/d)], [Sales CGR (m³/e³m³)],
+        [CGR (m³/e³m³)], [WGR (m³/e³m³)], [ECF],
+        [Hours On], [Tubing Pressure (kPa)], [Casing Pressure (kPa)],
+        [Choke Size], [Gas WH Cumulative Production (10³m³)],
+        [Gas S2 Cumulative Production (10³m³)],
+        [Gas Sales Cumulative Production (10³m³)],
+        [Condensate Sales Cumulative Production (m³)],
+        [Condensate WH Cumulative Production (m³)],
+        [Gas Gathered Cumulative (e³m³)],
+        [Condensate Gathered Cumulative (m³)],
+        [Formation Producer], [Layer Producer], [Fault Block],
+        [Pad Name], [Lateral Length], [Orientation],
+        [On Production Year], [Alloc. Water Rate (m³)], [NGL (m³)],
+        [Gas WH Avg (10³m³)], [Gas S2 Avg (10³m³)],
+        [Gas Gathered Avg (e³m³/d)], [Condensate Gathered Avg (m³/d)]
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,?)
+"""
+
+# PCE_WM columns read for the spine, in SELECT order, and the spine's column
+# order (ProdDate after the well identifiers)
+_SPINE_WELL_COLUMNS = [
+    'GasIDREC', 'PressuresIDREC', 'Well Name', 'Formation Producer',
+    'Layer Producer', 'Fault Block', 'Pad Name', 'Lateral Length', 'Orient'
+]
+_SPINE_COLUMNS = _SPINE_WELL_COLUMNS[:3] + ['ProdDate'] + _SPINE_WELL_COLUMNS[3:]
+
+
+def _wells_frame(rows):
+    """PCE_WM spine rows as a frame, with the two ID columns as categoricals
+
+    The spine repeats each ID once per day; as categories the joins below
+    compare integer codes instead of hashing the strings on every row.
+    """
+    wells_df = pd.DataFrame.from_records([tuple(row) for row in rows], columns=_SPINE_WELL_COLUMNS)
+    for col in ('GasIDREC', 'PressuresIDREC'):
+        wells_df[col] = wells_df[col].astype(pd.CategoricalDtype(wells_df[col].dropna().unique()))
+    # Decimal objects from pyodbc; numeric like the Snowflake columns
+    wells_df['Lateral Length'] = pd.to_numeric(wells_df['Lateral Length'], errors='coerce')
+    return wells_df
+
+
+def _month_spine(wells_df, month_start_date, month_end_date):
+    """One row per well per day of the month, wells in order, days ascending
+
+    ProdDate is datetime64 (not date objects) so the merges against the
+    Snowflake pulls join on a native column.
+    """
+    dates_df = pd.DataFrame({
+        'ProdDate': pd.date_range(start=month_start_date, end=month_end_date, freq='D')
+    })
+    return wells_df.merge(dates_df, how='cross')[_SPINE_COLUMNS]
+
+# result_df columns in _CDA_INSERT_SQL order, and the ones sent as floats
+_CDA_INSERT_COLUMNS = [
+    'GasIDREC', 'PressuresIDREC', 'Well Name', 'ProdDate',
+    'GasWH_Production', 'Condensate_WH_Production',
+    'WGR_Ratio', 'CGR_Ratio', 'ECF_Ratio',
+    'OnProdHours', 'TubingPressure', 'CasingPressure', 'ChokeSize',
+    'Gathered_Gas_Production', 'Gathered_Condensate_Production',
+    'NGL_Production', 'AllocatedWater_Rate',
+    'Formation Producer', 'Layer Producer', 'Fault Block', 'Pad Name',
+    'Lateral Length', 'Orient'
+]
+_CDA_FLOAT_COLUMNS = {
+    'GasWH_Production', 'Condensate_WH_Production',
+    'WGR_Ratio', 'CGR_Ratio', 'ECF_Ratio',
+    'OnProdHours', 'TubingPressure', 'CasingPressure', 'ChokeSize',
+    'Gathered_Gas_Production', 'Gathered_Condensate_Production',
+    'NGL_Production', 'AllocatedWater_Rate', 'Lateral Length'
+}
+
+# well_df columns in _PROD_INSERT_SQL order, and their numeric types
+_PROD_INSERT_COLUMNS = [
+    'Date', 'Days Seq', 'Day Seq UPRT', 'Well Name',
+    'Gas WH Production (10³m³)', 'Condensate WH (m³/d)',
+    'Gas S2 Production (10³m³)', 'Gas Sales Production (10³m³)',
+    'Condensate Sales (m³/d)', 'Gathered Gas (e³m³/d)',
+    'Gathered Condensate (m³/d)', 'Sales CGR (m³/e³m³)',
+    'CGR (m³/e³m³)', 'WGR (m³/e³m³)', 'ECF',
+    'Hours On', 'Tubing Pressure (kPa)', 'Casing Pressure (kPa)',
+    'Choke Size', 'Gas WH Cumulative Production (10³m³)',
+    'Gas S2 Cumulative Production (10³m³)',
+    'Gas Sales Cumulative Production (10³m³)',
+    'Condensate Sales Cumulative Production (m³)',
+    'Condensate WH Cumulative Production (m³)',
+    'Gas Gathered Cumulative (e³m³)',
+    'Condensate Gathered Cumulative (m³)',
+    'Formation Producer', 'Layer Producer', 'Fault Block',
+    'Pad Name', 'Lateral Length', 'Orientation',
+    'On Production Year', 'Alloc. Water Rate (m³)', 'NGL (m³)',
+    'Gas WH Avg (10³m³)', 'Gas S2 Avg (10³m³)',
+    'Gas Gathered Avg (e³m³/d)', 'Condensate Gathered Avg (m³/d)'
+]
+_PROD_INT_COLUMNS = {'Days Seq', 'Day Seq UPRT', 'On Production Year'}
+_PROD_FLOAT_COLUMNS = set(_PROD_INSERT_COLUMNS) - _PROD_INT_COLUMNS - {
+    'Date', 'Well Name', 'Formation Producer', 'Layer Producer',
+    'Fault Block', 'Pad Name', 'Orientation'
+}
+
+
+def _param_rows(df, columns, float_columns=(), int_columns=(), date_columns=()):
+    """Insert parameters for df, one tuple per row, in `columns` order
+
+    Each column is converted once rather than per cell: datetime columns to
+    dates, float and int columns to Python numbers, and every missing value
+    (NaN, NA, NaT) in a non-date column to None, including text columns, which
+    pandas may hold as NaN. A column missing from df is sent as all None.
+    """
+    row_count = len(df)
+    values_by_col = []
+    for col in columns:
+        if col not in df:
+            values_by_col.append([None] * row_count)
+            continue
+        values = df[col]
+        if col in date_columns:
+            values_by_col.append(values.dt.date.tolist())
+            continue
+        if col in float_columns:
+            values = values.astype(float).astype(object)
+        elif col in int_columns:
+            values = values.astype('Int64').astype(object)
+        else:
+            values = values.astype(object)
+        values_by_col.append(values.where(values.notna(), None).tolist())
+    return list(zip(*values_by_col))
+
+
+def _cda_rows(result_df):
+    """PCE_CDA insert parameters for result_df, one tuple per row"""
+    return _param_rows(result_df, _CDA_INSERT_COLUMNS, _CDA_FLOAT_COLUMNS,
+                       date_columns={'ProdDate'})
+
+
+def _join_sources(result_df, key_col, sources):
+    """Left-join prepared Snowflake frames onto result_df by (key_col, ProdDate)
+
+    `sources` is a list of (frame from prepare_df, value columns). Each frame
+    is unique on its key, so all of them are joined in one index-aligned
+    join rather than one merge each. Every value column comes back as
+    float64 (all NaN for a source that returned nothing), so the column
+    arithmetic and the insert work on plain numeric blocks.
+    """
+    keys = [key_col, 'ProdDate']
+    indexed = []
+    empty_cols = []
+    all_value_cols = []
+    for frame, value_cols in sources:
+        all_value_cols.extend(value_cols)
+        if frame.empty:
+            empty_cols.extend(value_cols)
+        else:
+            # prepare_df always names the ID column GasIDREC
+            frame = frame.rename(columns={'GasIDREC': key_col})
+            if isinstance(result_df[key_col].dtype, pd.CategoricalDtype):
+                # Same categories as the spine; IDs of wells not on the
+                # spine become NaN and are dropped so they can't pair with
+                # wells whose ID is missing
+                frame[key_col] = frame[key_col].astype(result_df[key_col].dtype)
+                frame = frame[frame[key_col].notna()]
+            indexed.append(frame.set_index(keys))
+
+    if indexed:
+        columns = list(result_df.columns)
+        result_df = result_df.set_index(keys).join(indexed, how='left').reset_index()
+        # Back to the spine's column order, joined columns after it
+        result_df = result_df[columns + [c for c in result_df.columns if c not in columns]]
+    for col in empty_cols:
+        result_df[col] = np.nan
+    result_df[all_value_cols] = result_df[all_value_cols].astype('float64')
+    return result_df
+
+
+class _LogBuffer:
+    """Collects log lines and hands them to `log_callback` (or print) as one
+    newline-joined message every `max_lines` lines, from a timer `max_delay`
+    seconds after the first line of a batch, or on flush(). The timer keeps
+    lines logged just before a long execute from waiting for it to finish."""
+
+    def __init__(self, log_callback, max_lines=32, max_delay=0.2):
+        self.emit = log_callback or print
+        self.max_lines = max_lines
+        self.max_delay = max_delay
+        self.lines = []
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def __call__(self, message):
+        with self._lock:
+            self.lines.append(message)
+            if len(self.lines) < self.max_lines:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.max_delay, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.flush()
+
+    def flush(self):
+        # Emit under the lock so timer and caller flushes stay in order
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self.lines:
+                self.emit("\n".join(self.lines))
+                self.lines = []
+
+
+def run_prodview_update(start_month, end_month, progress_callback=None, log_callback=None,
+                        months_per_commit=1):
     """
     Update production data from Snowflake for a range of months
     
@@ -14,19 +380,23 @@ def run_prodview_update(start_month, end_month, progress_callback=None, log_call
         end_month: End month in format "MMM YYYY" (e.g., "Feb 2026")
         progress_callback: Function to call with progress percentage (0-100)
         log_callback: Function to call with log messages
+        months_per_commit: Months of delete + CDA + Production work committed
+            together as one transaction
     
     Returns:
         dict: Summary statistics
     """
     
-    def log(message):
-        if log_callback:
-            log_callback(message)
-        else:
-            print(message)
+    log = _LogBuffer(log_callback)
     
+    last_progress = -1
+
     def progress(value):
-        if progress_callback:
+        # Only forward a percentage that has actually moved; the per-well
+        # loops call this far more often than the integer value changes
+        nonlocal last_progress
+        if progress_callback and value != last_progress:
+            last_progress = value
             progress_callback(value)
     
     log("\n" + "="*60)
@@ -72,33 +442,17 @@ def run_prodview_update(start_month, end_month, progress_callback=None, log_call
               AND ([Exception] IS NULL OR [Exception] = '' OR [Exception] = 'N')
         """)
         
-        mapping_rows = cursor.fetchall()
-        mapping = []
-        for row in mapping_rows:
-            mapping.append({
-                'gas_idrec': row[0],
-                'pressures_idrec': row[1],
-                'well_name': row[2],
-                'formation': row[3],
-                'layer': row[4],
-                'fault_block': row[5],
-                'pad_name': row[6],
-                'lateral_length': row[7],
-                'orient': row[8]
-            })
-        log(f"   Loaded {len(mapping)} wells")
+        # One frame of well attributes, crossed with each month's days below
+        wells_df = _wells_frame(cursor.fetchall())
+        log(f"   Loaded {len(wells_df)} wells")
         
-        # Generate list of months to process
-        current = start_date
-        months_to_process = []
-        while current <= end_date:
-            months_to_process.append(current)
-            if current.month == 12:
-                current = current.replace(year=current.year + 1, month=1)
-            else:
-                current = current.replace(month=current.month + 1)
+        # Month starts in range and their matching month ends
+        month_starts = pd.date_range(start_date, end_date, freq='MS')
+        month_ends = month_starts + pd.offsets.MonthEnd(0)
+        # (name, first day, last day) of every month, formatted in one pass
+        month_info = list(zip(month_starts.strftime('%B %Y'), month_starts.date, month_ends.date))
         
-        total_months = len(months_to_process)
+        total_months = len(month_info)
         log(f"Found {total_months} months to process")
         
         if total_months == 0:
@@ -116,24 +470,15 @@ def run_prodview_update(start_month, end_month, progress_callback=None, log_call
         total_production_records = 0
         
         # Process each month
-        for month_idx, month_date in enumerate(months_to_process):
-            month_start = month_date.replace(day=1)
-            month_name = month_start.strftime('%B %Y')
-            
-            # Calculate month end
-            if month_start.month == 12:
-                month_end = datetime(month_start.year + 1, 1, 1) - timedelta(days=1)
-            else:
-                month_end = datetime(month_start.year, month_start.month + 1, 1) - timedelta(days=1)
-            
-            month_start_date = month_start.date()
-            month_end_date = month_end.date()
+        for month_idx, (month_name, month_start_date, month_end_date) in enumerate(month_info):
             days_in_month = (month_end_date - month_start_date).days + 1
             
             log(f"\nProcessing {month_name} ({month_idx + 1}/{total_months})...")
             
             # Pull data from Snowflake
             
+            # The pulls take a while; show this month's header first
+            log.flush()
             sf = SnowflakeConnector()
             
             # Pull ECF data
@@ -146,7 +491,6 @@ def run_prodview_update(start_month, end_month, progress_callback=None, log_call
             WHERE DTTM >= '{month_start_date}'
               AND DTTM <= '{month_end_date}'
             """
-            ecf_df = sf.query(ecf_query)
             
             # Pull GasWH data
             gaswh_query = f"""
@@ -159,7 +503,6 @@ def run_prodview_update(start_month, end_month, progress_callback=None, log_call
             WHERE DTTM >= '{month_start_date}'
               AND DTTM <= '{month_end_date}'
             """
-            gaswh_df = sf.query(gaswh_query)
             
             # Pull CGR data
             cgr_query = f"""
@@ -174,7 +517,6 @@ def run_prodview_update(start_month, end_month, progress_callback=None, log_call
             WHERE DTTM >= '{month_start_date}'
               AND DTTM <= '{month_end_date}'
             """
-            cgr_df = sf.query(cgr_query)
             
             # Pull WGR data
             wgr_query = f"""
@@ -186,7 +528,6 @@ def run_prodview_update(start_month, end_month, progress_callback=None, log_call
             WHERE DTTM >= '{month_start_date}'
               AND DTTM <= '{month_end_date}'
             """
-            wgr_df = sf.query(wgr_query)
             
             # Pull Pressures data
             pressures_query = f"""
@@ -200,7 +541,6 @@ def run_prodview_update(start_month, end_month, progress_callback=None, log_call
             WHERE DTTM >= '{month_start_date}'
               AND DTTM <= '{month_end_date}'
             """
-            pressures_df = sf.query(pressures_query)
             
             # Pull Allocations data
             alloc_query = f"""
@@ -214,7 +554,6 @@ def run_prodview_update(start_month, end_month, progress_callback=None, log_call
             WHERE DTTM >= '{month_start_date}'
               AND DTTM <= '{month_end_date}'
             """
-            alloc_df = sf.query(alloc_query)
             
             # Pull Allocated Water data
             water_query = f"""
@@ -226,259 +565,121 @@ def run_prodview_update(start_month, end_month, progress_callback=None, log_call
             WHERE DTTM >= '{month_start_date}'
               AND DTTM <= '{month_end_date}'
             """
-            water_df = sf.query(water_query)
+
+            # All seven run concurrently on the warehouse
+            (ecf_df, gaswh_df, cgr_df, wgr_df,
+             pressures_df, alloc_df, water_df) = sf.query_many([
+                ecf_query, gaswh_query, cgr_query, wgr_query,
+                pressures_query, alloc_query, water_query,
+            ])
             
             sf.close()
             
             total_rows = len(ecf_df) + len(gaswh_df) + len(cgr_df) + len(wgr_df) + len(pressures_df) + len(alloc_df) + len(water_df)
             log(f"Retrieved {total_rows:,} rows from Snowflake")
+
+            # Nothing to load: keep the month's existing rows rather than
+            # clearing it and inserting an all-empty spine
+            if total_rows == 0:
+                log(f"No rows from Snowflake for {month_name}, skipping")
+                months_processed += 1
+                if months_processed % months_per_commit == 0 or months_processed == total_months:
+                    conn.commit()
+                progress(int((month_idx + 1) / total_months * 100))
+                continue
             
             # Delete existing data for this month
-            cursor.execute("""
-                DELETE FROM PCE_CDA 
-                WHERE ProdDate BETWEEN ? AND ?
-            """, month_start_date, month_end_date)
-            deleted_cda = cursor.rowcount
-            
-            cursor.execute("""
-                DELETE FROM PCE_Production 
-                WHERE [Date] BETWEEN ? AND ?
-            """, month_start_date, month_end_date)
-            deleted_prod = cursor.rowcount
-            
-            conn.commit()
+            cursor.execute(_CLEAR_MONTH_SQL, month_start_date, month_end_date,
+                           month_start_date, month_end_date)
+            deleted_cda, deleted_prod = cursor.fetchone()
             
             if deleted_cda > 0 or deleted_prod > 0:
                 log(f"Cleared {deleted_cda:,} CDA and {deleted_prod:,} Production records")
             
-            # Build daily data spine
-
-            # Create date spine for each well
-            all_rows = []
-            date_range = pd.date_range(start=month_start_date, end=month_end_date, freq='D').date
+            # Build daily data spine: every well on every day of the month
+            spine_df = _month_spine(wells_df, month_start_date, month_end_date)
 
-            for well in mapping:
-                for date in date_range:
-                    all_rows.append({
-                        'GasIDREC': well['gas_idrec'],
-                        'PressuresIDREC': well['pressures_idrec'],
-                        'Well Name': well['well_name'],
-                        'ProdDate': date,
-                        'Formation Producer': well['formation'],
-                        'Layer Producer': well['layer'],
-                        'Fault Block': well['fault_block'],
-                        'Pad Name': well['pad_name'],
-                        'Lateral Length': well['lateral_length'],
-                        'Orient': well['orient']
-                    })
-
-            spine_df = pd.DataFrame(all_rows)
-
-            # Process and merge data sources
-            result_df = spine_df.copy()
+            # Process and merge data sources; the merges below return new
+            # frames, so the spine needs no copy
+            result_df = spine_df
 
             # Helper function to clean and prepare dataframes
             def prepare_df(df, id_col, date_col, value_cols):
                 if df.empty:
                     return pd.DataFrame()
                 
-                # Handle Snowflake column naming (they come back as uppercase)
-                df_clean = df.copy()
-                column_map = {col.upper(): col for col in df_clean.columns}
+                # Handle Snowflake column naming (they come back as uppercase).
+                # df is only read here, so it isn't copied.
+                column_map = {col.upper(): col for col in df.columns}
                 
                 # Map to standard names
                 result = pd.DataFrame()
-                result['GasIDREC'] = df_clean[column_map.get(id_col.upper(), id_col)].astype(str).str.strip()
-                result['ProdDate'] = pd.to_datetime(df_clean[column_map.get(date_col.upper(), date_col)]).dt.date
+                result['GasIDREC'] = df[column_map.get(id_col.upper(), id_col)].astype(str).str.strip()
+                # Midnight datetime64, matching the spine's ProdDate
+                result['ProdDate'] = pd.to_datetime(df[column_map.get(date_col.upper(), date_col)]).dt.normalize()
                 
                 for val_col in value_cols:
                     source_col = column_map.get(val_col.upper(), val_col)
-                    if source_col in df_clean.columns:
-                        result[val_col] = pd.to_numeric(df_clean[source_col], errors='coerce')
+                    if source_col in df.columns:
+                        result[val_col] = pd.to_numeric(df[source_col], errors='coerce')
                     else:
                         result[val_col] = None
                 
-                # Remove duplicates (keep last)
-                result = result.sort_values(['GasIDREC', 'ProdDate'])
-                result = result.groupby(['GasIDREC', 'ProdDate'], as_index=False).last()
+                # Remove duplicates (keep last non-null value per key). One hash
+                # pass finds whether there are any; the merges don't need the
+                # rows sorted, so a pull without duplicates is used as is.
+                if result.duplicated(['GasIDREC', 'ProdDate']).any():
+                    result = result.groupby(['GasIDREC', 'ProdDate'], as_index=False, sort=False).last()
                 
                 return result
 
-            # Process ECF
-            if not ecf_df.empty:
-                ecf_processed = prepare_df(ecf_df, 'GASIDREC', 'PRODDATE', ['ECF_Ratio'])
-                if not ecf_processed.empty:
-                    result_df = result_df.merge(ecf_processed, on=['GasIDREC', 'ProdDate'], how='left')
-                else:
-                    result_df['ECF_Ratio'] = None
-            else:
-                result_df['ECF_Ratio'] = None
-
-            # Process GasWH
-            if not gaswh_df.empty:
-                gaswh_processed = prepare_df(gaswh_df, 'GASIDREC', 'PRODDATE', ['GasWH_Production', 'OnProdHours'])
-                if not gaswh_processed.empty:
-                    result_df = result_df.merge(gaswh_processed, on=['GasIDREC', 'ProdDate'], how='left')
-                else:
-                    result_df['GasWH_Production'] = None
-                    result_df['OnProdHours'] = None
-            else:
-                result_df['GasWH_Production'] = None
-                result_df['OnProdHours'] = None
-
-            # Process CGR (uses PressuresIDREC)
-            if not cgr_df.empty:
-                cgr_processed = prepare_df(cgr_df, 'PRESSURESIDREC', 'PRODDATE', ['CGR_Ratio'])
-                if not cgr_processed.empty:
-                    cgr_processed = cgr_processed.rename(columns={'GasIDREC': 'PressuresIDREC'})
-                    result_df = result_df.merge(cgr_processed, left_on=['PressuresIDREC', 'ProdDate'], 
-                                                right_on=['PressuresIDREC', 'ProdDate'], how='left')
-                else:
-                    result_df['CGR_Ratio'] = None
-            else:
-                result_df['CGR_Ratio'] = None
-
-            # Process WGR (uses PressuresIDREC)
-            if not wgr_df.empty:
-                wgr_processed = prepare_df(wgr_df, 'PRESSURESIDREC', 'PRODDATE', ['WGR_Ratio'])
-                if not wgr_processed.empty:
-                    wgr_processed = wgr_processed.rename(columns={'GasIDREC': 'PressuresIDREC'})
-                    result_df = result_df.merge(wgr_processed, left_on=['PressuresIDREC', 'ProdDate'], 
-                                                right_on=['PressuresIDREC', 'ProdDate'], how='left')
-                else:
-                    result_df['WGR_Ratio'] = None
-            else:
-                result_df['WGR_Ratio'] = None
-
-            # Process Pressures (uses PressuresIDREC)
-            if not pressures_df.empty:
-                pressures_processed = prepare_df(pressures_df, 'PRESSURESIDREC', 'PRODDATE', 
-                                                ['TubingPressure', 'CasingPressure', 'ChokeSize'])
-                if not pressures_processed.empty:
-                    pressures_processed = pressures_processed.rename(columns={'GasIDREC': 'PressuresIDREC'})
-                    result_df = result_df.merge(pressures_processed, left_on=['PressuresIDREC', 'ProdDate'], 
-                                                right_on=['PressuresIDREC', 'ProdDate'], how='left')
-                else:
-                    result_df['TubingPressure'] = None
-                    result_df['CasingPressure'] = None
-                    result_df['ChokeSize'] = None
-            else:
-                result_df['TubingPressure'] = None
-                result_df['CasingPressure'] = None
-                result_df['ChokeSize'] = None
-
-            # Process Allocations (uses PressuresIDREC)
-            if not alloc_df.empty:
-                alloc_processed = prepare_df(alloc_df, 'PRESSURESIDREC', 'PRODDATE', 
-                                            ['Gathered_Gas_Production', 'Gathered_Condensate_Production', 'NGL_Production'])
-                if not alloc_processed.empty:
-                    alloc_processed = alloc_processed.rename(columns={'GasIDREC': 'PressuresIDREC'})
-                    result_df = result_df.merge(alloc_processed, left_on=['PressuresIDREC', 'ProdDate'], 
-                                                right_on=['PressuresIDREC', 'ProdDate'], how='left')
-                else:
-                    result_df['Gathered_Gas_Production'] = None
-                    result_df['Gathered_Condensate_Production'] = None
-                    result_df['NGL_Production'] = None
-            else:
-                result_df['Gathered_Gas_Production'] = None
-                result_df['Gathered_Condensate_Production'] = None
-                result_df['NGL_Production'] = None
-
-            # Process Allocated Water (uses PressuresIDREC)
-            if not water_df.empty:
-                water_processed = prepare_df(water_df, 'PRESSURESIDREC', 'PRODDATE', ['AllocatedWater_Rate'])
-                if not water_processed.empty:
-                    water_processed = water_processed.rename(columns={'GasIDREC': 'PressuresIDREC'})
-                    result_df = result_df.merge(water_processed, left_on=['PressuresIDREC', 'ProdDate'], 
-                                                right_on=['PressuresIDREC', 'ProdDate'], how='left')
-                else:
-                    result_df['AllocatedWater_Rate'] = None
-            else:
-                result_df['AllocatedWater_Rate'] = None
+            # Left-join every source onto the spine: ECF and GasWH by
+            # GasIDREC, the rest by PressuresIDREC
+            gas_sources = [
+                (prepare_df(ecf_df, 'GASIDREC', 'PRODDATE', ['ECF_Ratio']), ['ECF_Ratio']),
+                (prepare_df(gaswh_df, 'GASIDREC', 'PRODDATE', ['GasWH_Production', 'OnProdHours']),
+                 ['GasWH_Production', 'OnProdHours']),
+            ]
+            pressures_sources = [
+                (prepare_df(cgr_df, 'PRESSURESIDREC', 'PRODDATE', ['CGR_Ratio']), ['CGR_Ratio']),
+                (prepare_df(wgr_df, 'PRESSURESIDREC', 'PRODDATE', ['WGR_Ratio']), ['WGR_Ratio']),
+                (prepare_df(pressures_df, 'PRESSURESIDREC', 'PRODDATE',
+                            ['TubingPressure', 'CasingPressure', 'ChokeSize']),
+                 ['TubingPressure', 'CasingPressure', 'ChokeSize']),
+                (prepare_df(alloc_df, 'PRESSURESIDREC', 'PRODDATE',
+                            ['Gathered_Gas_Production', 'Gathered_Condensate_Production', 'NGL_Production']),
+                 ['Gathered_Gas_Production', 'Gathered_Condensate_Production', 'NGL_Production']),
+                (prepare_df(water_df, 'PRESSURESIDREC', 'PRODDATE', ['AllocatedWater_Rate']),
+                 ['AllocatedWater_Rate']),
+            ]
+            result_df = _join_sources(result_df, 'GasIDREC', gas_sources)
+            result_df = _join_sources(result_df, 'PressuresIDREC', pressures_sources)
 
             # Calculate Condensate_WH_Production (initial calculation)
             result_df['Condensate_WH_Production'] = result_df['GasWH_Production'] * result_df['CGR_Ratio']
 
             # Apply Gas WH replacement logic (VBA compatibility)
             if 'GasWH_Production' in result_df.columns and 'Gathered_Gas_Production' in result_df.columns:
-                gas_wh_original = result_df['GasWH_Production'].copy()
-                gathered_gas = result_df['Gathered_Gas_Production'].copy()
-                replacement_count = 0
-                
-                for idx in result_df.index:
-                    gas_val = gas_wh_original[idx]
-                    gathered_val = gathered_gas[idx] if pd.notna(gathered_gas[idx]) else None
-                    
-                    if gathered_val is None or pd.isna(gathered_val):
-                        continue
-                    
-                    if pd.notna(gas_val) and gas_val <= 2 and gas_val > 0:
-                        result_df.at[idx, 'GasWH_Production'] = gathered_val
-                        replacement_count += 1
-                    elif pd.isna(gas_val) or gas_val == 0:
-                        result_df.at[idx, 'GasWH_Production'] = gathered_val
-                        replacement_count += 1
+                gas_wh = result_df['GasWH_Production']
+                gathered_gas = result_df['Gathered_Gas_Production']
+                # Gathered gas replaces a missing GasWH value or one in [0, 2]
+                replace = gathered_gas.notna() & (gas_wh.isna() | gas_wh.between(0, 2))
+                result_df['GasWH_Production'] = gas_wh.mask(replace, gathered_gas)
                 
                 result_df['Condensate_WH_Production'] = result_df['GasWH_Production'] * result_df['CGR_Ratio']
             
             # Insert into PCE_CDA
-
-            insert_sql = """
-            INSERT INTO PCE_CDA (
-                [GasIDREC], [PressuresIDREC], [Well Name], [ProdDate],
-                [GasWH_Production], [Condensate_WH_Production],
-                [WGR_Ratio], [CGR_Ratio], [ECF_Ratio],
-                [OnProdHours], [TubingPressure], [CasingPressure], [ChokeSize],
-                [Gathered_Gas_Production], [Gathered_Condensate_Production],
-                [NGL_Production], [AllocatedWater_Rate],
-                [Formation Producer], [Layer Producer], [Fault Block], [Pad Name],
-                [Lateral Length], [Orient]
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-
             rows_inserted = 0
-            batch_size = 1000
-            rows_batch = []
-
-            for _, row in result_df.iterrows():
-                rows_batch.append((
-                    row.get('GasIDREC'),
-                    row.get('PressuresIDREC'),
-                    row.get('Well Name'),
-                    row.get('ProdDate'),
-                    None if pd.isna(row.get('GasWH_Production')) else float(row.get('GasWH_Production')),
-                    None if pd.isna(row.get('Condensate_WH_Production')) else float(row.get('Condensate_WH_Production')),
-                    None if pd.isna(row.get('WGR_Ratio')) else float(row.get('WGR_Ratio')),
-                    None if pd.isna(row.get('CGR_Ratio')) else float(row.get('CGR_Ratio')),
-                    None if pd.isna(row.get('ECF_Ratio')) else float(row.get('ECF_Ratio')),
-                    None if pd.isna(row.get('OnProdHours')) else float(row.get('OnProdHours')),
-                    None if pd.isna(row.get('TubingPressure')) else float(row.get('TubingPressure')),
-                    None if pd.isna(row.get('CasingPressure')) else float(row.get('CasingPressure')),
-                    None if pd.isna(row.get('ChokeSize')) else float(row.get('ChokeSize')),
-                    None if pd.isna(row.get('Gathered_Gas_Production')) else float(row.get('Gathered_Gas_Production')),
-                    None if pd.isna(row.get('Gathered_Condensate_Production')) else float(row.get('Gathered_Condensate_Production')),
-                    None if pd.isna(row.get('NGL_Production')) else float(row.get('NGL_Production')),
-                    None if pd.isna(row.get('AllocatedWater_Rate')) else float(row.get('AllocatedWater_Rate')),
-                    row.get('Formation Producer'),
-                    row.get('Layer Producer'),
-                    row.get('Fault Block'),
-                    row.get('Pad Name'),
-                    None if pd.isna(row.get('Lateral Length')) else float(row.get('Lateral Length')),
-                    row.get('Orient')
-                ))
-                
-                if len(rows_batch) >= batch_size:
-                    cursor.executemany(insert_sql, rows_batch)
-                    rows_inserted += len(rows_batch)
-                    rows_batch = []
-                    log(f"    Inserted batch of {batch_size} rows...")
+            batch_size = 10_000
+            cda_rows = _cda_rows(result_df)
 
-            # Insert remaining rows
-            if rows_batch:
-                cursor.executemany(insert_sql, rows_batch)
+            for start in range(0, len(cda_rows), batch_size):
+                rows_batch = cda_rows[start:start + batch_size]
+                cursor.executemany(_CDA_INSERT_SQL, rows_batch)
                 rows_inserted += len(rows_batch)
+                if len(rows_batch) == batch_size:
+                    log(f"    Inserted batch of {batch_size} rows...")
 
-            conn.commit()
             total_cda_records += rows_inserted
             log(f"Inserted {rows_inserted:,} records into PCE_CDA")
 
@@ -488,55 +689,16 @@ def run_prodview_update(start_month, end_month, progress_callback=None, log_call
             log("  Updating PCE_Production...")
 
             # Insert with temporary sequence values
-            cursor.execute("""
-                INSERT INTO PCE_Production (
-                    [Date], [Well Name],
-                    [Days Seq], [Day Seq UPRT],
-                    [Gas WH Production (10³m³)], [Condensate WH (m³/d)],
-                    [Gas S2 Production (10³m³)], [Gas Sales Production (10³m³)],
-                    [Condensate Sales (m³/d)], [Gathered Gas (e³m³/d)],
-                    [Gathered Condensate (m³/d)], [Sales CGR (m³/e³m³)],
-                    [CGR (m³/e³m³)], [WGR (m³/e³m³)], [ECF],
-                    [Hours On], [Tubing Pressure (kPa)], [Casing Pressure (kPa)],
-                    [Choke Size], 
-                    [Alloc. Water Rate (m³)], [NGL (m³)],
-                    [Formation Producer], [Layer Producer], [Fault Block],
-                    [Pad Name], [Lateral Length], [Orientation]
-                )
-                SELECT 
-                    c.ProdDate,
-                    c.[Well Name],
-                    0, 0,  -- Temporary sequence values
-                    c.GasWH_Production,
-                    c.Condensate_WH_Production,
-                    c.[Gas - S2 Production],
-                    c.[Gas - Sales Production],
-                    c.[Condensate - Sales Production],
-                    c.Gathered_Gas_Production,
-                    c.Gathered_Condensate_Production,
-                    c.[Sales CGR Ratio],
-                    c.CGR_Ratio,
-                    c.WGR_Ratio,
-                    c.ECF_Ratio,
-                    c.OnProdHours,
-                    c.TubingPressure,
-                    c.CasingPressure,
-                    c.ChokeSize,
-                    c.AllocatedWater_Rate,
-                    c.NGL_Production,
-                    c.[Formation Producer],
-                    c.[Layer Producer],
-                    c.[Fault Block],
-                    c.[Pad Name],
-                    c.[Lateral Length],
-                    c.Orient
-                FROM PCE_CDA c
-                WHERE c.ProdDate BETWEEN ? AND ?
-            """, month_start_date, month_end_date)
+            cursor.execute(_COPY_MONTH_TO_PROD_SQL, month_start_date, month_end_date)
 
             prod_inserted = cursor.rowcount
-            conn.commit()
             total_production_records += prod_inserted
+            months_processed += 1
+
+            # The month's delete and inserts commit together, so a failure
+            # never leaves a month cleared but not reloaded
+            if months_processed % months_per_commit == 0 or months_processed == total_months:
+                conn.commit()
             
             # Update overall progress
             progress_percent = int((month_idx + 1) / total_months * 100)
@@ -551,52 +713,11 @@ def run_prodview_update(start_month, end_month, progress_callback=None, log_call
         
         affected_wells = [row[0] for row in cursor.fetchall()]
         log(f"\nRecalculating sequences for {len(affected_wells)} wells...")
+        log.flush()
         
-        for well_idx, well_name in enumerate(affected_wells):
-            
-            # Get all dates for this well in order
-            cursor.execute("""
-                SELECT ProdDate, GasWH_Production
-                FROM PCE_CDA
-                WHERE [Well Name] = ?
-                ORDER BY ProdDate
-            """, well_name)
-            
-            well_data = cursor.fetchall()
-            
-            # Calculate Days Seq (simple counter)
-            days_seq = list(range(1, len(well_data) + 1))
-            
-            # Calculate Day Seq UPRT (repeats when production < 1)
-            day_seq_uprt = []
-            counter = 1
-            i = 0
-            gas_wh_values = [row[1] or 0 for row in well_data]
-            
-            while i < len(gas_wh_values):
-                day_seq_uprt.append(counter)
-                
-                if gas_wh_values[i] >= 1:
-                    counter += 1
-                    i += 1
-                else:
-                    j = i + 1
-                    while j < len(gas_wh_values) and gas_wh_values[j] < 1:
-                        day_seq_uprt.append(counter)
-                        j += 1
-                    i = j
-                    counter += 1
-            
-            # Update PCE_Production with sequence numbers
-            for idx, (date, _) in enumerate(well_data):
-                cursor.execute("""
-                    UPDATE PCE_Production
-                    SET [Days Seq] = ?,
-                        [Day Seq UPRT] = ?
-                    WHERE [Well Name] = ? AND [Date] = ?
-                """, days_seq[idx], day_seq_uprt[idx], well_name, date)
-            
-            conn.commit()
+        # One set-based UPDATE for every affected well
+        cursor.execute(_SET_SEQUENCES_SQL, start_date.date(), end_date.date())
+        conn.commit()
         
         conn.close()
         
@@ -624,6 +745,8 @@ def run_prodview_update(start_month, end_month, progress_callback=None, log_call
         import traceback
         log(traceback.format_exc())
         return {"error": error_msg}
+    finally:
+        log.flush()
 
 
 def run_quick_update(start_month, end_month, progress_callback=None, log_callback=None):
@@ -643,14 +766,16 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
         dict: Summary statistics
     """
     
-    def log(message):
-        if log_callback:
-            log_callback(message)
-        else:
-            print(message)
+    log = _LogBuffer(log_callback)
     
+    last_progress = -1
+
     def progress(value):
-        if progress_callback:
+        # Only forward a percentage that has actually moved; the per-well
+        # loops call this far more often than the integer value changes
+        nonlocal last_progress
+        if progress_callback and value != last_progress:
+            last_progress = value
             progress_callback(value)
     
     log("\n" + "="*80)
@@ -713,33 +838,17 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
               AND ([Exception] IS NULL OR [Exception] = '' OR [Exception] = 'N')
         """)
         
-        mapping_rows = cursor.fetchall()
-        mapping = []
-        for row in mapping_rows:
-            mapping.append({
-                'gas_idrec': row[0],
-                'pressures_idrec': row[1],
-                'well_name': row[2],
-                'formation': row[3],
-                'layer': row[4],
-                'fault_block': row[5],
-                'pad_name': row[6],
-                'lateral_length': row[7],
-                'orient': row[8]
-            })
-        log(f"   Loaded {len(mapping)} wells")
+        # One frame of well attributes, crossed with each month's days below
+        wells_df = _wells_frame(cursor.fetchall())
+        log(f"   Loaded {len(wells_df)} wells")
         
-        # Generate list of months to process
-        current = start_date_first
-        months_to_process = []
-        while current <= end_date_last:
-            months_to_process.append(current)
-            if current.month == 12:
-                current = current.replace(year=current.year + 1, month=1)
-            else:
-                current = current.replace(month=current.month + 1)
+        # Month starts in range and their matching month ends
+        month_starts = pd.date_range(start_date_first, end_date_last, freq='MS')
+        month_ends = month_starts + pd.offsets.MonthEnd(0)
+        # (name, first day, last day) of every month, formatted in one pass
+        month_info = list(zip(month_starts.strftime('%B %Y'), month_starts.date, month_ends.date))
         
-        total_months = len(months_to_process)
+        total_months = len(month_info)
         log(f"Found {total_months} months to process")
         
         if total_months == 0:
@@ -756,18 +865,7 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
         total_cda_records = 0
         
         # Process each month (same as run_prodview_update for PCE_CDA updates)
-        for month_idx, month_date in enumerate(months_to_process):
-            month_start = month_date.replace(day=1)
-            month_name = month_start.strftime('%B %Y')
-            
-            # Calculate month end
-            if month_start.month == 12:
-                month_end = datetime(month_start.year + 1, 1, 1) - timedelta(days=1)
-            else:
-                month_end = datetime(month_start.year, month_start.month + 1, 1) - timedelta(days=1)
-            
-            month_start_date = month_start.date()
-            month_end_date = month_end.date()
+        for month_idx, (month_name, month_start_date, month_end_date) in enumerate(month_info):
             
             log(f"\n{'='*60}")
             log(f"Processing {month_name}...")
@@ -787,6 +885,8 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
             start_date_str = month_start_date.strftime('%Y-%m-%d')
             end_date_str = month_end_date.strftime('%Y-%m-%d')
             
+            # The pulls take a while; show this month's header first
+            log.flush()
             sf = SnowflakeConnector()
             
             try:
@@ -800,7 +900,6 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
                 WHERE DTTM >= '{start_date_str}'
                   AND DTTM <= '{end_date_str}'
                 """
-                ecf_df = sf.query(ecf_query)
             
                 gaswh_query = f"""
                 SELECT
@@ -812,7 +911,6 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
                 WHERE DTTM >= '{start_date_str}'
                   AND DTTM <= '{end_date_str}'
                 """
-                gaswh_df = sf.query(gaswh_query)
                 
                 cgr_query = f"""
                 SELECT
@@ -826,7 +924,6 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
                 WHERE DTTM >= '{start_date_str}'
                   AND DTTM <= '{end_date_str}'
                 """
-                cgr_df = sf.query(cgr_query)
                 
                 wgr_query = f"""
                 SELECT
@@ -837,7 +934,6 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
                 WHERE DTTM >= '{start_date_str}'
                   AND DTTM <= '{end_date_str}'
                 """
-                wgr_df = sf.query(wgr_query)
                 
                 pressures_query = f"""
                 SELECT
@@ -850,7 +946,6 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
                 WHERE DTTM >= '{start_date_str}'
                   AND DTTM <= '{end_date_str}'
                 """
-                pressures_df = sf.query(pressures_query)
                 
                 alloc_query = f"""
                 SELECT
@@ -863,7 +958,6 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
                 WHERE DTTM >= '{start_date_str}'
                   AND DTTM <= '{end_date_str}'
                 """
-                alloc_df = sf.query(alloc_query)
                 
                 water_query = f"""
                 SELECT
@@ -874,7 +968,13 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
                 WHERE DTTM >= '{start_date_str}'
                   AND DTTM <= '{end_date_str}'
                 """
-                water_df = sf.query(water_query)
+
+                # All seven run concurrently on the warehouse
+                (ecf_df, gaswh_df, cgr_df, wgr_df,
+                 pressures_df, alloc_df, water_df) = sf.query_many([
+                    ecf_query, gaswh_query, cgr_query, wgr_query,
+                    pressures_query, alloc_query, water_query,
+                ])
             except Exception as e:
                 sf.close()
                 log(f"❌ Error pulling data from Snowflake: {e}")
@@ -889,23 +989,24 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
             log(f"    Pressures: {len(pressures_df)} rows")
             log(f"    Allocations: {len(alloc_df)} rows")
             log(f"    Water: {len(water_df)} rows")
+
+            # Nothing to load: keep the month's existing rows rather than
+            # clearing it and inserting an all-empty spine
+            if (ecf_df.empty and gaswh_df.empty and cgr_df.empty and wgr_df.empty
+                    and pressures_df.empty and alloc_df.empty and water_df.empty):
+                log(f"  No rows from Snowflake for {month_name}, skipping")
+                months_processed += 1
+                progress(int((month_idx + 1) / total_months * 80))
+                continue
             
             # Delete existing data for this month
             log("  Clearing existing data for month...")
             
             try:
-                cursor.execute("""
-                    DELETE FROM PCE_CDA 
-                    WHERE ProdDate BETWEEN ? AND ?
-                """, month_start_date, month_end_date)
-                deleted_cda = cursor.rowcount
+                cursor.execute(_CLEAR_MONTH_SQL, month_start_date, month_end_date,
+                               month_start_date, month_end_date)
+                deleted_cda, deleted_prod = cursor.fetchone()
                 log(f"    Deleted {deleted_cda} records from PCE_CDA")
-                
-                cursor.execute("""
-                    DELETE FROM PCE_Production 
-                    WHERE [Date] BETWEEN ? AND ?
-                """, month_start_date, month_end_date)
-                deleted_prod = cursor.rowcount
                 log(f"    Deleted {deleted_prod} records from PCE_Production")
                 
                 conn.commit()
@@ -917,147 +1018,60 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
             # Build spine and merge data (same as run_prodview_update)
             log("  Building daily data spine...")
             
-            all_rows = []
-            date_range = pd.date_range(start=month_start_date, end=month_end_date, freq='D').date
-            
-            for well in mapping:
-                for date in date_range:
-                    all_rows.append({
-                        'GasIDREC': well['gas_idrec'],
-                        'PressuresIDREC': well['pressures_idrec'],
-                        'Well Name': well['well_name'],
-                        'ProdDate': date,
-                        'Formation Producer': well['formation'],
-                        'Layer Producer': well['layer'],
-                        'Fault Block': well['fault_block'],
-                        'Pad Name': well['pad_name'],
-                        'Lateral Length': well['lateral_length'],
-                        'Orient': well['orient']
-                    })
-            
-            spine_df = pd.DataFrame(all_rows)
+            spine_df = _month_spine(wells_df, month_start_date, month_end_date)
             log(f"    Created spine with {len(spine_df)} rows")
             
             # Process and merge each data source (same helper function as run_prodview_update)
             log("  Processing and merging data sources...")
             
-            result_df = spine_df.copy()
+            result_df = spine_df
             
             def prepare_df(df, id_col, date_col, value_cols):
                 if df.empty:
                     return pd.DataFrame()
                 
-                df_clean = df.copy()
-                column_map = {col.upper(): col for col in df_clean.columns}
+                column_map = {col.upper(): col for col in df.columns}
                 
                 result = pd.DataFrame()
-                result['GasIDREC'] = df_clean[column_map.get(id_col.upper(), id_col)].astype(str).str.strip()
-                result['ProdDate'] = pd.to_datetime(df_clean[column_map.get(date_col.upper(), date_col)]).dt.date
+                result['GasIDREC'] = df[column_map.get(id_col.upper(), id_col)].astype(str).str.strip()
+                # Midnight datetime64, matching the spine's ProdDate
+                result['ProdDate'] = pd.to_datetime(df[column_map.get(date_col.upper(), date_col)]).dt.normalize()
                 
                 for val_col in value_cols:
                     source_col = column_map.get(val_col.upper(), val_col)
-                    if source_col in df_clean.columns:
-                        result[val_col] = pd.to_numeric(df_clean[source_col], errors='coerce')
+                    if source_col in df.columns:
+                        result[val_col] = pd.to_numeric(df[source_col], errors='coerce')
                     else:
                         result[val_col] = None
                 
-                result = result.sort_values(['GasIDREC', 'ProdDate'])
-                result = result.groupby(['GasIDREC', 'ProdDate'], as_index=False).last()
+                # Same dedup as run_prodview_update: only when there are duplicates
+                if result.duplicated(['GasIDREC', 'ProdDate']).any():
+                    result = result.groupby(['GasIDREC', 'ProdDate'], as_index=False, sort=False).last()
                 
                 return result
             
             # Merge all data sources (same as run_prodview_update)
-            log("    Merging ECF data...")
-            if not ecf_df.empty:
-                ecf_processed = prepare_df(ecf_df, 'GASIDREC', 'PRODDATE', ['ECF_Ratio'])
-                if not ecf_processed.empty:
-                    result_df = result_df.merge(ecf_processed, on=['GasIDREC', 'ProdDate'], how='left')
-                else:
-                    result_df['ECF_Ratio'] = None
-            else:
-                result_df['ECF_Ratio'] = None
-            log("    Merging GasWH data...")
-            
-            if not gaswh_df.empty:
-                gaswh_processed = prepare_df(gaswh_df, 'GASIDREC', 'PRODDATE', ['GasWH_Production', 'OnProdHours'])
-                if not gaswh_processed.empty:
-                    result_df = result_df.merge(gaswh_processed, on=['GasIDREC', 'ProdDate'], how='left')
-                else:
-                    result_df['GasWH_Production'] = None
-                    result_df['OnProdHours'] = None
-            else:
-                result_df['GasWH_Production'] = None
-                result_df['OnProdHours'] = None
-            log("    Merging CGR data...")
-            
-            if not cgr_df.empty:
-                cgr_processed = prepare_df(cgr_df, 'PRESSURESIDREC', 'PRODDATE', ['CGR_Ratio'])
-                if not cgr_processed.empty:
-                    cgr_processed = cgr_processed.rename(columns={'GasIDREC': 'PressuresIDREC'})
-                    result_df = result_df.merge(cgr_processed, left_on=['PressuresIDREC', 'ProdDate'], 
-                                                right_on=['PressuresIDREC', 'ProdDate'], how='left')
-                else:
-                    result_df['CGR_Ratio'] = None
-            else:
-                result_df['CGR_Ratio'] = None
-            log("    Merging WGR data...")
-            
-            if not wgr_df.empty:
-                wgr_processed = prepare_df(wgr_df, 'PRESSURESIDREC', 'PRODDATE', ['WGR_Ratio'])
-                if not wgr_processed.empty:
-                    wgr_processed = wgr_processed.rename(columns={'GasIDREC': 'PressuresIDREC'})
-                    result_df = result_df.merge(wgr_processed, left_on=['PressuresIDREC', 'ProdDate'], 
-                                                right_on=['PressuresIDREC', 'ProdDate'], how='left')
-                else:
-                    result_df['WGR_Ratio'] = None
-            else:
-                result_df['WGR_Ratio'] = None
-            log("    Merging Pressures data...")
-            
-            if not pressures_df.empty:
-                pressures_processed = prepare_df(pressures_df, 'PRESSURESIDREC', 'PRODDATE', 
-                                                ['TubingPressure', 'CasingPressure', 'ChokeSize'])
-                if not pressures_processed.empty:
-                    pressures_processed = pressures_processed.rename(columns={'GasIDREC': 'PressuresIDREC'})
-                    result_df = result_df.merge(pressures_processed, left_on=['PressuresIDREC', 'ProdDate'], 
-                                                right_on=['PressuresIDREC', 'ProdDate'], how='left')
-                else:
-                    result_df['TubingPressure'] = None
-                    result_df['CasingPressure'] = None
-                    result_df['ChokeSize'] = None
-            else:
-                result_df['TubingPressure'] = None
-                result_df['CasingPressure'] = None
-                result_df['ChokeSize'] = None
-            log("    Merging Allocations data...")
-            
-            if not alloc_df.empty:
-                alloc_processed = prepare_df(alloc_df, 'PRESSURESIDREC', 'PRODDATE', 
-                                            ['Gathered_Gas_Production', 'Gathered_Condensate_Production', 'NGL_Production'])
-                if not alloc_processed.empty:
-                    alloc_processed = alloc_processed.rename(columns={'GasIDREC': 'PressuresIDREC'})
-                    result_df = result_df.merge(alloc_processed, left_on=['PressuresIDREC', 'ProdDate'], 
-                                                right_on=['PressuresIDREC', 'ProdDate'], how='left')
-                else:
-                    result_df['Gathered_Gas_Production'] = None
-                    result_df['Gathered_Condensate_Production'] = None
-                    result_df['NGL_Production'] = None
-            else:
-                result_df['Gathered_Gas_Production'] = None
-                result_df['Gathered_Condensate_Production'] = None
-                result_df['NGL_Production'] = None
-            log("    Merging Water data...")
-            
-            if not water_df.empty:
-                water_processed = prepare_df(water_df, 'PRESSURESIDREC', 'PRODDATE', ['AllocatedWater_Rate'])
-                if not water_processed.empty:
-                    water_processed = water_processed.rename(columns={'GasIDREC': 'PressuresIDREC'})
-                    result_df = result_df.merge(water_processed, left_on=['PressuresIDREC', 'ProdDate'], 
-                                                right_on=['PressuresIDREC', 'ProdDate'], how='left')
-                else:
-                    result_df['AllocatedWater_Rate'] = None
-            else:
-                result_df['AllocatedWater_Rate'] = None
+            gas_sources = [
+                (prepare_df(ecf_df, 'GASIDREC', 'PRODDATE', ['ECF_Ratio']), ['ECF_Ratio']),
+                (prepare_df(gaswh_df, 'GASIDREC', 'PRODDATE', ['GasWH_Production', 'OnProdHours']),
+                 ['GasWH_Production', 'OnProdHours']),
+            ]
+            pressures_sources = [
+                (prepare_df(cgr_df, 'PRESSURESIDREC', 'PRODDATE', ['CGR_Ratio']), ['CGR_Ratio']),
+                (prepare_df(wgr_df, 'PRESSURESIDREC', 'PRODDATE', ['WGR_Ratio']), ['WGR_Ratio']),
+                (prepare_df(pressures_df, 'PRESSURESIDREC', 'PRODDATE',
+                            ['TubingPressure', 'CasingPressure', 'ChokeSize']),
+                 ['TubingPressure', 'CasingPressure', 'ChokeSize']),
+                (prepare_df(alloc_df, 'PRESSURESIDREC', 'PRODDATE',
+                            ['Gathered_Gas_Production', 'Gathered_Condensate_Production', 'NGL_Production']),
+                 ['Gathered_Gas_Production', 'Gathered_Condensate_Production', 'NGL_Production']),
+                (prepare_df(water_df, 'PRESSURESIDREC', 'PRODDATE', ['AllocatedWater_Rate']),
+                 ['AllocatedWater_Rate']),
+            ]
+            log("    Merging ECF and GasWH data...")
+            result_df = _join_sources(result_df, 'GasIDREC', gas_sources)
+            log("    Merging CGR, WGR, Pressures, Allocations and Water data...")
+            result_df = _join_sources(result_df, 'PressuresIDREC', pressures_sources)
             
             log("    Calculating Condensate WH Production...")
             result_df['Condensate_WH_Production'] = result_df['GasWH_Production'] * result_df['CGR_Ratio']
@@ -1067,59 +1081,13 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
             log("  Inserting into PCE_CDA...")
             log(f"    Preparing {len(result_df):,} rows for insertion...")
             
-            insert_sql = """
-            INSERT INTO PCE_CDA (
-                [GasIDREC], [PressuresIDREC], [Well Name], [ProdDate],
-                [GasWH_Production], [Condensate_WH_Production],
-                [WGR_Ratio], [CGR_Ratio], [ECF_Ratio],
-                [OnProdHours], [TubingPressure], [CasingPressure], [ChokeSize],
-                [Gathered_Gas_Production], [Gathered_Condensate_Production],
-                [NGL_Production], [AllocatedWater_Rate],
-                [Formation Producer], [Layer Producer], [Fault Block], [Pad Name],
-                [Lateral Length], [Orient]
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            
             rows_inserted = 0
-            batch_size = 1000
-            rows_batch = []
-            total_rows = len(result_df)
+            batch_size = 10_000
+            cda_rows = _cda_rows(result_df)
             
-            for row_idx, row in enumerate(result_df.iterrows()):
-                _, row = row
-                rows_batch.append((
-                    row.get('GasIDREC'),
-                    row.get('PressuresIDREC'),
-                    row.get('Well Name'),
-                    row.get('ProdDate'),
-                    None if pd.isna(row.get('GasWH_Production')) else float(row.get('GasWH_Production')),
-                    None if pd.isna(row.get('Condensate_WH_Production')) else float(row.get('Condensate_WH_Production')),
-                    None if pd.isna(row.get('WGR_Ratio')) else float(row.get('WGR_Ratio')),
-                    None if pd.isna(row.get('CGR_Ratio')) else float(row.get('CGR_Ratio')),
-                    None if pd.isna(row.get('ECF_Ratio')) else float(row.get('ECF_Ratio')),
-                    None if pd.isna(row.get('OnProdHours')) else float(row.get('OnProdHours')),
-                    None if pd.isna(row.get('TubingPressure')) else float(row.get('TubingPressure')),
-                    None if pd.isna(row.get('CasingPressure')) else float(row.get('CasingPressure')),
-                    None if pd.isna(row.get('ChokeSize')) else float(row.get('ChokeSize')),
-                    None if pd.isna(row.get('Gathered_Gas_Production')) else float(row.get('Gathered_Gas_Production')),
-                    None if pd.isna(row.get('Gathered_Condensate_Production')) else float(row.get('Gathered_Condensate_Production')),
-                    None if pd.isna(row.get('NGL_Production')) else float(row.get('NGL_Production')),
-                    None if pd.isna(row.get('AllocatedWater_Rate')) else float(row.get('AllocatedWater_Rate')),
-                    row.get('Formation Producer'),
-                    row.get('Layer Producer'),
-                    row.get('Fault Block'),
-                    row.get('Pad Name'),
-                    None if pd.isna(row.get('Lateral Length')) else float(row.get('Lateral Length')),
-                    row.get('Orient')
-                ))
-                
-                if len(rows_batch) >= batch_size:
-                    cursor.executemany(insert_sql, rows_batch)
-                    rows_inserted += len(rows_batch)
-                    rows_batch = []
-            
-            if rows_batch:
-                cursor.executemany(insert_sql, rows_batch)
+            for start in range(0, len(cda_rows), batch_size):
+                rows_batch = cda_rows[start:start + batch_size]
+                cursor.executemany(_CDA_INSERT_SQL, rows_batch)
                 rows_inserted += len(rows_batch)
             
             try:
@@ -1148,6 +1116,7 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
         
         affected_wells = [row[0] for row in cursor.fetchall()]
         log(f"\nRecalculating sequences and cumulatives for {len(affected_wells)} wells...")
+        log.flush()
         
         # Fetch well mapping for name conversion
         composite_map, fallback_map = fetch_well_mapping()
@@ -1161,39 +1130,7 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
                 log(f"    Processing well {well_idx + 1}/{total_wells}: {well_name}")
             
             # Get ALL historical data for this well from PCE_CDA using pd.read_sql
-            query = """
-                SELECT 
-                    [Well Name] as Source_Well_Name,
-                    ProdDate as [Date],
-                    [GasWH_Production] as [Gas WH Production (10³m³)],
-                    [Condensate_WH_Production] as [Condensate WH (m³/d)],
-                    [Gas - S2 Production] as [Gas S2 Production (10³m³)],
-                    [Gas - Sales Production] as [Gas Sales Production (10³m³)],
-                    [Condensate - Sales Production] as [Condensate Sales (m³/d)],
-                    [Gathered_Gas_Production] as [Gathered Gas (e³m³/d)],
-                    [Gathered_Condensate_Production] as [Gathered Condensate (m³/d)],
-                    [Sales CGR Ratio] as [Sales CGR (m³/e³m³)],
-                    [CGR_Ratio] as [CGR (m³/e³m³)],
-                    [WGR_Ratio] as [WGR (m³/e³m³)],
-                    [ECF_Ratio] as [ECF],
-                    [OnProdHours] as [Hours On],
-                    [TubingPressure] as [Tubing Pressure (kPa)],
-                    [CasingPressure] as [Casing Pressure (kPa)],
-                    [ChokeSize] as [Choke Size],
-                    [AllocatedWater_Rate] as [Alloc. Water Rate (m³)],
-                    [NGL_Production] as [NGL (m³)],
-                    [Formation Producer],
-                    [Layer Producer],
-                    [Fault Block],
-                    [Pad Name],
-                    [Lateral Length],
-                    [Orient] as [Orientation]
-                FROM PCE_CDA
-                WHERE [Well Name] = ?
-                ORDER BY ProdDate
-            """
-            
-            well_df = pd.read_sql(query, conn, params=(well_name,))
+            well_df = pd.read_sql(_WELL_HISTORY_SQL, conn, params=(well_name,))
             
             if well_df.empty:
                 continue
@@ -1235,80 +1172,17 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
 
             # Delete all existing records for this well
             well_name_for_prod = well_df_update.iloc[0]['Well Name']
-            cursor.execute("""
-                DELETE FROM PCE_Production
-                WHERE [Well Name] = ?
-            """, well_name_for_prod)
+            cursor.execute(_DELETE_WELL_PROD_SQL, well_name_for_prod)
             
             # Insert updated records for full history
             prod_rows_to_insert = len(well_df_update)
-            insert_prod_sql = """
-            INSERT INTO PCE_Production (
-                [Date], [Days Seq], [Day Seq UPRT], [Well Name],
-                [Gas WH Production (10³m³)], [Condensate WH (m³/d)],
-                [Gas S2 Production (10³m³)], [Gas Sales Production (10³m³)],
-                [Condensate Sales (m³/d)], [Gathered Gas (e³m³/d)],
-                [Gathered Condensate (m³/d)], [Sales CGR (m³/e³m³)],
-                [CGR (m³/e³m³)], [WGR (m³/e³m³)], [ECF],
-                [Hours On], [Tubing Pressure (kPa)], [Casing Pressure (kPa)],
-                [Choke Size], [Gas WH Cumulative Production (10³m³)],
-                [Gas S2 Cumulative Production (10³m³)],
-                [Gas Sales Cumulative Production (10³m³)],
-                [Condensate Sales Cumulative Production (m³)],
-                [Condensate WH Cumulative Production (m³)],
-                [Gas Gathered Cumulative (e³m³)],
-                [Condensate Gathered Cumulative (m³)],
-                [Formation Producer], [Layer Producer], [Fault Block],
-                [Pad Name], [Lateral Length], [Orientation],
-                [On Production Year], [Alloc. Water Rate (m³)], [NGL (m³)],
-                [Gas WH Avg (10³m³)], [Gas S2 Avg (10³m³)],
-                [Gas Gathered Avg (e³m³/d)], [Condensate Gathered Avg (m³/d)]
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,?)
-            """
             
-            for prod_idx, row in enumerate(well_df_update.iterrows()):
-                _, row = row
-                cursor.execute(insert_prod_sql, (
-                    row['Date'],
-                    int(row['Days Seq']),
-                    int(row['Day Seq UPRT']),
-                    row['Well Name'],
-                    None if pd.isna(row['Gas WH Production (10³m³)']) else float(row['Gas WH Production (10³m³)']),
-                    None if pd.isna(row['Condensate WH (m³/d)']) else float(row['Condensate WH (m³/d)']),
-                    None if pd.isna(row['Gas S2 Production (10³m³)']) else float(row['Gas S2 Production (10³m³)']),
-                    None if pd.isna(row['Gas Sales Production (10³m³)']) else float(row['Gas Sales Production (10³m³)']),
-                    None if pd.isna(row['Condensate Sales (m³/d)']) else float(row['Condensate Sales (m³/d)']),
-                    None if pd.isna(row['Gathered Gas (e³m³/d)']) else float(row['Gathered Gas (e³m³/d)']),
-                    None if pd.isna(row['Gathered Condensate (m³/d)']) else float(row['Gathered Condensate (m³/d)']),
-                    None if pd.isna(row['Sales CGR (m³/e³m³)']) else float(row['Sales CGR (m³/e³m³)']),
-                    None if pd.isna(row['CGR (m³/e³m³)']) else float(row['CGR (m³/e³m³)']),
-                    None if pd.isna(row['WGR (m³/e³m³)']) else float(row['WGR (m³/e³m³)']),
-                    None if pd.isna(row['ECF']) else float(row['ECF']),
-                    None if pd.isna(row['Hours On']) else float(row['Hours On']),
-                    None if pd.isna(row['Tubing Pressure (kPa)']) else float(row['Tubing Pressure (kPa)']),
-                    None if pd.isna(row['Casing Pressure (kPa)']) else float(row['Casing Pressure (kPa)']),
-                    None if pd.isna(row['Choke Size']) else float(row['Choke Size']),
-                    None if pd.isna(row['Gas WH Cumulative Production (10³m³)']) else float(row['Gas WH Cumulative Production (10³m³)']),
-                    None if pd.isna(row['Gas S2 Cumulative Production (10³m³)']) else float(row['Gas S2 Cumulative Production (10³m³)']),
-                    None if pd.isna(row['Gas Sales Cumulative Production (10³m³)']) else float(row['Gas Sales Cumulative Production (10³m³)']),
-                    None if pd.isna(row['Condensate Sales Cumulative Production (m³)']) else float(row['Condensate Sales Cumulative Production (m³)']),
-                    None if pd.isna(row['Condensate WH Cumulative Production (m³)']) else float(row['Condensate WH Cumulative Production (m³)']),
-                    None if pd.isna(row['Gas Gathered Cumulative (e³m³)']) else float(row['Gas Gathered Cumulative (e³m³)']),
-                    None if pd.isna(row['Condensate Gathered Cumulative (m³)']) else float(row['Condensate Gathered Cumulative (m³)']),
-                    row['Formation Producer'],
-                    row['Layer Producer'],
-                    row['Fault Block'],
-                    row['Pad Name'],
-                    None if pd.isna(row['Lateral Length']) else float(row['Lateral Length']),
-                    row['Orientation'],
-                    int(row['On Production Year']) if pd.notna(row['On Production Year']) else None,
-                    None if pd.isna(row['Alloc. Water Rate (m³)']) else float(row['Alloc. Water Rate (m³)']),
-                    None if pd.isna(row['NGL (m³)']) else float(row['NGL (m³)']),
-                    None if pd.isna(row['Gas WH Avg (10³m³)']) else float(row['Gas WH Avg (10³m³)']),
-                    None if pd.isna(row['Gas S2 Avg (10³m³)']) else float(row['Gas S2 Avg (10³m³)']),
-                    None if pd.isna(row['Gas Gathered Avg (e³m³/d)']) else float(row['Gas Gathered Avg (e³m³/d)']),
-                    None if pd.isna(row['Condensate Gathered Avg (m³/d)']) else float(row['Condensate Gathered Avg (m³/d)'])
-                ))
+            # The well's full history as one fast_executemany batch, packed
+            # a column at a time
+            prod_rows = _param_rows(well_df_update, _PROD_INSERT_COLUMNS,
+                                    _PROD_FLOAT_COLUMNS, _PROD_INT_COLUMNS)
+            if prod_rows:
+                cursor.executemany(_PROD_INSERT_SQL, prod_rows)
             
             conn.commit()
             if (well_idx + 1) % 10 == 0 or (well_idx + 1) == total_wells:
@@ -1349,4 +1223,6 @@ def run_quick_update(start_month, end_month, progress_callback=None, log_callbac
         log(error_msg)
         import traceback
         log(traceback.format_exc())
-        return {"error": error_msg}
\ No newline at end of file
+        return {"error": error_msg}
+    finally:
+        log.flush()
\ No newline at end of file
@@ -1,42 +1,96 @@
 # sales_ratios_dialog.py
 
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from PyQt5.QtWidgets import (
-    QApplication,
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QFrame,
     QProgressBar,
-    QTextEdit,
+    QPlainTextEdit,
     QPushButton,
     QScrollArea,
     QWidget,
     QComboBox,
     QMessageBox,
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QTextCursor
-
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+
+from dialog_common import (
+    DialogCommon,
+    LogBatcher,
+    LOG_BOX_HEAVY,
+    LOG_BOX_RULE,
+    QSS_CLOSE_BUTTON,
+    QSS_DIALOG_TITLE,
+    QSS_RESULTS_TEXT,
+    QSS_RUN_BUTTON,
+    QSS_TRANSPARENT,
+    QSS_TRANSPARENT_SCROLL,
+    RESULTS_MAX_BLOCKS,
+)
 
-class SalesRatiosDialog(QDialog):
+# The update pulls in pyodbc; import it once when the dialog module loads
+# rather than on every Run click.
+try:
+    from sales_ratios_gui import run_sales_ratios_update
+except ImportError:
+    run_sales_ratios_update = None
+
+
+_QSS_INFO_TEXT = """
+    QLabel {
+        background-color: #e6f0fa;
+        border: 1px solid #d1d5db;
+        border-radius: 5px;
+        padding: 10px;
+        font-family: Consolas, monospace;
+    }
+"""
+
+_QSS_PROGRESS_BAR = """
+    QProgressBar {
+        border: 1px solid #d1d5db;
+        border-radius: 4px;
+        text-align: center;
+        height: 20px;
+    }
+    QProgressBar::chunk {
+        background-color: #0066b3;
+        border-radius: 4px;
+    }
+"""
+
+
+class SalesRatiosDialog(QDialog, DialogCommon):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("📈 Public Sales Data and Ratios")
         self.setModal(True)
-        self.setMinimumWidth(600)
-        self.setMinimumHeight(500)
-        self.worker = None
+        self.setMinimumWidth(650)
+        self.setMinimumHeight(600)
+
+        # Log lines are buffered and flushed to the results area at most
+        # every 50 ms instead of repainting once per line
+        self._log_buffer = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+
         self.initUI()
 
+        # One worker per dialog, reused for every run; signals are wired once
+        self.worker = SalesRatiosWorker("", "")
+        self.worker.log_signal.connect(self.log_result, Qt.QueuedConnection)
+        self.worker.progress_signal.connect(self.progress_bar.setValue, Qt.QueuedConnection)
+        self.worker.finished_signal.connect(self.update_finished, Qt.QueuedConnection)
+        self.worker.error_signal.connect(self.update_error, Qt.QueuedConnection)
+
     def initUI(self):
         """Initialize the sales ratios dialog UI"""
-        # Note: setWindowTitle and setModal already set in __init__
-        self.setMinimumWidth(650)
-        self.setMinimumHeight(600)
-
         # Main layout
         main_layout = QVBoxLayout(self)
 
@@ -44,25 +98,18 @@ class SalesRatiosDialog(QDialog):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setStyleSheet("QScrollArea { background-color: transparent; }")
+        scroll.setStyleSheet(QSS_TRANSPARENT_SCROLL)
 
         # Create scroll content widget
         scroll_content = QWidget()
-        scroll_content.setStyleSheet("background-color: transparent;")
+        scroll_content.setStyleSheet(QSS_TRANSPARENT)
         layout = QVBoxLayout(scroll_content)
         layout.setSpacing(15)
         layout.setContentsMargins(10, 10, 10, 10)
 
         # Title
         title = QLabel("📈 Public Sales Data and Ratios")
-        title.setStyleSheet("""
-            QLabel {
-                color: #1a4d3e;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 5px;
-            }
-        """)
+        title.setStyleSheet(QSS_DIALOG_TITLE)
         layout.addWidget(title)
 
         # Month Range Selection
@@ -72,7 +119,7 @@ class SalesRatiosDialog(QDialog):
         from_layout = QHBoxLayout()
         from_layout.addWidget(QLabel("From:"))
         self.from_combo = QComboBox()
-        self.populate_months(self.from_combo)
+        months_model = self.populate_months(self.from_combo, 60)
         from_layout.addWidget(self.from_combo)
         from_layout.addStretch()
         range_layout.addLayout(from_layout)
@@ -80,7 +127,8 @@ class SalesRatiosDialog(QDialog):
         to_layout = QHBoxLayout()
         to_layout.addWidget(QLabel("To:"))
         self.to_combo = QComboBox()
-        self.populate_months(self.to_combo)
+        # Same 60 months as From; share the model instead of building it twice
+        self.populate_months(self.to_combo, 60, months_model)
         self.to_combo.setCurrentIndex(0)
         to_layout.addWidget(self.to_combo)
         to_layout.addStretch()
@@ -105,15 +153,7 @@ class SalesRatiosDialog(QDialog):
             "  - Condensate Sales (m³/d)\n"
             "  - Sales CGR (m³/e³m³)"
         )
-        info_text.setStyleSheet("""
-            QLabel {
-                background-color: #e6f0fa;
-                border: 1px solid #d1d5db;
-                border-radius: 5px;
-                padding: 10px;
-                font-family: Consolas, monospace;
-            }
-        """)
+        info_text.setStyleSheet(_QSS_INFO_TEXT)
         info_layout.addWidget(info_text)
         info_group.layout().addLayout(info_layout)
         layout.addWidget(info_group)
@@ -121,35 +161,17 @@ class SalesRatiosDialog(QDialog):
         # Progress Bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #d1d5db;
-                border-radius: 4px;
-                text-align: center;
-                height: 20px;
-            }
-            QProgressBar::chunk {
-                background-color: #0066b3;
-                border-radius: 4px;
-            }
-        """)
+        self.progress_bar.setStyleSheet(_QSS_PROGRESS_BAR)
         layout.addWidget(self.progress_bar)
 
         # Results Area
         results_group = self.create_group("📋 Results")
-        self.results_text = QTextEdit()
+        self.results_text = QPlainTextEdit()
         self.results_text.setReadOnly(True)
+        self.results_text.setUndoRedoEnabled(False)
+        self.results_text.setMaximumBlockCount(RESULTS_MAX_BLOCKS)
         self.results_text.setMinimumHeight(180)
-        self.results_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #e6f0fa;
-                border: 1px solid #d1d5db;
-                border-radius: 5px;
-                font-family: Consolas, monospace;
-                font-size: 10pt;
-                padding: 8px;
-            }
-        """)
+        self.results_text.setStyleSheet(QSS_RESULTS_TEXT)
         results_group.layout().addWidget(self.results_text)
         layout.addWidget(results_group)
 
@@ -158,49 +180,12 @@ class SalesRatiosDialog(QDialog):
         button_layout.setSpacing(10)
 
         self.run_btn = QPushButton("▶️ Run Update")
-        self.run_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1a4d3e;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 150px;
-            }
-            QPushButton:hover {
-                background-color: #2a6b57;
-            }
-            QPushButton:pressed {
-                background-color: #0d3d2e;
-            }
-            QPushButton:disabled {
-                background-color: #a0a0a0;
-            }
-        """)
+        self.run_btn.setStyleSheet(QSS_RUN_BUTTON)
         self.run_btn.clicked.connect(self.run_update)
         button_layout.addWidget(self.run_btn)
 
         self.close_btn = QPushButton("Close")
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 150px;
-            }
-            QPushButton:hover {
-                background-color: #8a929c;
-            }
-            QPushButton:pressed {
-                background-color: #545b62;
-            }
-        """)
+        self.close_btn.setStyleSheet(QSS_CLOSE_BUTTON)
         self.close_btn.clicked.connect(self.handle_close)
         button_layout.addWidget(self.close_btn)
 
@@ -219,7 +204,7 @@ class SalesRatiosDialog(QDialog):
         Handle dialog close.
         If an update is running, optionally cancel it before closing.
         """
-        if self.worker is not None and self.worker.isRunning():
+        if self.worker.isRunning():
             reply = QMessageBox.question(
                 self,
                 "Cancel Update?",
@@ -251,7 +236,7 @@ class SalesRatiosDialog(QDialog):
     
     def closeEvent(self, event):
         """Handle window close event"""
-        if self.worker is not None and self.worker.isRunning():
+        if self.worker.isRunning():
             reply = QMessageBox.question(
                 self,
                 "Cancel Update?",
@@ -276,70 +261,19 @@ class SalesRatiosDialog(QDialog):
         
         event.accept()
 
-    def create_group(self, title):
-        """Create a styled group frame with title"""
-        group = QFrame()
-        group.setFrameShape(QFrame.StyledPanel)
-        group.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border: 1px solid #d1d5db;
-                border-radius: 5px;
-                padding: 10px;
-                margin-top: 5px;
-            }
-        """)
-
-        group_layout = QVBoxLayout(group)
-        group_layout.setSpacing(8)
-
-        title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #1a4d3e;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 0px;
-            }
-        """)
-        group_layout.addWidget(title_label)
-
-        return group
-
-    def populate_months(self, combo_box):
-        """Populate month combo box with last 60 months"""
-        current = datetime.now()
-        month_names = {
-            1: "Jan", 2: "Feb", 3: "Mar", 4: "Apr", 5: "May", 6: "Jun",
-            7: "Jul", 8: "Aug", 9: "Sep", 10: "Oct", 11: "Nov", 12: "Dec"
-        }
-
-        # Generate the last 60 distinct calendar months, oldest first
-        months = []
-        year = current.year
-        month = current.month
-        for _ in range(60):
-            months.append(f"{month_names[month]} {year}")
-            month -= 1
-            if month == 0:
-                month = 12
-                year -= 1
-
-        months.reverse()
-
-        combo_box.clear()
-        combo_box.addItems(months)
-        # Make sure full text (e.g. "Dec 2025") is visible
-        combo_box.setSizeAdjustPolicy(QComboBox.AdjustToContents)
-        combo_box.setMinimumContentsLength(10)
-
     def log_result(self, message):
-        """Add message to results area"""
-        self.results_text.append(message)
-        cursor = self.results_text.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.results_text.setTextCursor(cursor)
-        QApplication.processEvents()
+        """Queue message for the results area"""
+        self._log_buffer.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append all queued messages to the results area in one go"""
+        if not self._log_buffer:
+            return
+        # QPlainTextEdit keeps the view pinned to the bottom on append
+        self.results_text.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
     
     def format_timestamp(self):
         """Get formatted timestamp for log entries"""
@@ -360,6 +294,9 @@ class SalesRatiosDialog(QDialog):
 
     def run_update(self):
         """Run the sales ratios update in a separate thread"""
+        if self.worker.isRunning():
+            return
+
         # Confirm before running
         from_month = self.from_combo.currentText()
         to_month = self.to_combo.currentText()
@@ -389,27 +326,19 @@ class SalesRatiosDialog(QDialog):
         timestamp = self.format_timestamp()
 
         # Professional header with timestamp
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         self.log_result("|" + " " * 20 + "SALES RATIOS UPDATE" + " " * 32 + "|")
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         self.log_result(f"|  Started:     {timestamp:<54} |")
         self.log_result(f"|  From:        {from_month:<54} |")
         self.log_result(f"|  To:          {to_month:<54} |")
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         self.log_result("")
 
-        self.worker = SalesRatiosWorker(from_month, to_month)
-        self.worker.log_signal.connect(self.log_result)
-        self.worker.progress_signal.connect(self.update_progress)
-        self.worker.finished_signal.connect(self.update_finished)
-        self.worker.error_signal.connect(self.update_error)
+        self.worker.from_month = from_month
+        self.worker.to_month = to_month
         self.worker.start()
 
-    def update_progress(self, value):
-        """Update progress bar"""
-        self.progress_bar.setRange(0, 100)
-        self.progress_bar.setValue(value)
-
     def update_finished(self, summary):
         """Handle update completion"""
         self.progress_bar.setRange(0, 100)
@@ -420,15 +349,15 @@ class SalesRatiosDialog(QDialog):
 
         timestamp = self.format_timestamp()
         self.log_result("")
-        self.log_result("+" + "=" * 70 + "+")
+        self.log_result(LOG_BOX_HEAVY)
         self.log_result("|" + " " * 22 + "OPERATION COMPLETE" + " " * 30 + "|")
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         self.log_result(f"|  Completed:   {timestamp:<54} |")
         
         if summary:
-            self.log_result("+" + "-" * 70 + "+")
+            self.log_result(LOG_BOX_RULE)
             self.log_result("|  SUMMARY" + " " * 60 + "|")
-            self.log_result("+" + "-" * 70 + "+")
+            self.log_result(LOG_BOX_RULE)
             
             months = summary.get('months_processed', 0)
             wells = summary.get('wells_updated', 0)
@@ -440,11 +369,11 @@ class SalesRatiosDialog(QDialog):
             self.log_result(f"|    Wells Updated:           {wells:>10,} wells" + " " * 30 + "|")
             self.log_result(f"|    PCE_CDA Records:         {cda_records:>10,} records" + " " * 26 + "|")
             self.log_result(f"|    PCE_Production Records:  {prod_records:>10,} records" + " " * 24 + "|")
-            self.log_result("+" + "-" * 70 + "+")
+            self.log_result(LOG_BOX_RULE)
             formatted_duration = self.format_duration(duration)
             self.log_result(f"|  Duration:     {formatted_duration:<54} |")
         
-        self.log_result("+" + "=" * 70 + "+")
+        self.log_result(LOG_BOX_HEAVY)
 
     def update_error(self, error_msg):
         """Handle update error"""
@@ -455,11 +384,11 @@ class SalesRatiosDialog(QDialog):
         self.close_btn.setEnabled(True)
         timestamp = self.format_timestamp()
         self.log_result("")
-        self.log_result("+" + "=" * 70 + "+")
+        self.log_result(LOG_BOX_HEAVY)
         self.log_result("|" + " " * 24 + "OPERATION FAILED" + " " * 30 + "|")
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         self.log_result(f"|  Time:         {timestamp:<54} |")
-        self.log_result("+" + "-" * 70 + "+")
+        self.log_result(LOG_BOX_RULE)
         # Wrap error message properly
         error_lines = []
         remaining = error_msg
@@ -473,7 +402,7 @@ class SalesRatiosDialog(QDialog):
                 self.log_result(f"|  Error:        {chunk:<54} |")
             else:
                 self.log_result(f"|                {chunk:<54} |")
-        self.log_result("+" + "=" * 70 + "+")
+        self.log_result(LOG_BOX_HEAVY)
 
 
 class SalesRatiosWorker(QThread):
@@ -498,22 +427,26 @@ class SalesRatiosWorker(QThread):
             pass
 
     def run(self):
-        """Run the update"""
-        try:
-            from sales_ratios_gui import run_sales_ratios_update
+        """Run the update
 
-            def progress_callback(value):
-                self.progress_signal.emit(value)
+        Blocking calls under run_sales_ratios_update must release the GIL
+        (pyodbc's connect/execute/fetch do) so the dialog stays responsive.
+        """
+        self._cancelled = False
+        log_callback = LogBatcher(self.log_signal.emit)
 
-            def log_callback(message):
-                self.log_signal.emit(message)
+        try:
+            if run_sales_ratios_update is None:
+                self.error_signal.emit("sales_ratios_gui not available")
+                return
 
             summary = run_sales_ratios_update(
                 self.from_month,
                 self.to_month,
-                progress_callback,
+                self.progress_signal.emit,
                 log_callback
             )
+            log_callback.flush()
 
             if 'error' in summary:
                 self.error_signal.emit(summary['error'])
@@ -521,4 +454,5 @@ class SalesRatiosWorker(QThread):
                 self.finished_signal.emit(summary)
 
         except Exception as e:
-            self.error_signal.emit(str(e))
\ No newline at end of file
+            log_callback.flush()
+            self.error_signal.emit(str(e))
@@ -176,6 +176,7 @@ def run_sales_ratios_update(start_month, end_month, progress_callback=None, log_
                     month_wells_updated += 1
                     
                 except Exception as e:
+                    log(f"  Error updating {well_name}: {str(e)}")
             
             # Commit CDA updates
             conn.commit()
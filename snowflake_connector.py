@@ -5,6 +5,14 @@ from dotenv import load_dotenv
 import snowflake.connector
 import pandas as pd
 
+# fetch_pandas_all needs the connector's pandas extra (pyarrow); without it
+# results are built from fetchall() rows instead
+try:
+    import pyarrow  # noqa: F401
+    _HAVE_ARROW = True
+except ImportError:
+    _HAVE_ARROW = False
+
 class SnowflakeConnector:
     def __init__(self):
         # Always load .env from THIS folder (works no matter where you run from)
@@ -92,6 +100,49 @@ class SnowflakeConnector:
         finally:
             cur.close()
 
+    def query_many(self, sqls) -> list:
+        """
+        Submit several queries at once and return their results in order
+
+        Every query is started with execute_async before any result is
+        fetched, so they run concurrently on the warehouse instead of one
+        after another. Results come back through Arrow when pyarrow is
+        installed, so numeric columns arrive typed rather than as objects.
+
+        Args:
+            sqls: Iterable of SQL query strings
+        """
+        sqls = list(sqls)
+        conn = self.connect()
+        cur = conn.cursor()
+        try:
+            query_ids = []
+            for sql in sqls:
+                try:
+                    cur.execute_async(sql)
+                except Exception as e:
+                    error_msg = f"Snowflake query failed: {str(e)}\nQuery: {sql[:200]}..."
+                    raise RuntimeError(error_msg) from e
+                query_ids.append(cur.sfqid)
+
+            frames = []
+            for sql, query_id in zip(sqls, query_ids):
+                try:
+                    # Waits for the query to finish before fetching
+                    cur.get_results_from_sfqid(query_id)
+                    if _HAVE_ARROW:
+                        frame = cur.fetch_pandas_all()
+                    else:
+                        cols = [c[0] for c in cur.description]
+                        frame = pd.DataFrame(cur.fetchall(), columns=cols)
+                except Exception as e:
+                    error_msg = f"Snowflake query failed: {str(e)}\nQuery: {sql[:200]}..."
+                    raise RuntimeError(error_msg) from e
+                frames.append(frame)
+            return frames
+        finally:
+            cur.close()
+
     def close(self):
         if self.conn is not None:
             self.conn.close()
@@ -19,7 +19,6 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QTextCursor
-from survey_import import import_surveys
 
 
 class SurveyImportWorker(QThread):
@@ -38,6 +37,8 @@ class SurveyImportWorker(QThread):
     def run(self):
         """Run the survey import"""
         try:
+            from survey_import import import_surveys
+
             def progress_callback(value):
                 if not self._cancelled:
                     self.progress_signal.emit(value)
@@ -17,7 +17,6 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QTextCursor
-from type import import_typecurves
 
 
 class TypeCurvesImportWorker(QThread):
@@ -36,6 +35,8 @@ class TypeCurvesImportWorker(QThread):
     def run(self):
         """Run the type curves import"""
         try:
+            from type import import_typecurves
+
             def log(message):
                 if not self._cancelled:
                     self.log_signal.emit(message)
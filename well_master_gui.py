@@ -1,42 +1,286 @@
 # well_master_gui.py
 
+import json
+import os
+import re
+from collections import deque
+from functools import lru_cache
+from itertools import compress
+from operator import itemgetter
+
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QPushButton,
     QLineEdit, QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView,
-    QCheckBox, QFileDialog, QMessageBox, QWidget, QComboBox, QTextEdit
+    QCheckBox, QFileDialog, QMessageBox, QWidget, QComboBox, QTextEdit,
+    QTableView
+)
+from PyQt5.QtCore import (
+    Qt, QAbstractTableModel, QEvent, QModelIndex, QSortFilterProxyModel, QThread, QTimer,
+    pyqtSignal
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QStyledItemDelegate
-from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle, QStyleOptionButton, QStyleOptionViewItem
+from PyQt5.QtGui import QBrush, QColor
 from PyQt5.QtWidgets import QApplication
 
 
+# Bound parameters available to one statement: SQL Server's 2100 per RPC
+# call, less the statement text and parameter definitions pyodbc sends
+_MAX_PARAMS = 2098
+
+# Updatable PCE_WM columns, keyed by the field names used in update dicts
+_WM_UPDATE_FIELDS = {
+    'formation': '[Formation Producer]',
+    'layer': '[Layer Producer]',
+    'fault_block': '[Fault Block]',
+    'pad_name': '[Pad Name]',
+    'completions_tech': '[Completions Technology]',
+    'lateral_length': '[Lateral Length]',
+    'horizontal_distance_right': '[Horizontal Distance Right]',
+    'horizontal_distance_left': '[Horizontal Distance Left]',
+    'vertical_distance_above': '[Vertical Distance Above]',
+    'vertical_distance_below': '[Vertical Distance Below]',
+    'value_nav_uwi': '[Value Navigator UWI]',
+    'orient': '[Orient]',
+    'composite_name': '[Composite Name]',
+    'exception': '[Exception]',
+}
+
+
+# Keys of the get_all_wells() columns, in SELECT order
+_WELL_KEYS = (
+    'well_name',
+    'gas_idrec',
+    'pressures_idrec',
+    'formation',
+    'layer',
+    'fault_block',
+    'pad_name',
+    'completions_tech',
+    'lateral_length',
+    'value_nav_uwi',
+    'orient',
+    'composite_name',
+    'horizontal_right',
+    'horizontal_left',
+    'vertical_above',
+    'vertical_below',
+    'exception',
+)
+
+# Fields that must all be empty for a well to count as pending
+_PENDING_OTHER_KEYS = (
+    'formation',
+    'layer',
+    'fault_block',
+    'pad_name',
+    'completions_tech',
+    'value_nav_uwi',
+    'orient',
+    'composite_name',
+)
+
+# Well keys shown in Current Wells columns 1-17 (column 0 is the checkbox)
+_TABLE_KEYS = (
+    'well_name',
+    'gas_idrec',
+    'pressures_idrec',
+    'formation',
+    'layer',
+    'fault_block',
+    'pad_name',
+    'completions_tech',
+    'lateral_length',
+    'horizontal_right',
+    'horizontal_left',
+    'vertical_above',
+    'vertical_below',
+    'value_nav_uwi',
+    'orient',
+    'composite_name',
+    'exception',
+)
+
+# Pulls a well's table fields out as one tuple
+_table_fields = itemgetter(*_TABLE_KEYS)
+
+# Free-text columns of a staged row, (column, field)
+_STAGED_TEXT_FIELDS = (
+    (7, 'pad_name'),
+    (9, 'lateral_length'),
+    (10, 'horizontal_right'),
+    (11, 'horizontal_left'),
+    (12, 'vertical_above'),
+    (13, 'vertical_below'),
+    (14, 'value_nav_uwi'),
+    (17, 'exception'),
+)
+
+# Fields matched by the Current Wells search box, as _TABLE_KEYS positions
+_SEARCH_KEY_INDEXES = tuple(
+    _TABLE_KEYS.index(key) for key in (
+        'well_name', 'gas_idrec', 'pressures_idrec', 'formation',
+        'layer', 'pad_name', 'composite_name',
+    )
+)
+
+# Current Wells columns that can be edited once their row is checked
+_EDITABLE_COLUMNS = frozenset({4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 17})
+# Read-only ID / derived columns
+_LOCKED_COLUMNS = frozenset({1, 2, 3, 16})
+# Layer, Completions and Orient feed the Composite Name (column 16)
+_COMPOSITE_SOURCE_COLUMNS = frozenset({4, 5, 8, 15})
+
+_LOCKED_BG = QColor("#f0f0f0")
+_READONLY_BG = QColor("#f8f9fa")
+_EDITING_BG = QColor("#ffffff")
+_PENDING_BG = QColor("#fef3c7")
+# Item flags, combined once rather than per cell
+_READONLY_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+_CHECKABLE_FLAGS = _READONLY_FLAGS | Qt.ItemIsUserCheckable
+_EDITABLE_FLAGS = _READONLY_FLAGS | Qt.ItemIsEditable
+
+# Same locked grey as a ready-made brush for QTableWidgetItem.setBackground
+_LOCKED_BRUSH = QBrush(_LOCKED_BG)
+
+# Rows fetched per round-trip when reading PCE_WM
+_FETCH_BATCH = 500
+
+# Wells and dropdown options are cached here between dialog opens, tagged
+# with the PCE_WM fingerprint they were read at. The file is plain JSON so a
+# tampered cache can at worst show wrong wells, never run code.
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".etl_load_cache")
+_CACHE_FILE = os.path.join(_CACHE_DIR, "pce_wm.json")
+
+# PCE_WM change marker read from catalog views only, so it costs the same
+# however big the table is: row count from the partition metadata, the last
+# write SQL Server recorded against the table, and the server start time
+# (the usage stats reset on restart). Needs VIEW SERVER STATE; without it
+# the fingerprint is None and the wells are always read fresh.
+_FINGERPRINT_QUERY = """
+SELECT
+    (SELECT SUM(p.rows) FROM sys.partitions p
+     WHERE p.object_id = OBJECT_ID('PCE_WM') AND p.index_id IN (0, 1)),
+    (SELECT MAX(s.last_user_update) FROM sys.dm_db_index_usage_stats s
+     WHERE s.database_id = DB_ID() AND s.object_id = OBJECT_ID('PCE_WM')),
+    (SELECT sqlserver_start_time FROM sys.dm_os_sys_info)
+"""
+
+
+def _iter_rows(cursor):
+    """Yield result rows, fetching `cursor.arraysize` rows per round-trip"""
+    while True:
+        rows = cursor.fetchmany()
+        if not rows:
+            break
+        yield from rows
+
+
+# Columns offered as dropdowns; only known PCE_WM columns may be spliced
+# into the query below
+_DROPDOWN_FIELDS = (
+    'Formation Producer',
+    'Layer Producer',
+    'Fault Block',
+    'Completions Technology',
+    'Orient',
+)
+assert all(f"[{field}]" in _WM_UPDATE_FIELDS.values() for field in _DROPDOWN_FIELDS)
+
+# Built once: (field name, distinct value) pairs for every dropdown field
+_DROPDOWN_QUERY = "\nUNION ALL\n".join(
+    f"SELECT DISTINCT '{field}' AS field, [{field}] AS value "
+    f"FROM PCE_WM WHERE [{field}] IS NOT NULL AND [{field}] != ''"
+    for field in _DROPDOWN_FIELDS
+) + "\nORDER BY field, value"
+
+
+def _cell_text(value):
+    """Table text for a well field; None, NaN, 0 and '' all show blank"""
+    if value is None or value != value or not value:
+        return ""
+    return str(value)
+
+
+def _well_key(well_name):
+    """Match well names the way SQL Server does (case-insensitive collation,
+    trailing spaces ignored)"""
+    return str(well_name).rstrip().upper()
+
+
+# Well-name normalization patterns, compiled once
+_RE_DASH_ZERO = re.compile(r'-0(\d+)')
+_RE_LEADING_ZERO = re.compile(r'\b0+(\d+)')
+_RE_SEPARATORS = re.compile(r'[-_]+')
+_RE_WHITESPACE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=50_000)
+def normalize_well_name(name):
+    """Canonical form of a well name for duplicate checks on import"""
+    if not name or not isinstance(name, str):
+        return ""
+    normalized = name.strip()
+    normalized = _RE_DASH_ZERO.sub(r'-\1', normalized)
+    normalized = _RE_LEADING_ZERO.sub(r'\1', normalized)
+    normalized = _RE_SEPARATORS.sub('-', normalized)
+    normalized = _RE_WHITESPACE.sub(' ', normalized).strip()
+    normalized = normalized.upper()
+    return normalized
+
+
 class WellMasterDB:
     """Handles all database operations for Well Master List"""
 
+    # UPDATE statement text per (field combination, row count), reused across
+    # saves so the same string (and server plan) is sent each time
+    _update_sql = {}
+
+    @staticmethod
+    def _update_query(fields, row_count):
+        """UPDATE ... FROM (VALUES ...) setting `fields` for `row_count` wells
+
+        Each VALUES row is the field values followed by the well name.
+        """
+        key = (fields, row_count)
+        query = WellMasterDB._update_sql.get(key)
+        if query is None:
+            columns = [f"c{i}" for i in range(len(fields))]
+            set_clauses = ", ".join(
+                f"t.{_WM_UPDATE_FIELDS[field]} = v.{col}" for field, col in zip(fields, columns)
+            )
+            row = "(" + ", ".join("?" * (len(fields) + 1)) + ")"
+            query = (
+                f"UPDATE t SET {set_clauses} "
+                f"FROM PCE_WM AS t "
+                f"JOIN (VALUES {', '.join([row] * row_count)}) AS v({', '.join(columns)}, well_name) "
+                f"ON t.[Well Name] = v.well_name"
+            )
+            WellMasterDB._update_sql[key] = query
+        return query
+
     @staticmethod
     def get_all_wells():
-        """Load all wells from PCE_WM"""
-        from db_connection import get_sql_conn
+        """Load all wells from PCE_WM as a DataFrame with _WELL_KEYS columns"""
+        import pandas as pd
+        from db_connection import sql_conn
 
         try:
-            conn = get_sql_conn()
-            cursor = conn.cursor()
-
+            # Descriptive columns come back trimmed, with blanks as NULL, so the
+            # pending checks only need to test for None
             query = """
             SELECT 
                 [Well Name],
                 [GasIDREC],
                 [PressuresIDREC],
-                [Formation Producer],
-                [Layer Producer],
-                [Fault Block],
-                [Pad Name],
-                [Completions Technology],
+                NULLIF(LTRIM(RTRIM([Formation Producer])), '') AS [Formation Producer],
+                NULLIF(LTRIM(RTRIM([Layer Producer])), '') AS [Layer Producer],
+                NULLIF(LTRIM(RTRIM([Fault Block])), '') AS [Fault Block],
+                NULLIF(LTRIM(RTRIM([Pad Name])), '') AS [Pad Name],
+                NULLIF(LTRIM(RTRIM([Completions Technology])), '') AS [Completions Technology],
                 [Lateral Length],
-                [Value Navigator UWI],
-                [Orient],
-                [Composite Name],
+                NULLIF(LTRIM(RTRIM([Value Navigator UWI])), '') AS [Value Navigator UWI],
+                NULLIF(LTRIM(RTRIM([Orient])), '') AS [Orient],
+                NULLIF(LTRIM(RTRIM([Composite Name])), '') AS [Composite Name],
                 [Horizontal Distance Right],
                 [Horizontal Distance Left],
                 [Vertical Distance Above],
@@ -47,77 +291,40 @@ class WellMasterDB:
             ORDER BY [Well Name]
             """
 
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            conn.close()
-
-            # Convert to list of dicts
-            wells = []
-            for row in rows:
-                # Map SQL columns to dictionary keys
-                exception_val = row[16]
-                if exception_val is None or str(exception_val).strip() == "":
-                    exception_val = "N"
-                else:
-                    exception_val = str(exception_val).strip().upper()
-
-                well = {
-                    'well_name': row[0],
-                    'gas_idrec': row[1],
-                    'pressures_idrec': row[2],
-                    'formation': row[3],
-                    'layer': row[4],
-                    'fault_block': row[5],
-                    'pad_name': row[6],
-                    'completions_tech': row[7],
-                    'lateral_length': row[8],
-                    'value_nav_uwi': row[9],
-                    'orient': row[10],
-                    'composite_name': row[11],
-                    'horizontal_right': row[12],
-                    'horizontal_left': row[13],
-                    'vertical_above': row[14],
-                    'vertical_below': row[15],
-                    'exception': exception_val,
-                }
-                wells.append(well)
+            # pandas builds the columns directly from each fetched chunk;
+            # numeric columns come back as float64 with NaN for NULL
+            with sql_conn() as conn:
+                chunks = pd.read_sql(query, conn, coerce_float=True, chunksize=_FETCH_BATCH)
+                wells = pd.concat(list(chunks), ignore_index=True)
+            wells.columns = list(_WELL_KEYS)
+
+            # Blank Exception means "N"
+            exception = wells['exception']
+            blank = exception.isna() | (exception.astype(str).str.strip() == "")
+            wells['exception'] = exception.astype(str).str.strip().str.upper().where(~blank, "N")
 
             return wells
 
         except Exception as e:
             print(f"Error loading wells: {e}")
-            return []
+            return pd.DataFrame(columns=_WELL_KEYS, dtype=object)
 
     @staticmethod
     def get_dropdown_options():
         """Get unique values for dropdown fields"""
-        from db_connection import get_sql_conn
-
-        options = {}
-        fields = [
-            'Formation Producer',
-            'Layer Producer',
-            'Fault Block',
-            'Completions Technology',
-            'Orient'
-        ]
+        from db_connection import sql_conn
+
+        options = {field: [] for field in _DROPDOWN_FIELDS}
 
         try:
-            conn = get_sql_conn()
-            cursor = conn.cursor()
+            with sql_conn() as conn:
+                cursor = conn.cursor()
+                cursor.arraysize = _FETCH_BATCH
+
+                cursor.execute(_DROPDOWN_QUERY)
+                for field, value in _iter_rows(cursor):
+                    options[field].append(value)
 
-            for field in fields:
-                query = f"""
-                SELECT DISTINCT [{field}] 
-                FROM PCE_WM 
-                WHERE [{field}] IS NOT NULL AND [{field}] != ''
-                ORDER BY [{field}]
-                """
-                cursor.execute(query)
-                rows = cursor.fetchall()
-                options[field] = [row[0] for row in rows]
-
-            conn.close()
             return options
 
         except Exception as e:
@@ -125,33 +332,148 @@ class WellMasterDB:
             return {}
 
     @staticmethod
-    def is_pending(well):
-        """Check if a well is pending (has IDs but missing other fields)"""
+    def get_fingerprint():
+        """Cheap change marker for PCE_WM: [row count, last write, server start]
+        as strings, so it compares equal to the copy stored in the cache"""
+        from db_connection import sql_conn
+
+        try:
+            with sql_conn() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_FINGERPRINT_QUERY)
+                row = cursor.fetchone()
+            return [str(value) for value in row]
+
+        except Exception as e:
+            print(f"Error reading PCE_WM fingerprint: {e}")
+            return None
+
+    @staticmethod
+    def load_wells_and_options():
+        """Load wells and dropdown options, from the disk cache if PCE_WM is unchanged"""
+        fingerprint = WellMasterDB.get_fingerprint()
+
+        import pandas as pd
+
+        if fingerprint is not None:
+            try:
+                with open(_CACHE_FILE, encoding='utf-8') as f:
+                    cached = json.load(f)
+                if cached['fingerprint'] == fingerprint:
+                    wells = pd.DataFrame(cached['wells'], columns=list(_WELL_KEYS))
+                    wells = wells.astype(cached['numeric_dtypes'])
+                    return wells, cached['options']
+            except Exception:
+                pass
+
+        wells = WellMasterDB.get_all_wells()
+        options = WellMasterDB.get_dropdown_options()
+
+        # Either load failing leaves an empty result; don't cache that
+        if fingerprint is not None and not wells.empty and options:
+            try:
+                os.makedirs(_CACHE_DIR, exist_ok=True)
+                tmp_path = _CACHE_FILE + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({
+                        'fingerprint': fingerprint,
+                        'wells': wells.to_dict('list'),
+                        'numeric_dtypes': {
+                            column: str(dtype) for column, dtype in wells.dtypes.items()
+                            if dtype.kind in 'biuf'
+                        },
+                        'options': options,
+                    }, f)
+                os.replace(tmp_path, _CACHE_FILE)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"Error writing Well Master cache: {e}")
+
+        return wells, options
+
+    @staticmethod
+    def invalidate_cache():
+        """Drop the cached wells after PCE_WM has been written to"""
+        try:
+            os.remove(_CACHE_FILE)
+        except OSError:
+            pass
+
+    @staticmethod
+    def pending_mask(wells):
+        """Boolean Series marking pending wells in a get_all_wells() frame
+
+        A well is pending when it has a Well Name and both IDRECs, but none
+        of the descriptive fields and no lateral length (NULL or 0).
+        """
+        import numpy as np
+        import pandas as pd
+
+        def present(col):
+            values = wells[col]
+            return (values.notna() & (values != '')).to_numpy(dtype=bool)
+
         # Has required IDs and Well Name
-        if not well.get('well_name') or not well.get('gas_idrec') or not well.get('pressures_idrec'):
-            return False
+        has_ids = present('well_name') & present('gas_idrec') & present('pressures_idrec')
 
-        # Check if other fields are all NULL/empty/0
-        # Lateral length of 0 is considered "missing" or "not set"
-        other_fields = [
-            well.get('formation'),
-            well.get('layer'),
-            well.get('fault_block'),
-            well.get('pad_name'),
-            well.get('completions_tech'),
-            well.get('value_nav_uwi'),
-            well.get('orient'),
-            well.get('composite_name')
-        ]
+        # Other fields all NULL (get_all_wells maps blanks to NULL); lateral
+        # length of 0 counts as missing
+        empty_counts = wells[list(_PENDING_OTHER_KEYS)].isna().to_numpy().sum(axis=1)
+        lateral = pd.to_numeric(wells['lateral_length'], errors='coerce').to_numpy(dtype=np.float64)
+        lateral = np.nan_to_num(lateral, nan=0.0)
 
-        # Check lateral length separately (0 means missing)
-        lateral = well.get('lateral_length')
-        has_lateral = lateral is not None and str(lateral).strip() != '' and float(lateral) != 0
+        # Final combine on plain numpy arrays, without index alignment
+        pending = has_ids & (empty_counts == len(_PENDING_OTHER_KEYS)) & (lateral == 0)
+        return pd.Series(pending, index=wells.index)
 
-        # If all other fields are empty AND lateral is 0/missing, it's pending
-        all_others_empty = all(field is None or str(field).strip() == '' for field in other_fields)
+    @staticmethod
+    def find_new_wells(existing_names, existing_gas, existing_pres):
+        """Query Snowflake for wells not yet in PCE_WM
 
-        return all_others_empty and not has_lateral
+        A well is new when neither its normalized name, GasIDREC nor
+        PressuresIDREC matches an existing one. Returns a list of dicts with
+        well_name, gas_idrec and pressures_idrec, or None if Snowflake
+        returned no rows at all.
+        """
+        from snowflake_connector import SnowflakeConnector
+
+        query = """
+        SELECT DISTINCT 
+            u.NAME AS Unit_Name,
+            c.IDREC AS PressuresIDREC,
+            me.IDRECPARENT AS GasIDREC
+        FROM PACIFICCANBRIAM_PV30.UNITSMETRIC.pvUnit AS u 
+        INNER JOIN PACIFICCANBRIAM_PV30.UNITSMETRIC.pvUnitComp AS c ON c.IDRECPARENT = u.IDREC
+        INNER JOIN PACIFICCANBRIAM_PV30.UNITSMETRIC.pvUnitMeterOrifice AS mo ON mo.IDRECPARENT = u.IDREC
+        INNER JOIN PACIFICCANBRIAM_PV30.UNITSMETRIC.pvUnitMeterOrificeEntry AS me ON me.IDRECPARENT = mo.IDREC
+        WHERE mo.NAME LIKE '%Daily%'
+            AND (me.DELETED = 0 OR me.DELETED IS NULL)
+        ORDER BY u.NAME, c.IDREC;
+        """
+
+        sf = SnowflakeConnector()
+        df = sf.query(query)
+        sf.close()
+
+        if df.empty:
+            return None
+
+        # Filter column-wise instead of boxing every row with iterrows
+        id_cols = ['UNIT_NAME', 'GASIDREC', 'PRESSURESIDREC']
+        candidates = df[id_cols].dropna()
+        candidates = candidates.astype(str).apply(lambda col: col.str.strip())
+        candidates = candidates[(candidates != '').all(axis=1)]
+
+        norm_names = candidates['UNIT_NAME'].map(normalize_well_name)
+        is_new = (
+            ~norm_names.isin(existing_names)
+            & ~candidates['GASIDREC'].isin(existing_gas)
+            & ~candidates['PRESSURESIDREC'].isin(existing_pres)
+        )
+        return candidates[is_new].rename(columns={
+            'UNIT_NAME': 'well_name',
+            'GASIDREC': 'gas_idrec',
+            'PRESSURESIDREC': 'pressures_idrec',
+        }).to_dict('records')
 
     @staticmethod
     def compose_name(well_name, layer, tech, orient):
@@ -167,106 +489,124 @@ class WellMasterDB:
 
     @staticmethod
     def save_well_updates(updates):
-        """Save multiple well updates to database"""
-        from db_connection import get_sql_conn
+        """Save multiple well updates to database
+
+        Returns (updated, errors, error_total). Only the first few error
+        messages are kept; error_total counts all of them.
+        """
+        from db_connection import get_sql_conn, release_sql_conn
         from purge_exception_wells import purge_wells
 
         if not updates:
-            return 0, ["No updates provided"]
+            return 0, ["No updates provided"], 1
 
         conn = None
         try:
             conn = get_sql_conn()
             cursor = conn.cursor()
             updated = 0
-            errors = []
+            # Enough messages for a 5-line summary plus the "more" line
+            errors = deque(maxlen=6)
+            error_total = 0
             wells_to_purge = set()
 
+            # Current Exception flag of just the wells being saved, a chunk of
+            # names per query. This also tells us which wells exist, so no
+            # per-well SELECT is needed.
+            names = list({
+                _well_key(update['well_name']): update['well_name']
+                for update in updates if update.get('well_name')
+            }.values())
+            current_exceptions = {}
+            for start in range(0, len(names), _MAX_PARAMS):
+                chunk = names[start:start + _MAX_PARAMS]
+                cursor.execute(
+                    "SELECT [Well Name], [Exception] FROM PCE_WM "
+                    f"WHERE [Well Name] IN ({', '.join(['?'] * len(chunk))})",
+                    chunk,
+                )
+                current_exceptions.update(
+                    (_well_key(row[0]), row[1]) for row in cursor.fetchall()
+                )
+
+            # Fold every update of a well into one set of values, a later
+            # update's fields overriding an earlier one's, so the result is
+            # what the sequential UPDATEs would have left behind
+            merged = {}
             for update in updates:
                 well_name = update.get('well_name')
                 if not well_name:
                     errors.append("Missing well name")
+                    error_total += 1
+                    continue
+
+                fields = tuple(key for key in _WM_UPDATE_FIELDS if update.get(key) is not None)
+                if not fields:
+                    errors.append(f"No fields to update for {well_name}")
+                    error_total += 1
+                    continue
+
+                key = _well_key(well_name)
+                if key not in current_exceptions:
+                    errors.append(f"Well not found: {well_name}")
+                    error_total += 1
                     continue
 
                 # Determine if Exception is changing from N -> Y for this well
                 new_exception = update.get('exception')
                 if new_exception is not None:
                     new_exception_norm = str(new_exception).strip().upper() or "N"
-                    # Fetch current exception from DB
-                    cursor.execute(
-                        "SELECT [Exception] FROM PCE_WM WHERE [Well Name] = ?", well_name
-                    )
-                    row = cursor.fetchone()
-                    if row is not None:
-                        current_exception = row[0]
-                        if current_exception is None or str(current_exception).strip() == "":
-                            current_exception_norm = "N"
-                        else:
-                            current_exception_norm = str(current_exception).strip().upper()
-
-                        # Mark for purge only on transition N -> Y
-                        if current_exception_norm != "Y" and new_exception_norm == "Y":
-                            wells_to_purge.add(well_name)
-
-                # Build update query dynamically based on provided fields
-                set_clauses = []
-                params = []
-
-                field_mapping = {
-                    'formation': '[Formation Producer]',
-                    'layer': '[Layer Producer]',
-                    'fault_block': '[Fault Block]',
-                    'pad_name': '[Pad Name]',
-                    'completions_tech': '[Completions Technology]',
-                    'lateral_length': '[Lateral Length]',
-                    'horizontal_distance_right': '[Horizontal Distance Right]',
-                    'horizontal_distance_left': '[Horizontal Distance Left]',
-                    'vertical_distance_above': '[Vertical Distance Above]',
-                    'vertical_distance_below': '[Vertical Distance Below]',
-                    'value_nav_uwi': '[Value Navigator UWI]',
-                    'orient': '[Orient]',
-                    'composite_name': '[Composite Name]',
-                    'exception': '[Exception]',
-                }
-
-                for key, db_field in field_mapping.items():
-                    if key in update and update[key] is not None:
-                        set_clauses.append(f"{db_field} = ?")
-                        params.append(update[key])
-
-                if not set_clauses:
-                    errors.append(f"No fields to update for {well_name}")
-                    continue
-
+                    current_exception = current_exceptions[key]
+                    if current_exception is None or str(current_exception).strip() == "":
+                        current_exception_norm = "N"
+                    else:
+                        current_exception_norm = str(current_exception).strip().upper()
+
+                    # Mark for purge only on transition N -> Y
+                    if current_exception_norm != "Y" and new_exception_norm == "Y":
+                        wells_to_purge.add(well_name)
+
+                values = merged.setdefault(key, [well_name, {}])[1]
+                for field in fields:
+                    values[field] = update[field]
+
+            # Group wells by the fields they set; each group is sent as
+            # UPDATE ... FROM (VALUES ...) statements
+            batches = {}
+            for key, (well_name, values) in merged.items():
+                fields = tuple(field for field in _WM_UPDATE_FIELDS if field in values)
+                params = [values[field] for field in fields]
                 params.append(well_name)
-                query = f"""
-                UPDATE PCE_WM 
-                SET {', '.join(set_clauses)}
-                WHERE [Well Name] = ?
-                """
-
-                cursor.execute(query, params)
-                if cursor.rowcount > 0:
-                    updated += 1
-                else:
-                    errors.append(f"Well not found: {well_name}")
+                batches.setdefault(fields, {})[key] = params
+
+            for fields, rows_by_well in batches.items():
+                param_rows = list(rows_by_well.values())
+                # SQL Server allows 1000 rows per VALUES list and 2100
+                # parameters per call, two of which pyodbc itself uses
+                chunk_size = min(1000, _MAX_PARAMS // (len(fields) + 1))
+                for start in range(0, len(param_rows), chunk_size):
+                    chunk = param_rows[start:start + chunk_size]
+                    query = WellMasterDB._update_query(fields, len(chunk))
+                    cursor.execute(query, [value for params in chunk for value in params])
+                updated += len(param_rows)
 
             conn.commit()
+            WellMasterDB.invalidate_cache()
 
             # After WM updates are committed, purge data for any wells
             # whose Exception flag was changed from N -> Y during this save.
             if wells_to_purge:
                 purge_wells(list(wells_to_purge))
 
-            return updated, errors
+            return updated, list(errors), error_total
 
         except Exception as e:
             if conn:
                 conn.rollback()
-            return 0, [str(e)]
+            return 0, [str(e)], 1
         finally:
             if conn:
-                conn.close()
+                release_sql_conn(conn)
 
 
 class ComboBoxDelegate(QStyledItemDelegate):
@@ -296,6 +636,259 @@ class ComboBoxDelegate(QStyledItemDelegate):
         editor.setGeometry(option.rect)
 
 
+class CheckBoxDelegate(QStyledItemDelegate):
+    """Delegate drawing a centered checkbox from the model's CheckStateRole
+
+    Clicking anywhere in the cell (or Space) toggles it through setData, so
+    the table needs no checkbox widget per row.
+    """
+
+    def paint(self, painter, option, index):
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+
+        # Cell background and selection highlight
+        item_opt = QStyleOptionViewItem(option)
+        self.initStyleOption(item_opt, index)
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, item_opt, painter, widget)
+
+        button = QStyleOptionButton()
+        button.state = QStyle.State_Enabled
+        if index.data(Qt.CheckStateRole) == Qt.Checked:
+            button.state |= QStyle.State_On
+        else:
+            button.state |= QStyle.State_Off
+        size = style.subElementRect(QStyle.SE_CheckBoxIndicator, button, widget).size()
+        button.rect = QStyle.alignedRect(option.direction, Qt.AlignCenter, size, option.rect)
+        style.drawControl(QStyle.CE_CheckBox, button, painter, widget)
+
+    def editorEvent(self, event, model, option, index):
+        if not index.flags() & Qt.ItemIsUserCheckable:
+            return False
+
+        event_type = event.type()
+        if event_type == QEvent.MouseButtonRelease:
+            if event.button() != Qt.LeftButton:
+                return False
+        elif event_type == QEvent.KeyPress:
+            if event.key() not in (Qt.Key_Space, Qt.Key_Select):
+                return False
+        else:
+            # Swallow double-clicks so they don't toggle twice
+            return event_type == QEvent.MouseButtonDblClick
+
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        return model.setData(index, Qt.Unchecked if checked else Qt.Checked, Qt.CheckStateRole)
+
+
+class WellTableModel(QAbstractTableModel):
+    """Model for the Current Wells table
+
+    Cell text is kept column-wise, one list per field, and handed to the view
+    only for the rows it paints. Column 0 is the row's checkbox; a checked
+    row's editable columns accept edits, which mark the row dirty.
+    """
+    check_toggled = pyqtSignal(object, bool)
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._wells = []
+        self._columns = [[] for _ in _TABLE_KEYS]
+        self._checked = []
+        self._dirty = []
+
+    def set_wells(self, wells):
+        """Replace the table contents with `wells` (well dicts carrying every
+        _TABLE_KEYS field, as read by get_all_wells)"""
+        self.beginResetModel()
+        self._wells = list(wells)
+        if self._wells:
+            # One tuple of fields per well, transposed into column lists
+            rows = map(_table_fields, self._wells)
+            self._columns = [list(map(_cell_text, column)) for column in zip(*rows)]
+        else:
+            self._columns = [[] for _ in _TABLE_KEYS]
+        self._checked = [False] * len(self._wells)
+        self._dirty = [False] * len(self._wells)
+        self.endResetModel()
+
+    def text(self, row, col):
+        """Current text of a cell (col 1-17)"""
+        return self._columns[col - 1][row]
+
+    def row_text(self, row):
+        """All cell text of a row keyed by well field, read from the backing
+        columns without going through Qt"""
+        return {key: column[row] for key, column in zip(_TABLE_KEYS, self._columns)}
+
+    def column_texts(self):
+        """Text lists for columns 1-17, in the current row order"""
+        return self._columns
+
+    def is_checked(self, row):
+        return self._checked[row]
+
+    def is_dirty(self, row):
+        return self._dirty[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._wells)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+
+        if col == 0:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if self._checked[row] else Qt.Unchecked
+            return None
+
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._columns[col - 1][row]
+
+        if role == Qt.BackgroundRole:
+            if self._wells[row].get('is_pending'):
+                return _PENDING_BG
+            if col in _LOCKED_COLUMNS:
+                return _LOCKED_BG
+            if self._checked[row]:
+                return _EDITING_BG
+            return _READONLY_BG
+
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        col = index.column()
+        if col == 0:
+            return _CHECKABLE_FLAGS
+        if col in _EDITABLE_COLUMNS and self._checked[index.row()]:
+            return _EDITABLE_FLAGS
+        return _READONLY_FLAGS
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        row, col = index.row(), index.column()
+        last_col = self.columnCount() - 1
+
+        if col == 0:
+            if role != Qt.CheckStateRole:
+                return False
+            checked = value == Qt.Checked
+            self._checked[row] = checked
+            if not checked:
+                # Unchecking a row drops its unsaved edits from the next save
+                self._dirty[row] = False
+            if self._wells[row].get('is_pending'):
+                # Pending rows keep their colour; only the box changes
+                self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            else:
+                self.dataChanged.emit(
+                    self.index(row, 0), self.index(row, last_col),
+                    [Qt.CheckStateRole, Qt.BackgroundRole],
+                )
+            self.check_toggled.emit(self._wells[row], checked)
+            return True
+
+        if role != Qt.EditRole:
+            return False
+
+        self._columns[col - 1][row] = "" if value is None else str(value)
+        self._dirty[row] = True
+
+        if col in _COMPOSITE_SOURCE_COLUMNS:
+            composite = WellMasterDB.compose_name(
+                self.text(row, 1), self.text(row, 5), self.text(row, 8), self.text(row, 15)
+            )
+            if composite:
+                self._columns[15][row] = composite
+
+        self.dataChanged.emit(
+            self.index(row, col), self.index(row, max(col, 16)), [Qt.DisplayRole, Qt.EditRole]
+        )
+        return True
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort rows by a column's text (or checked state for column 0)"""
+        if column < 0 or column >= self.columnCount():
+            return
+        keys = self._checked if column == 0 else self._columns[column - 1]
+        order_idx = sorted(
+            range(len(self._wells)),
+            key=keys.__getitem__,
+            reverse=(order == Qt.DescendingOrder),
+        )
+
+        self.layoutAboutToBeChanged.emit()
+        self._wells = [self._wells[i] for i in order_idx]
+        self._columns = [[col[i] for i in order_idx] for col in self._columns]
+        self._checked = [self._checked[i] for i in order_idx]
+        self._dirty = [self._dirty[i] for i in order_idx]
+
+        # Keep selection/current index on the same wells
+        new_pos = [0] * len(order_idx)
+        for new_row, old_row in enumerate(order_idx):
+            new_pos[old_row] = new_row
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(new_pos[idx.row()], idx.column()) for idx in old_indexes],
+        )
+        self.layoutChanged.emit()
+
+
+class WellFilterProxy(QSortFilterProxyModel):
+    """Search filter over WellTableModel
+
+    Rows are matched on the model's cell text, so filtering never rebuilds
+    the source model. Sorting is handed to the source model, whose sort
+    permutes its column lists directly.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._search = ""
+        # Re-filter only when the search changes or the model is reset, not
+        # on the dataChanged every check toggle and cell edit emits
+        self.setDynamicSortFilter(False)
+
+    def set_search(self, text):
+        """Show only rows with `text` (case-insensitive) in a searched field"""
+        search = text.lower()
+        if search != self._search:
+            self._search = search
+            self.invalidateFilter()
+
+    def source_rows(self):
+        """Source row numbers of the rows currently shown, in view order"""
+        source = self.sourceModel()
+        if not self._search:
+            return range(source.rowCount())
+        return [self.mapToSource(self.index(row, 0)).row() for row in range(self.rowCount())]
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        search = self._search
+        if not search:
+            return True
+        columns = self.sourceModel().column_texts()
+        return any(search in columns[i][source_row].lower() for i in _SEARCH_KEY_INDEXES)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+
 class WellMasterDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -314,7 +907,7 @@ class WellMasterDialog(QDialog):
         self.pending_count = 0
         self.current_tab = 0
         self.row_widgets = []          # References to staged table widgets
-        self.pending_current_edits = set()
+        self._staged_options = None    # dropdown_options the staged delegates use
         # Column widths (used in both tabs)
         # Index: 0    1            2           3               4          5       6            7
         #        ""   Well Name    GasIDREC    PressuresIDREC  Formation  Layer   Fault Block  Pad Name
@@ -361,9 +954,29 @@ class WellMasterDialog(QDialog):
         self.status_label = None
         self.staged_info = None
         self.table = None
+        self.model = None
+        self.proxy = None
         self.staged_table = None
         self.tabs = None
 
+        # Database reads and writes run on these, off the GUI thread
+        self._load_worker = WellLoadWorker()
+        self._load_worker.finished_signal.connect(self._on_wells_loaded, Qt.QueuedConnection)
+        self._save_worker = WellSaveWorker()
+        self._save_worker.finished_signal.connect(self._on_selected_saved, Qt.QueuedConnection)
+        self._staged_save_worker = WellSaveWorker()
+        self._staged_save_worker.finished_signal.connect(self._on_staged_saved, Qt.QueuedConnection)
+        self._import_worker = WellImportWorker()
+        self._import_worker.finished_signal.connect(self._on_new_wells_found, Qt.QueuedConnection)
+        self._status_after_load = None
+        self._known_well_names = set()
+        self._save_errors = []
+        # Staged wells being written by _staged_save_worker
+        self._saving_staged = []
+        # (normalized names, GasIDRECs, PressuresIDRECs) of the loaded wells,
+        # built on first import and dropped on every reload
+        self._existing_ids = None
+
         self.initUI()
         self.load_data()
 
@@ -471,7 +1084,12 @@ class WellMasterDialog(QDialog):
                 min-width: 250px;
             }
         """)
-        self.search_input.textChanged.connect(self.filter_wells)
+        # Filter once typing pauses rather than on every keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self.filter_wells)
+        self.search_input.textChanged.connect(lambda _text: self._search_timer.start())
 
         clear_search = QPushButton("×")
         clear_search.setFixedSize(24, 24)
@@ -508,7 +1126,7 @@ class WellMasterDialog(QDialog):
 
         self.refresh_btn = QPushButton("🔄 Refresh")
         self.refresh_btn.setStyleSheet(self.button_style("#6c757d"))
-        self.refresh_btn.clicked.connect(self.load_data)
+        self.refresh_btn.clicked.connect(lambda: self.load_data())
 
         self.import_btn = QPushButton("🔄 Import New Wells")
         self.import_btn.setStyleSheet(self.button_style("#1a4d3e"))
@@ -527,18 +1145,28 @@ class WellMasterDialog(QDialog):
         layout.addWidget(self.status_label)
 
         # Table
-        self.table = QTableWidget()
+        self.table = QTableView()
+        self.model = WellTableModel(self.headers, self.table)
+        self.model.check_toggled.connect(self.on_checkbox_changed)
+        self.proxy = WellFilterProxy(self.table)
+        self.proxy.setSourceModel(self.model)
+        self.table.setModel(self.proxy)
+        self.table.setItemDelegateForColumn(0, CheckBoxDelegate(self.table))
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        # Cells are single-line values; skip the word-wrap text layout on paint
+        self.table.setWordWrap(False)
+        # Keep load order until a header is clicked
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
         self.table.setSortingEnabled(True)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border: 1px solid #d1d5db;
                 border-radius: 5px;
                 background-color: white;
                 font-size: 11px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 4px;
             }
             QHeaderView::section {
@@ -551,8 +1179,6 @@ class WellMasterDialog(QDialog):
         """)
 
         self.make_current_table_editable()
-        self.table.setColumnCount(len(self.headers))
-        self.table.setHorizontalHeaderLabels(self.headers)
 
         for i, width in enumerate(self.col_widths):
             self.table.setColumnWidth(i, width)
@@ -594,6 +1220,7 @@ class WellMasterDialog(QDialog):
         """)
 
         self.staged_table.itemChanged.connect(self.on_staged_item_changed)
+        self.staged_table.setItemDelegateForColumn(0, CheckBoxDelegate(self.staged_table))
 
         self.staged_table.setColumnCount(len(self.headers))
         self.staged_table.setHorizontalHeaderLabels(self.headers)
@@ -621,10 +1248,8 @@ class WellMasterDialog(QDialog):
 
     def make_current_table_editable(self):
         """Set up delegates and editability for Current Wells tab"""
-
-        if not self.dropdown_options:
-            self.dropdown_options = WellMasterDB.get_dropdown_options()
-
+        # Dropdown options arrive with the background load; until then the
+        # columns simply have no delegate
         dropdown_columns = {
             4: 'Formation Producer',
             5: 'Layer Producer',
@@ -639,54 +1264,18 @@ class WellMasterDialog(QDialog):
                 delegate = ComboBoxDelegate(self.table, options)
                 self.table.setItemDelegateForColumn(col, delegate)
 
-        self.table.itemChanged.connect(self.on_current_item_changed)
-
-    def is_row_checked(self, row):
-        """Check if the checkbox for a given row is checked"""
-        widget = self.table.cellWidget(row, 0)
-        if widget:
-            checkbox = widget.findChild(QCheckBox)
-            if checkbox:
-                return checkbox.isChecked()
-        return False
-
-    def on_current_item_changed(self, item):
-        """Handle cell edits in Current Wells tab"""
-        row = item.row()
-        col = item.column()
-
-        if not self.is_row_checked(row):
-            return
-
-        if col in [4, 5, 8, 15]:
-            well_name = self.table.item(row, 1).text() if self.table.item(row, 1) else ""
-            layer = self.table.item(row, 5).text() if self.table.item(row, 5) else ""
-            tech = self.table.item(row, 8).text() if self.table.item(row, 8) else ""
-            orient = self.table.item(row, 15).text() if self.table.item(row, 15) else ""
-
-            composite = WellMasterDB.compose_name(well_name, layer, tech, orient)
-            if composite and self.table.item(row, 16):
-                self.table.blockSignals(True)
-                self.table.item(row, 16).setText(composite)
-                self.table.blockSignals(False)
-
-                self.pending_current_edits.add(row)
-
     def save_selected(self):
         """Save changes to selected (checked) wells in Current Wells tab"""
-        checked_rows = []
-        for row in range(self.table.rowCount()):
-            if self.is_row_checked(row):
-                checked_rows.append(row)
+        if self._save_worker.isRunning():
+            return
+
+        checked_rows = [row for row in range(self.model.rowCount()) if self.model.is_checked(row)]
 
         if not checked_rows:
             QMessageBox.information(self, "No Selection", "Please check the wells you want to save.")
             return
 
-        if hasattr(self, 'pending_current_edits'):
-            rows_to_save = [row for row in self.pending_current_edits if row in checked_rows]
-        else:
-            rows_to_save = []
+        rows_to_save = [row for row in checked_rows if self.model.is_dirty(row)]
 
         if not rows_to_save:
             QMessageBox.information(self, "No Changes", "No pending changes to save for selected wells.")
@@ -695,21 +1284,22 @@ class WellMasterDialog(QDialog):
         updates = []
 
         for row in rows_to_save:
-            well_name = self.table.item(row, 1).text() if self.table.item(row, 1) else ""
-            formation = self.table.item(row, 4).text() if self.table.item(row, 4) else ""
-            layer = self.table.item(row, 5).text() if self.table.item(row, 5) else ""
-            fault_block = self.table.item(row, 6).text() if self.table.item(row, 6) else ""
-            pad_name = self.table.item(row, 7).text() if self.table.item(row, 7) else ""
-            completions_tech = self.table.item(row, 8).text() if self.table.item(row, 8) else ""
-            lateral_length = self.table.item(row, 9).text() if self.table.item(row, 9) else ""
-            horiz_right = self.table.item(row, 10).text() if self.table.item(row, 10) else ""
-            horiz_left = self.table.item(row, 11).text() if self.table.item(row, 11) else ""
-            vert_above = self.table.item(row, 12).text() if self.table.item(row, 12) else ""
-            vert_below = self.table.item(row, 13).text() if self.table.item(row, 13) else ""
-            value_nav_uwi = self.table.item(row, 14).text() if self.table.item(row, 14) else ""
-            orient = self.table.item(row, 15).text() if self.table.item(row, 15) else ""
-            composite_name = self.table.item(row, 16).text() if self.table.item(row, 16) else ""
-            exception_val = self.table.item(row, 17).text() if self.table.item(row, 17) else ""
+            values = self.model.row_text(row)
+            well_name = values['well_name']
+            formation = values['formation']
+            layer = values['layer']
+            fault_block = values['fault_block']
+            pad_name = values['pad_name']
+            completions_tech = values['completions_tech']
+            lateral_length = values['lateral_length']
+            horiz_right = values['horizontal_right']
+            horiz_left = values['horizontal_left']
+            vert_above = values['vertical_above']
+            vert_below = values['vertical_below']
+            value_nav_uwi = values['value_nav_uwi']
+            orient = values['orient']
+            composite_name = values['composite_name']
+            exception_val = values['exception']
 
             formation = formation if formation.strip() else None
             layer = layer if layer.strip() else None
@@ -774,7 +1364,18 @@ class WellMasterDialog(QDialog):
 
             updates.append(update_data)
 
+        # Wells that weren't in the last load are reported here rather than
+        # sent to the server as UPDATEs that can't match
+        self._save_errors = [
+            f"Well not found: {u['well_name']}"
+            for u in updates if _well_key(u['well_name']) not in self._known_well_names
+        ]
+        if self._save_errors:
+            updates = [u for u in updates if _well_key(u['well_name']) in self._known_well_names]
+
         if not updates:
+            if self._save_errors:
+                QMessageBox.warning(self, "Save Failed", "\n".join(self._save_errors[:5]))
             return
 
         reply = QMessageBox.question(
@@ -788,18 +1389,24 @@ class WellMasterDialog(QDialog):
             return
 
         self.status_label.setText(f"Saving {len(updates)} well(s)...")
-        QApplication.processEvents()
+        self.save_btn.setEnabled(False)
+        self._save_worker.updates = updates
+        self._save_worker.start()
 
-        updated, errors = WellMasterDB.save_well_updates(updates)
+    def _on_selected_saved(self, updated, errors, error_total):
+        """Report the result of a background save from save_selected"""
+        self.save_btn.setEnabled(True)
+        errors = self._save_errors + errors
+        error_total += len(self._save_errors)
 
-        if errors:
+        if error_total:
             error_msg = "\n".join(errors[:5])
-            if len(errors) > 5:
-                error_msg += f"\n... and {len(errors) - 5} more errors"
+            if error_total > 5:
+                error_msg += f"\n... and {error_total - 5} more errors"
             QMessageBox.warning(
                 self,
                 "Save Completed with Errors",
-                f"Updated: {updated}\nFailed: {len(errors)}\n\nErrors:\n{error_msg}"
+                f"Updated: {updated}\nFailed: {error_total}\n\nErrors:\n{error_msg}"
             )
         else:
             QMessageBox.information(
@@ -808,9 +1415,7 @@ class WellMasterDialog(QDialog):
                 f"Successfully updated {updated} well(s)."
             )
 
-        self.pending_current_edits.clear()
-        self.load_data()
-        self.status_label.setText(f"Saved {updated} well(s)")
+        self.load_data(f"Saved {updated} well(s)")
 
     def button_style(self, color, large=False):
         """Return button stylesheet"""
@@ -859,142 +1464,73 @@ class WellMasterDialog(QDialog):
             return "#545b62"
         return color
 
-    def load_data(self):
-        """Load well data from database"""
-        self.status_label.setText("Loading wells from database...")
-        QApplication.processEvents()
-
-        self.table.setRowCount(0)
+    def done(self, result):
+        """Let a running load, save or import query finish before the dialog closes"""
+        self._load_worker.wait()
+        self._save_worker.wait()
+        self._staged_save_worker.wait()
+        self._import_worker.wait()
+        super().done(result)
 
-        self.all_wells = WellMasterDB.get_all_wells()
-        self.dropdown_options = WellMasterDB.get_dropdown_options()
+    def load_data(self, status=None):
+        """Load well data from database on a worker thread
 
-        self.pending_wells = []
-        self.complete_wells = []
-
-        for well in self.all_wells:
-            if WellMasterDB.is_pending(well):
-                self.pending_wells.append(well)
-            else:
-                self.complete_wells.append(well)
-
-        self.complete_wells.sort(key=lambda x: x.get('well_name', ''))
-        self.pending_wells.sort(key=lambda x: x.get('well_name', ''))
+        `status`, if given, replaces the usual "Loaded ..." message once the
+        load has finished.
+        """
+        if self._load_worker.isRunning():
+            return
 
-        all_sorted = self.complete_wells + self.pending_wells
+        self.status_label.setText("Loading wells from database...")
+        self.refresh_btn.setEnabled(False)
+        self._status_after_load = status
+
+        self.model.set_wells([])
+        self._load_worker.start()
+
+    def _on_wells_loaded(self, wells, dropdown_options):
+        """Split and display wells read by the load worker"""
+        self.dropdown_options = dropdown_options
+
+        # Split by a vectorized mask instead of testing each well in Python;
+        # the flag is kept on each record so the table fill needn't re-test
+        pending = WellMasterDB.pending_mask(wells)
+        wells = wells.assign(is_pending=pending)
+        self.complete_wells = wells[~pending].sort_values('well_name').to_dict('records')
+        self.pending_wells = wells[pending].sort_values('well_name').to_dict('records')
+        self.all_wells = self.complete_wells + self.pending_wells
+        self._known_well_names = {
+            _well_key(well['well_name']) for well in self.all_wells if well.get('well_name')
+        }
+        self._existing_ids = None
 
-        self.display_wells(all_sorted)
+        self.display_wells(self.all_wells)
         self.make_current_table_editable()
+        self.refresh_btn.setEnabled(self.tabs.currentIndex() == 0)
 
-        self.status_label.setText(
-            f"Loaded {len(self.all_wells)} wells "
-            f"({len(self.complete_wells)} complete, {len(self.pending_wells)} pending)"
-        )
+        if self._status_after_load:
+            self.status_label.setText(self._status_after_load)
+        else:
+            self.status_label.setText(
+                f"Loaded {len(self.all_wells)} wells "
+                f"({len(self.complete_wells)} complete, {len(self.pending_wells)} pending)"
+            )
 
     def display_wells(self, wells):
         """Display wells in the table"""
-        self.table.setRowCount(len(wells))
         self.filtered_wells = wells
-
-        try:
-            self.table.itemChanged.disconnect(self.on_current_item_changed)
-        except Exception:
-            pass
-
-        for row, well in enumerate(wells):
-            chk = QCheckBox()
-            chk.stateChanged.connect(lambda state, r=row: self.on_checkbox_changed(r, state))
-            chk_widget = QWidget()
-            chk_layout = QHBoxLayout(chk_widget)
-            chk_layout.addWidget(chk)
-            chk_layout.setAlignment(Qt.AlignCenter)
-            chk_layout.setContentsMargins(0, 0, 0, 0)
-            self.table.setCellWidget(row, 0, chk_widget)
-
-            data = [
-                well.get('well_name', ''),
-                well.get('gas_idrec', ''),
-                well.get('pressures_idrec', ''),
-                well.get('formation', ''),
-                well.get('layer', ''),
-                well.get('fault_block', ''),
-                well.get('pad_name', ''),
-                well.get('completions_tech', ''),
-                str(well.get('lateral_length', '') or ''),
-                str(well.get('horizontal_right', '') or ''),
-                str(well.get('horizontal_left', '') or ''),
-                str(well.get('vertical_above', '') or ''),
-                str(well.get('vertical_below', '') or ''),
-                well.get('value_nav_uwi', ''),
-                well.get('orient', ''),
-                well.get('composite_name', ''),
-                well.get('exception', 'N'),
-            ]
-
-            is_pending = WellMasterDB.is_pending(well)
-
-            for col, value in enumerate(data, start=1):
-                item = QTableWidgetItem(str(value) if value else "")
-
-                if col in [1, 2, 3]:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                    item.setBackground(QColor("#f0f0f0"))
-                elif col == 16:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                    item.setBackground(QColor("#f0f0f0"))
-                else:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                    if not is_pending:
-                        item.setBackground(QColor("#f8f9fa"))
-
-                if is_pending:
-                    item.setBackground(QColor("#fef3c7"))
-
-                self.table.setItem(row, col, item)
-
-        self.table.itemChanged.connect(self.on_current_item_changed)
-
-    def on_checkbox_changed(self, row, state):
-        """Handle checkbox state changes"""
-        if row >= len(self.filtered_wells):
-            return
-
-        well = self.filtered_wells[row]
-        is_checked = (state == Qt.Checked)
-
-        # Columns that can be edited when a row is checked
-        editable_columns = [
-            4,   # Formation
-            5,   # Layer
-            6,   # Fault Block
-            7,   # Pad Name
-            8,   # Completions
-            9,   # Lateral Length
-            10,  # Horizontal Distance Right
-            11,  # Horizontal Distance Left
-            12,  # Vertical Distance Above
-            13,  # Vertical Distance Below
-            14,  # Value Nav UWI
-            15,  # Orient
-            17,  # Exception (Y/N)
-        ]
-
-        for col in editable_columns:
-            item = self.table.item(row, col)
-            if item:
-                if is_checked:
-                    item.setFlags(item.flags() | Qt.ItemIsEditable)
-                    if well not in self.pending_wells:
-                        item.setBackground(QColor("#ffffff"))
-                else:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                    if well not in self.pending_wells:
-                        item.setBackground(QColor("#f8f9fa"))
-                    if hasattr(self, 'pending_current_edits') and row in self.pending_current_edits:
-                        self.pending_current_edits.remove(row)
-
-        if is_checked and well in self.pending_wells:
-            if well not in self.staged_wells:
+        self.model.set_wells(wells)
+
+    def on_checkbox_changed(self, well, is_checked):
+        """Stage a pending well when its row is checked"""
+        # The pending flag was computed once at load; no need to re-test
+        # the well or search pending_wells for it
+        if is_checked and well.get('is_pending'):
+            # Match on the well name: after a reload the staged dict and the
+            # table's dict are different objects, and NaN fields would make
+            # them compare unequal
+            key = _well_key(well.get('well_name', ''))
+            if all(_well_key(staged.get('well_name', '')) != key for staged in self.staged_wells):
                 self.staged_wells.append(well)
                 self.update_staged_table()
                 self.tabs.setCurrentIndex(1)
@@ -1002,49 +1538,47 @@ class WellMasterDialog(QDialog):
 
     def filter_wells(self):
         """Filter wells based on search text"""
-        search_text = self.search_input.text().lower()
-
-        if not search_text:
-            self.display_wells(self.complete_wells + self.pending_wells)
-            return
+        search_text = self.search_input.text()
+        self.proxy.set_search(search_text)
 
-        filtered = []
-        for well in self.complete_wells + self.pending_wells:
-            searchable = [
-                well.get('well_name', ''),
-                well.get('gas_idrec', ''),
-                well.get('pressures_idrec', ''),
-                well.get('formation', ''),
-                well.get('layer', ''),
-                well.get('pad_name', ''),
-                well.get('composite_name', '')
-            ]
-            if any(search_text in str(s).lower() for s in searchable):
-                filtered.append(well)
-
-        self.display_wells(filtered)
-        self.status_label.setText(
-            f"Showing {len(filtered)} of {len(self.all_wells)} wells"
-        )
+        if search_text:
+            self.status_label.setText(
+                f"Showing {self.proxy.rowCount()} of {len(self.all_wells)} wells"
+            )
 
     def on_staged_item_changed(self, item):
         """Handle cell edits in staged table"""
         row = item.row()
         col = item.column()
 
-        if col in [4, 5, 8, 11]:
-            if row < len(self.row_widgets):
-                well_name = self.staged_wells[row].get('well_name', '')
+        # Same column layout as Current Wells: Layer, Completions and Orient
+        # feed the Composite Name in column 16
+        if col not in _COMPOSITE_SOURCE_COLUMNS or row >= len(self.row_widgets):
+            return
+
+        well_name = self.staged_wells[row].get('well_name', '')
+        comp_item = self.staged_table.item(row, 16)
+        if not well_name or comp_item is None:
+            return
+
+        texts = self._staged_row_texts(row)
+        composite = WellMasterDB.compose_name(well_name, texts[5], texts[8], texts[15])
+        # Tabbing through a cell without changing it leaves the name as is
+        if not composite or composite == comp_item.text():
+            return
 
-                layer = self.staged_table.item(row, 5).text() if self.staged_table.item(row, 5) else ""
-                tech = self.staged_table.item(row, 8).text() if self.staged_table.item(row, 8) else ""
-                orient = self.staged_table.item(row, 11).text() if self.staged_table.item(row, 11) else ""
+        self.staged_table.blockSignals(True)
+        comp_item.setText(composite)
+        self.staged_table.blockSignals(False)
 
-                composite = WellMasterDB.compose_name(well_name, layer, tech, orient)
-                if composite and self.staged_table.item(row, 12):
-                    self.staged_table.blockSignals(True)
-                    self.staged_table.item(row, 12).setText(composite)
-                    self.staged_table.blockSignals(False)
+    def _staged_row_texts(self, row):
+        """Text of each cell in a staged row, by column ('' where no item)"""
+        table = self.staged_table
+        texts = []
+        for col in range(table.columnCount()):
+            item = table.item(row, col)
+            texts.append(item.text() if item else "")
+        return texts
 
     def on_tab_changed(self, index):
         """Handle tab changes"""
@@ -1062,22 +1596,9 @@ class WellMasterDialog(QDialog):
         from datetime import datetime
         import pandas as pd
 
-        headers = []
-        for col in range(1, self.table.columnCount()):
-            header_item = self.table.horizontalHeaderItem(col)
-            if header_item:
-                headers.append(header_item.text())
-
-        data = []
-        for row in range(self.table.rowCount()):
-            if not self.table.isRowHidden(row):
-                row_data = []
-                for col in range(1, self.table.columnCount()):
-                    item = self.table.item(row, col)
-                    row_data.append(item.text() if item and item.text() else "")
-                data.append(row_data)
-
-        if not data:
+        headers = self.headers[1:]
+
+        if not self.proxy.rowCount():
             QMessageBox.warning(self, "No Data", "No data to export.")
             return
 
@@ -1095,7 +1616,13 @@ class WellMasterDialog(QDialog):
             return
 
         try:
-            df = pd.DataFrame(data, columns=headers)
+            # Whole columns straight from the model, as shown (filter, sort
+            # order and unsaved edits included), without visiting each cell
+            columns = self.model.column_texts()
+            if self.proxy.rowCount() != self.model.rowCount():
+                rows = self.proxy.source_rows()
+                columns = [[column[row] for row in rows] for column in columns]
+            df = pd.DataFrame(dict(zip(headers, columns)), columns=headers)
 
             if file_path.lower().endswith('.csv'):
                 df.to_csv(file_path, index=False)
@@ -1103,13 +1630,23 @@ class WellMasterDialog(QDialog):
             else:
                 if not file_path.lower().endswith('.xlsx'):
                     file_path += '.xlsx'
-                df.to_excel(file_path, index=False, engine='openpyxl')
+                try:
+                    # xlsxwriter in constant_memory mode streams rows to disk
+                    # instead of building the whole workbook in memory first
+                    with pd.ExcelWriter(
+                        file_path,
+                        engine='xlsxwriter',
+                        engine_kwargs={'options': {'constant_memory': True}},
+                    ) as writer:
+                        df.to_excel(writer, index=False)
+                except ImportError:
+                    df.to_excel(file_path, index=False, engine='openpyxl')
                 export_format = "Excel"
 
             QMessageBox.information(
                 self,
                 "Export Complete",
-                f"Successfully exported {len(data)} rows to {export_format}:\n{file_path}"
+                f"Successfully exported {len(df)} rows to {export_format}:\n{file_path}"
             )
 
         except ImportError as e:
@@ -1117,8 +1654,8 @@ class WellMasterDialog(QDialog):
                 QMessageBox.critical(
                     self,
                     "Missing Dependency",
-                    "Excel export requires 'openpyxl'.\n\n"
-                    "Please install it with:\npip install openpyxl\n\n"
+                    "Excel export requires 'xlsxwriter' or 'openpyxl'.\n\n"
+                    "Please install one with:\npip install xlsxwriter\n\n"
                     "Or export as CSV instead."
                 )
             else:
@@ -1129,6 +1666,9 @@ class WellMasterDialog(QDialog):
 
     def import_new_wells(self):
         """Import new wells from Snowflake query"""
+        if self._import_worker.isRunning():
+            return
+
         reply = QMessageBox.question(
             self,
             "Import New Wells",
@@ -1140,47 +1680,40 @@ class WellMasterDialog(QDialog):
         if reply != QMessageBox.Yes:
             return
 
+        # Query and filter off the GUI thread; the preview opens when the
+        # worker reports back
         self.status_label.setText("Querying Snowflake for new wells...")
-        QApplication.processEvents()
+        self.import_btn.setEnabled(False)
+        self._import_worker.existing_ids = self.existing_well_ids()
+        self._import_worker.start()
 
-        try:
-            from snowflake_connector import SnowflakeConnector
-            import re
-
-            def normalize_well_name(name):
-                if not name or not isinstance(name, str):
-                    return ""
-                normalized = name.strip()
-                normalized = re.sub(r'-0(\d+)', r'-\1', normalized)
-                normalized = re.sub(r'\b0+(\d+)', r'\1', normalized)
-                normalized = re.sub(r'[-_]+', '-', normalized)
-                normalized = re.sub(r'\s+', ' ', normalized).strip()
-                normalized = normalized.upper()
-                return normalized
+    def _on_new_wells_found(self, new_wells, error):
+        """Preview the wells found by the import worker"""
+        self.import_btn.setEnabled(self.tabs.currentIndex() == 0)
 
-            query = """
-            SELECT DISTINCT 
-                u.NAME AS Unit_Name,
-                c.IDREC AS PressuresIDREC,
-                me.IDRECPARENT AS GasIDREC
-            FROM PACIFICCANBRIAM_PV30.UNITSMETRIC.pvUnit AS u 
-            INNER JOIN PACIFICCANBRIAM_PV30.UNITSMETRIC.pvUnitComp AS c ON c.IDRECPARENT = u.IDREC
-            INNER JOIN PACIFICCANBRIAM_PV30.UNITSMETRIC.pvUnitMeterOrifice AS mo ON mo.IDRECPARENT = u.IDREC
-            INNER JOIN PACIFICCANBRIAM_PV30.UNITSMETRIC.pvUnitMeterOrificeEntry AS me ON me.IDRECPARENT = mo.IDREC
-            WHERE mo.NAME LIKE '%Daily%'
-                AND (me.DELETED = 0 OR me.DELETED IS NULL)
-            ORDER BY u.NAME, c.IDREC;
-            """
+        if error:
+            QMessageBox.critical(self, "Import Failed", f"Error importing wells:\n{error}")
+            self.status_label.setText("Import failed")
+            return
 
-            sf = SnowflakeConnector()
-            df = sf.query(query)
-            sf.close()
+        if new_wells is None:
+            QMessageBox.information(self, "No New Wells", "No new wells found in Snowflake.")
+            self.status_label.setText("Import complete - no new wells")
+            return
 
-            if df.empty:
-                QMessageBox.information(self, "No New Wells", "No new wells found in Snowflake.")
-                self.status_label.setText("Import complete - no new wells")
-                return
+        if not new_wells:
+            QMessageBox.information(self, "No New Wells", "No new wells to import.")
+            self.status_label.setText("Import complete - no new wells")
+            return
 
+        self.show_import_preview(new_wells)
+
+    def existing_well_ids(self):
+        """Normalized names, GasIDRECs and PressuresIDRECs of the loaded wells
+
+        Built once per load, so repeated imports reuse the same sets.
+        """
+        if self._existing_ids is None:
             existing_names = set()
             existing_gas = set()
             existing_pres = set()
@@ -1196,38 +1729,8 @@ class WellMasterDialog(QDialog):
                 if pres:
                     existing_pres.add(pres)
 
-            new_wells = []
-            for _, row in df.iterrows():
-                well_name = str(row.get('UNIT_NAME', '')).strip()
-                gas_id = str(row.get('GASIDREC', '')).strip()
-                pres_id = str(row.get('PRESSURESIDREC', '')).strip()
-
-                if not well_name or not gas_id or not pres_id:
-                    continue
-
-                norm_name = normalize_well_name(well_name)
-
-                if (norm_name in existing_names or
-                    gas_id in existing_gas or
-                    pres_id in existing_pres):
-                    continue
-
-                new_wells.append({
-                    'well_name': well_name,
-                    'gas_idrec': gas_id,
-                    'pressures_idrec': pres_id
-                })
-
-            if not new_wells:
-                QMessageBox.information(self, "No New Wells", "No new wells to import.")
-                self.status_label.setText("Import complete - no new wells")
-                return
-
-            self.show_import_preview(new_wells)
-
-        except Exception as e:
-            QMessageBox.critical(self, "Import Failed", f"Error importing wells:\n{str(e)}")
-            self.status_label.setText("Import failed")
+            self._existing_ids = (existing_names, existing_gas, existing_pres)
+        return self._existing_ids
 
     def do_import_wells(self, dialog, new_wells, confirm_cb):
         """Actually import the wells"""
@@ -1241,28 +1744,45 @@ class WellMasterDialog(QDialog):
         QApplication.processEvents()
 
         try:
-            from db_connection import get_sql_conn
+            from db_connection import get_sql_conn, release_sql_conn
             conn = get_sql_conn()
             cursor = conn.cursor()
 
+            insert_sql = """
+                INSERT INTO PCE_WM (
+                    [Well Name],
+                    [GasIDREC],
+                    [PressuresIDREC]
+                ) VALUES (?, ?, ?)
+            """
+            rows = [
+                (well['well_name'], well['gas_idrec'], well['pressures_idrec'])
+                for well in new_wells
+            ]
+
             inserted = 0
             errors = []
 
-            for well in new_wells:
-                try:
-                    cursor.execute("""
-                        INSERT INTO PCE_WM (
-                            [Well Name],
-                            [GasIDREC],
-                            [PressuresIDREC]
-                        ) VALUES (?, ?, ?)
-                    """, well['well_name'], well['gas_idrec'], well['pressures_idrec'])
-                    inserted += 1
-                except Exception as e:
-                    errors.append(f"{well['well_name']}: {str(e)}")
+            try:
+                # Send all rows in one batch
+                cursor.fast_executemany = True
+                cursor.executemany(insert_sql, rows)
+                inserted = len(rows)
+            except Exception:
+                # Some row failed; redo them one at a time so each failing
+                # well is reported and the rest still go in
+                conn.rollback()
+                cursor.fast_executemany = False
+                for row in rows:
+                    try:
+                        cursor.execute(insert_sql, row)
+                        inserted += 1
+                    except Exception as e:
+                        errors.append(f"{row[0]}: {str(e)}")
 
             conn.commit()
-            conn.close()
+            release_sql_conn(conn)
+            WellMasterDB.invalidate_cache()
 
             if errors:
                 error_msg = "\n".join(errors[:5])
@@ -1280,8 +1800,7 @@ class WellMasterDialog(QDialog):
                     f"Successfully added {inserted} new wells to PCE_WM."
                 )
 
-            self.load_data()
-            self.status_label.setText(f"Imported {inserted} new wells")
+            self.load_data(f"Imported {inserted} new wells")
 
         except Exception as e:
             QMessageBox.critical(self, "Import Failed", f"Error inserting wells:\n{str(e)}")
@@ -1365,95 +1884,128 @@ class WellMasterDialog(QDialog):
         preview_dialog.exec_()
 
     def update_staged_table(self):
-        """Show staged wells with proper column alignment and checkboxes"""
+        """Show staged wells with proper column alignment and checkboxes
+
+        Rows already on screen are kept (with whatever the user typed into
+        them); only rows for newly staged wells are added and rows for
+        unstaged wells removed.
+        """
+        # Fill without a repaint, an itemChanged dispatch or a re-sort per
+        # setItem; restored even if the fill raises
+        table = self.staged_table
+        was_sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            self._sync_staged_rows()
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(was_sorting)
+
+        self.staged_info.setText(f"{len(self.staged_wells)} well(s) staged for completion")
+
+    def _sync_staged_rows(self):
+        """Bring the staged table's rows in line with staged_wells"""
+        dropdown_fields = [
+            (4, 'formation', self.dropdown_options.get('Formation Producer', [])),
+            (5, 'layer', self.dropdown_options.get('Layer Producer', [])),
+            (6, 'fault_block', self.dropdown_options.get('Fault Block', [])),
+            (8, 'completions_tech', self.dropdown_options.get('Completions Technology', [])),
+            (15, 'orient', self.dropdown_options.get('Orient', [])),
+        ]
+
+        # One delegate per dropdown column, replaced only when a load has
+        # brought new options
+        if self._staged_options is not self.dropdown_options:
+            self._staged_options = self.dropdown_options
+            for col in range(1, self.staged_table.columnCount()):
+                old_delegate = self.staged_table.itemDelegateForColumn(col)
+                self.staged_table.setItemDelegateForColumn(col, None)
+                if old_delegate is not None:
+                    old_delegate.deleteLater()
+
+            for col, field, options in dropdown_fields:
+                if options:
+                    delegate = ComboBoxDelegate(self.staged_table, options)
+                    self.staged_table.setItemDelegateForColumn(col, delegate)
+
+        # Drop rows of wells no longer staged, bottom-up so row numbers hold
+        staged_ids = {id(well) for well in self.staged_wells}
+        for row in range(len(self.row_widgets) - 1, -1, -1):
+            if id(self.row_widgets[row]['well']) not in staged_ids:
+                self.staged_table.removeRow(row)
+                del self.row_widgets[row]
+
+        # The remaining rows must be the leading staged wells, in order;
+        # anything else is rebuilt from scratch
+        kept = len(self.row_widgets)
+        if any(widgets['well'] is not well
+               for widgets, well in zip(self.row_widgets, self.staged_wells[:kept])):
+            self.staged_table.setRowCount(0)
+            self.row_widgets = []
+
+        first_new = len(self.row_widgets)
         self.staged_table.setRowCount(len(self.staged_wells))
-        self.row_widgets = []
-
-        for col in range(self.staged_table.columnCount()):
-            self.staged_table.setItemDelegateForColumn(col, None)
-
-        for row, well in enumerate(self.staged_wells):
-            row_widgets = {'checkbox': None, 'entries': {}, 'dropdowns': {}}
-
-            chk = QCheckBox()
-            chk.setChecked(True)
-            chk_widget = QWidget()
-            chk_layout = QHBoxLayout(chk_widget)
-            chk_layout.addWidget(chk)
-            chk_layout.setAlignment(Qt.AlignCenter)
-            chk_layout.setContentsMargins(0, 0, 0, 0)
-            self.staged_table.setCellWidget(row, 0, chk_widget)
+
+        for row in range(first_new, len(self.staged_wells)):
+            well = self.staged_wells[row]
+            row_widgets = {'well': well, 'checkbox': None, 'entries': {}, 'dropdowns': {}}
+
+            # A checkable item drawn by the column's CheckBoxDelegate, not a
+            # checkbox widget (plus container and layout) per row
+            chk = QTableWidgetItem()
+            chk.setFlags(_CHECKABLE_FLAGS)
+            chk.setCheckState(Qt.Checked)
+            self.staged_table.setItem(row, 0, chk)
             row_widgets['checkbox'] = chk
 
             item = QTableWidgetItem(well.get('well_name', ''))
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            item.setBackground(QColor("#f0f0f0"))
+            item.setFlags(_READONLY_FLAGS)
+            item.setBackground(_LOCKED_BRUSH)
             self.staged_table.setItem(row, 1, item)
 
             item = QTableWidgetItem(well.get('gas_idrec', ''))
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            item.setBackground(QColor("#f0f0f0"))
+            item.setFlags(_READONLY_FLAGS)
+            item.setBackground(_LOCKED_BRUSH)
             self.staged_table.setItem(row, 2, item)
 
             item = QTableWidgetItem(well.get('pressures_idrec', ''))
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            item.setBackground(QColor("#f0f0f0"))
+            item.setFlags(_READONLY_FLAGS)
+            item.setBackground(_LOCKED_BRUSH)
             self.staged_table.setItem(row, 3, item)
 
-            text_fields = [
-                (7, 'pad_name'),
-                (9, 'lateral_length'),
-                (10, 'horizontal_right'),
-                (11, 'horizontal_left'),
-                (12, 'vertical_above'),
-                (13, 'vertical_below'),
-                (14, 'value_nav_uwi'),
-                (17, 'exception'),
-            ]
-
-            for col, field in text_fields:
+            for col, field in _STAGED_TEXT_FIELDS:
                 item = QTableWidgetItem("")
-                item.setFlags(item.flags() | Qt.ItemIsEditable)
                 self.staged_table.setItem(row, col, item)
                 row_widgets['entries'][field] = item
 
-            dropdown_fields = [
-                (4, 'formation', self.dropdown_options.get('Formation Producer', [])),
-                (5, 'layer', self.dropdown_options.get('Layer Producer', [])),
-                (6, 'fault_block', self.dropdown_options.get('Fault Block', [])),
-                (8, 'completions_tech', self.dropdown_options.get('Completions Technology', [])),
-                (15, 'orient', self.dropdown_options.get('Orient', [])),
-            ]
-
-            for col, field, options in dropdown_fields:
-                if options:
-                    delegate = ComboBoxDelegate(self.staged_table, options)
-                    self.staged_table.setItemDelegateForColumn(col, delegate)
-
+            for col, field, _options in dropdown_fields:
                 item = QTableWidgetItem("")
-                item.setFlags(item.flags() | Qt.ItemIsEditable)
                 self.staged_table.setItem(row, col, item)
                 row_widgets['dropdowns'][field] = item
 
             comp_item = QTableWidgetItem("")
-            comp_item.setFlags(comp_item.flags() & ~Qt.ItemIsEditable)
-            comp_item.setBackground(QColor("#f0f0f0"))
+            comp_item.setFlags(_READONLY_FLAGS)
+            comp_item.setBackground(_LOCKED_BRUSH)
             self.staged_table.setItem(row, 16, comp_item)
             row_widgets['composite'] = comp_item
 
             self.row_widgets.append(row_widgets)
 
-        self.staged_info.setText(f"{len(self.staged_wells)} well(s) staged for completion")
-
     def update_staged(self):
         """Update selected staged wells in database"""
+        if self._staged_save_worker.isRunning():
+            return
+
         if not hasattr(self, 'row_widgets') or not self.row_widgets:
             QMessageBox.warning(self, "No Data", "No wells staged for update.")
             return
 
         selected_rows = []
         for row, widgets in enumerate(self.row_widgets):
-            if widgets['checkbox'] and widgets['checkbox'].isChecked():
+            if widgets['checkbox'] and widgets['checkbox'].checkState() == Qt.Checked:
                 selected_rows.append(row)
 
         if not selected_rows:
@@ -1474,20 +2026,21 @@ class WellMasterDialog(QDialog):
         for row in selected_rows:
             well = self.staged_wells[row]
 
-            formation = self.staged_table.item(row, 4).text() if self.staged_table.item(row, 4) else ""
-            layer = self.staged_table.item(row, 5).text() if self.staged_table.item(row, 5) else ""
-            fault_block = self.staged_table.item(row, 6).text() if self.staged_table.item(row, 6) else ""
-            pad_name = self.staged_table.item(row, 7).text() if self.staged_table.item(row, 7) else ""
-            completions_tech = self.staged_table.item(row, 8).text() if self.staged_table.item(row, 8) else ""
-            lateral_length = self.staged_table.item(row, 9).text() if self.staged_table.item(row, 9) else ""
-            horiz_right = self.staged_table.item(row, 10).text() if self.staged_table.item(row, 10) else ""
-            horiz_left = self.staged_table.item(row, 11).text() if self.staged_table.item(row, 11) else ""
-            vert_above = self.staged_table.item(row, 12).text() if self.staged_table.item(row, 12) else ""
-            vert_below = self.staged_table.item(row, 13).text() if self.staged_table.item(row, 13) else ""
-            value_nav_uwi = self.staged_table.item(row, 14).text() if self.staged_table.item(row, 14) else ""
-            orient = self.staged_table.item(row, 15).text() if self.staged_table.item(row, 15) else ""
-            composite_name = self.staged_table.item(row, 16).text() if self.staged_table.item(row, 16) else ""
-            exception_val = self.staged_table.item(row, 17).text() if self.staged_table.item(row, 17) else ""
+            texts = self._staged_row_texts(row)
+            formation = texts[4]
+            layer = texts[5]
+            fault_block = texts[6]
+            pad_name = texts[7]
+            completions_tech = texts[8]
+            lateral_length = texts[9]
+            horiz_right = texts[10]
+            horiz_left = texts[11]
+            vert_above = texts[12]
+            vert_below = texts[13]
+            value_nav_uwi = texts[14]
+            orient = texts[15]
+            composite_name = texts[16]
+            exception_val = texts[17]
 
             formation = formation if formation.strip() else None
             layer = layer if layer.strip() else None
@@ -1553,18 +2106,23 @@ class WellMasterDialog(QDialog):
             updates.append(update_data)
 
         self.status_label.setText(f"Saving {len(updates)} well(s)...")
-        QApplication.processEvents()
+        self.update_btn.setEnabled(False)
+        self._saving_staged = [self.staged_wells[row] for row in selected_rows]
+        self._staged_save_worker.updates = updates
+        self._staged_save_worker.start()
 
-        updated, errors = WellMasterDB.save_well_updates(updates)
+    def _on_staged_saved(self, updated, errors, error_total):
+        """Report the result of a background save from update_staged"""
+        self.update_btn.setEnabled(True)
 
-        if errors:
+        if error_total:
             error_msg = "\n".join(errors[:5])
-            if len(errors) > 5:
-                error_msg += f"\n... and {len(errors) - 5} more errors"
+            if error_total > 5:
+                error_msg += f"\n... and {error_total - 5} more errors"
             QMessageBox.warning(
                 self,
                 "Update Completed with Errors",
-                f"Updated: {updated}\nFailed: {len(errors)}\n\nErrors:\n{error_msg}"
+                f"Updated: {updated}\nFailed: {error_total}\n\nErrors:\n{error_msg}"
             )
         else:
             QMessageBox.information(
@@ -1573,10 +2131,12 @@ class WellMasterDialog(QDialog):
                 f"Successfully updated {updated} well(s)."
             )
 
-        self.staged_wells = [w for i, w in enumerate(self.staged_wells) if i not in selected_rows]
+        # Match by identity: rows may have been removed while the save ran
+        saved = {id(well) for well in self._saving_staged}
+        self._saving_staged = []
+        self.staged_wells = [w for w in self.staged_wells if id(w) not in saved]
         self.update_staged_table()
-        self.load_data()
-        self.status_label.setText(f"Updated {updated} well(s)")
+        self.load_data(f"Updated {updated} well(s)")
 
     def remove_from_staging(self):
         """Remove selected wells from staging"""
@@ -1584,19 +2144,21 @@ class WellMasterDialog(QDialog):
             QMessageBox.warning(self, "No Data", "No wells staged for removal.")
             return
 
-        selected_rows = []
-        for row, widgets in enumerate(self.row_widgets):
-            if widgets['checkbox'] and widgets['checkbox'].isChecked():
-                selected_rows.append(row)
+        # Keep every well whose checkbox isn't ticked
+        keep_mask = [
+            not (widgets['checkbox'] and widgets['checkbox'].checkState() == Qt.Checked)
+            for widgets in self.row_widgets
+        ]
+        removed = keep_mask.count(False)
 
-        if not selected_rows:
+        if not removed:
             QMessageBox.warning(self, "No Selection", "Please select wells to remove from staging.")
             return
 
         reply = QMessageBox.question(
             self,
             "Confirm Removal",
-            f"Remove {len(selected_rows)} well(s) from staging?\n\n"
+            f"Remove {removed} well(s) from staging?\n\n"
             "They will return to the Current Wells tab as pending wells.",
             QMessageBox.Yes | QMessageBox.No
         )
@@ -1604,7 +2166,50 @@ class WellMasterDialog(QDialog):
         if reply != QMessageBox.Yes:
             return
 
-        self.staged_wells = [w for i, w in enumerate(self.staged_wells) if i not in selected_rows]
+        self.staged_wells = list(compress(self.staged_wells, keep_mask))
         self.update_staged_table()
-        self.status_label.setText(f"Removed {len(selected_rows)} well(s) from staging")
-        self.tabs.setCurrentIndex(0)
\ No newline at end of file
+        self.status_label.setText(f"Removed {removed} well(s) from staging")
+        self.tabs.setCurrentIndex(0)
+
+
+class WellLoadWorker(QThread):
+    """Worker thread that reads wells and dropdown options from PCE_WM"""
+    finished_signal = pyqtSignal(object, dict)
+
+    def run(self):
+        """Run the load"""
+        wells, dropdown_options = WellMasterDB.load_wells_and_options()
+        self.finished_signal.emit(wells, dropdown_options)
+
+
+class WellSaveWorker(QThread):
+    """Worker thread that writes well updates to PCE_WM"""
+    finished_signal = pyqtSignal(int, list, int)
+
+    def __init__(self):
+        super().__init__()
+        self.updates = []
+
+    def run(self):
+        """Run the save"""
+        updated, errors, error_total = WellMasterDB.save_well_updates(self.updates)
+        self.finished_signal.emit(updated, errors, error_total)
+
+
+class WellImportWorker(QThread):
+    """Worker thread that queries Snowflake for wells missing from PCE_WM"""
+    finished_signal = pyqtSignal(object, str)
+
+    def __init__(self):
+        super().__init__()
+        # (normalized names, GasIDRECs, PressuresIDRECs) already in PCE_WM
+        self.existing_ids = (set(), set(), set())
+
+    def run(self):
+        """Run the query; emits (new wells or None, error message)"""
+        try:
+            new_wells = WellMasterDB.find_new_wells(*self.existing_ids)
+        except Exception as e:
+            self.finished_signal.emit(None, str(e))
+            return
+        self.finished_signal.emit(new_wells, "")